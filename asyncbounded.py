@@ -0,0 +1,289 @@
+# asyncbounded.py by nonetypes
+# Last revised on 10/18/2026
+
+import asyncio
+import collections
+
+from errors import Empty, Full
+from queue import Queue
+from stack import Stack
+
+
+class _AsyncBounded:
+    """Waiting shared by AsyncQueue and AsyncStack, mixed in ahead of Queue
+    or Stack.
+
+    get() takes the item that the container's own pop() would, the first
+    for a queue and the last for a stack. _noun names the container in
+    error messages.
+    """
+    _noun = 'container'
+
+    def __init__(self, *items, maxsize=0):
+        if 0 < maxsize < len(items):
+            raise Full('more items than maxsize')
+        self.maxsize = maxsize
+        # Futures of coroutines waiting for an item or for room.
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        self._unfinished_tasks = len(items)
+        self._finished = asyncio.Event()
+        if not items:
+            self._finished.set()
+        super().__init__(*items)
+
+    def _kwargs(self):
+        return {'maxsize': self.maxsize}
+
+    def _check_room(self, size):
+        """Raise Full if size items would not fit.
+        """
+        if 0 < self.maxsize < size:
+            raise Full('more items than maxsize')
+
+    def _added(self, count):
+        """Count newly added items as unfinished tasks and wake a getter
+        for each.
+        """
+        if count > 0:
+            self._unfinished_tasks += count
+            self._finished.clear()
+        for _ in range(count):
+            self._wakeup_next(self._getters)
+
+    def _removed(self, count):
+        """Wake a putter for each of count removed items.
+        """
+        for _ in range(count):
+            self._wakeup_next(self._putters)
+
+    def _resized(self, size):
+        """Account for a change from size items to len(self).
+        """
+        grown = len(self) - size
+        if grown > 0:
+            self._added(grown)
+        else:
+            self._removed(-grown)
+
+    def _replace(self, replace, items):
+        """Call replace(items), if items fit.
+        """
+        items = list(items)
+        self._check_room(len(items))
+        size = len(self)
+        replace(items)
+        self._resized(size)
+
+    def __setitem__(self, index, new_item):
+        if not isinstance(index, slice):
+            super().__setitem__(index, new_item)
+            return
+        new_item = list(new_item)
+        size = len(self)
+        if index.step in (None, 1):
+            removed = len(range(*index.indices(size)))
+            self._check_room(size - removed + len(new_item))
+        super().__setitem__(index, new_item)
+        self._resized(size)
+
+    def __delitem__(self, index):
+        size = len(self)
+        super().__delitem__(index)
+        self._removed(size - len(self))
+
+    def _is_full(self):
+        return 0 < self.maxsize <= len(self)
+
+    def full(self):
+        """Return True if the container is at capacity. False otherwise.
+        """
+        return self._is_full()
+
+    def empty(self):
+        """Return True if the container holds no items. False otherwise.
+        """
+        return len(self) == 0
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """Wake the first waiter which has not been cancelled.
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, ready):
+        """Wait on a new future in waiters until ready() returns True.
+
+        If the wait is cancelled and the wakeup it was given goes unused,
+        it is passed on to the next waiter.
+        """
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    # The waiter had already been woken.
+                    pass
+                if ready() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    async def put(self, item):
+        """Add an item, waiting for room if full.
+        """
+        await self._wait(self._putters, lambda: not self._is_full())
+        self.put_nowait(item)
+
+    def put_nowait(self, item):
+        """Add an item without waiting, raising Full if there is no room.
+        """
+        if self._is_full():
+            raise Full(f'put to full {self._noun}')
+        super().append(item)
+        self._added(1)
+
+    async def get(self):
+        """Remove the next item and return it, waiting for one if the
+        container is empty.
+        """
+        await self._wait(self._getters, lambda: len(self) > 0)
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """Remove and return the next item without waiting, raising Empty if
+        there is none.
+        """
+        if len(self) == 0:
+            raise Empty(f'get from empty {self._noun}')
+        popped_item = super().pop()
+        self._removed(1)
+        return popped_item
+
+    async def get_many(self, n, timeout=None):
+        """Wait for at least one item, then remove and return up to n items
+        as pop_many() does.
+
+        Returns an empty list if timeout seconds pass with the container
+        empty.
+        """
+        if len(self) == 0:
+            try:
+                await asyncio.wait_for(
+                    self._wait(self._getters, lambda: len(self) > 0), timeout)
+            except asyncio.TimeoutError:
+                return []
+        return self.pop_many(n)
+
+    def task_done(self):
+        """Mark one previously put item as processed, for join().
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError('task_done() called too many times')
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every item put has been marked with task_done().
+        """
+        await self._finished.wait()
+
+    def append(self, item):
+        """Add an item, raising Full if there is no room.
+        """
+        self.put_nowait(item)
+
+    def extend(self, items):
+        """Add every item from an iterable.
+
+        Raises Full, adding nothing, if they would not all fit.
+        """
+        items = list(items)
+        self._check_room(len(self) + len(items))
+        super().extend(items)
+        self._added(len(items))
+
+    def pop(self, index=None):
+        """Remove an item at given index and return it, or the next item if
+        index is omitted.
+        """
+        popped_item = super().pop(index)
+        self._removed(1)
+        return popped_item
+
+    def pop_many(self, n):
+        """Remove up to n items and return them as pop_many() does on the
+        container.
+        """
+        popped_items = super().pop_many(n)
+        self._removed(len(popped_items))
+        return popped_items
+
+    def remove(self, item):
+        """Remove the given item.
+        """
+        super().remove(item)
+        self._removed(1)
+
+
+class AsyncQueue(_AsyncBounded, Queue):
+    """Queue for asyncio coroutines with an optional capacity.
+
+    put() and get() are coroutines which wait, without blocking the event
+    loop, until there is room or an item to take. A maxsize of 0 or less
+    means the queue is never full. join() waits until task_done() has been
+    called once for every item put.
+
+    Not thread-safe; use it from a single event loop.
+    append() never waits; it raises Full when the queue is at capacity, as
+    do slice assignment and assigning to items when the result would not
+    fit. Items they add count as put.
+    """
+    _noun = 'queue'
+
+    @Queue.items.setter
+    def items(self, items):
+        self._replace(super()._load, items)
+
+
+class AsyncStack(_AsyncBounded, Stack):
+    """Stack for asyncio coroutines with an optional capacity.
+
+    put() and get() are coroutines which wait, without blocking the event
+    loop, until there is room or an item to take. A maxsize of 0 or less
+    means the stack is never full. join() waits until task_done() has been
+    called once for every item put.
+
+    Not thread-safe; use it from a single event loop.
+    append() never waits; it raises Full when the stack is at capacity, as
+    do slice assignment and assigning to items when the result would not
+    fit. Items they add count as put. Changes made to the items list in
+    place bypass the capacity.
+    """
+    _noun = 'stack'
+
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        if not hasattr(self, '_items'):
+            # Stack.__init__ setting the first items, already checked.
+            self._items = items
+        else:
+            self._replace(self._set_items, items)
+
+    def _set_items(self, items):
+        self._items = items
+        if self._members is not None:
+            self.enable_member_index()
@@ -0,0 +1,7 @@
+# benchmarks by nonetypes
+# Last revised on 10/18/2026
+#
+# Benchmarks for the data structures in this repository.
+# Run each one from the repository root, e.g.:
+#
+#     python -m benchmarks.memory
@@ -0,0 +1,86 @@
+# batch.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Compare the batched pop_many() calls with popping one item at a time.
+
+    python -m benchmarks.batch [size]
+
+For each container, times emptying one of size items (1000 by default)
+with a loop of single pops and with the batched call, and prints both in
+microseconds and the speedup. The best of several runs is kept.
+
+Measured at n=1000 on CPython 3.11, the speedups vary from run to run and
+from machine to machine:
+
+    Stack, Queue pop                  30-40x
+    LinkedList pop_right              over 100x
+    DoublyLinkedList pop_right        13-16x
+    DoublyLinkedList pop_left         10-13x
+    LinkedList pop_left               4-7x
+"""
+import sys
+import time
+
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList
+from queue import Queue
+from stack import Stack
+
+REPEATS = 20
+
+
+def one_at_a_time(pop):
+    def drain(container, size):
+        for _ in range(size):
+            pop(container)
+    return drain
+
+
+def batched(pop_many):
+    def drain(container, size):
+        pop_many(container, size)
+    return drain
+
+
+CASES = [
+    ('Stack pop', Stack, one_at_a_time(Stack.pop), batched(Stack.pop_many)),
+    ('Queue pop', Queue, one_at_a_time(Queue.pop), batched(Queue.pop_many)),
+    ('LinkedList pop_left', LinkedList, one_at_a_time(LinkedList.pop_left),
+     batched(LinkedList.pop_left_many)),
+    ('LinkedList pop_right', LinkedList, one_at_a_time(LinkedList.pop_right),
+     batched(LinkedList.pop_right_many)),
+    ('DoublyLinkedList pop_left', DoublyLinkedList,
+     one_at_a_time(DoublyLinkedList.pop_left),
+     batched(DoublyLinkedList.pop_left_many)),
+    ('DoublyLinkedList pop_right', DoublyLinkedList,
+     one_at_a_time(DoublyLinkedList.pop_right),
+     batched(DoublyLinkedList.pop_right_many)),
+]
+
+
+def best_time(container_class, drain, size):
+    """Return the fewest seconds taken to empty a container of size items.
+    """
+    items = list(range(size))
+    best = float('inf')
+    for _ in range(REPEATS):
+        container = container_class(*items)
+        start = time.perf_counter()
+        drain(container, size)
+        best = min(best, time.perf_counter() - start)
+        assert len(container) == 0
+    return best
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    print(f'{"n=" + str(size):<28}{"single us":>12}{"batched us":>12}{"speedup":>10}')
+    for name, container_class, single, many in CASES:
+        single_seconds = best_time(container_class, single, size)
+        many_seconds = best_time(container_class, many, size)
+        print(f'{name:<28}{single_seconds * 1e6:>12.1f}{many_seconds * 1e6:>12.1f}'
+              f'{single_seconds / many_seconds:>9.1f}x')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# churn.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Measure a DoublyLinkedList used as a queue, with and without a NodePool.
+
+    python -m benchmarks.churn [operations]
+
+Keeps a window of items in the list, appending one to the right and popping
+one from the left per operation, and reports for each configuration:
+
+    k ops/s         thousands of append/pop pairs per second
+    gen0 GCs        generation 0 collections run during the loop
+    pool hits %     share of new nodes taken from the pool
+
+The configurations are a plain list, one clearing popped nodes' links, and
+pooled lists with a small and a large pool.
+"""
+import gc
+import sys
+import time
+
+from doublylinkedlist import DoublyLinkedList, NodePool
+
+WINDOW = 1_000
+
+
+def configure(name):
+    linked = DoublyLinkedList()
+    if name == 'clear links':
+        linked.clear_popped_links = True
+    elif name == 'pool of 16':
+        linked.enable_node_pool(NodePool(16))
+    elif name == 'pool of 4096':
+        linked.enable_node_pool(NodePool(4096))
+    return linked
+
+
+def measure(name, operations):
+    """Return (ops per second in thousands, gen0 collections, hit rate).
+    """
+    linked = configure(name)
+    for item in range(WINDOW):
+        linked.append_right(item)
+    collections = gc.get_stats()[0]['collections']
+    start = time.perf_counter()
+    for item in range(operations):
+        linked.append_right(item)
+        linked.pop_left()
+    seconds = time.perf_counter() - start
+    collections = gc.get_stats()[0]['collections'] - collections
+    pool = linked.node_pool
+    hit_rate = 0.0
+    if pool is not None and pool.hits + pool.misses:
+        hit_rate = pool.hits / (pool.hits + pool.misses) * 100
+    return operations / seconds / 1e3, collections, hit_rate
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f'{"configuration":<16}{"k ops/s":>10}{"gen0 GCs":>10}{"pool hits %":>13}')
+    for name in ('plain', 'clear links', 'pool of 16', 'pool of 4096'):
+        rate, collections, hit_rate = measure(name, operations)
+        print(f'{name:<16}{rate:>10.1f}{collections:>10}{hit_rate:>13.1f}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# concat.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Compare bulk extend/concatenation with item by item appends.
+
+    python -m benchmarks.concat
+
+For each container and size n, reports microseconds for:
+
+    append loop   n calls to append(), the old way of concatenating
+    extend        extend() with n items
+    += chunk      += of a 10 item list onto a container already holding n
+    splice        splice() of an n item list (linked lists only)
+
+append loop and extend grow linearly with n; += chunk and splice should not
+grow with n at all.
+"""
+import timeit
+
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList
+from queue import Queue
+from stack import Stack
+
+SIZES = (1_000, 10_000, 100_000)
+CHUNK = list(range(10))
+
+
+def best_of(setup, operation, repeat=5):
+    """Return the fastest of several timed calls of operation(setup()), in us.
+    """
+    times = []
+    for _ in range(repeat):
+        argument = setup()
+        times.append(timeit.timeit(lambda: operation(argument), number=1))
+    return min(times) * 1e6
+
+
+def append_loop(container_and_items):
+    container, items = container_and_items
+    for item in items:
+        container.append(item)
+
+
+def measure(cls, size):
+    items = list(range(size))
+    row = {
+        'append loop': best_of(lambda: (cls(), items), append_loop),
+        'extend': best_of(lambda: (cls(), items),
+                          lambda pair: pair[0].extend(pair[1])),
+        '+= chunk': best_of(lambda: cls(*items), lambda container: container.__iadd__(CHUNK)),
+    }
+    if hasattr(cls, 'splice'):
+        row['splice'] = best_of(lambda: (cls(), cls(*items)),
+                                lambda pair: pair[0].splice(pair[1]))
+    return row
+
+
+def main():
+    columns = ('append loop', 'extend', '+= chunk', 'splice')
+    print(f'{"container":<18}{"n":>9}' + ''.join(f'{c:>14}' for c in columns))
+    for cls in (LinkedList, DoublyLinkedList, Queue, Stack):
+        for size in SIZES:
+            row = measure(cls, size)
+            cells = ''.join(f'{row[c]:>14.1f}' if c in row else f'{"-":>14}'
+                            for c in columns)
+            print(f'{cls.__name__:<18}{size:>9}{cells}')
+
+
+if __name__ == "__main__":
+    main()
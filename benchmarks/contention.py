@@ -0,0 +1,67 @@
+# contention.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Multi-producer/multi-consumer stress test for BoundedQueue and BoundedStack.
+
+    python -m benchmarks.contention [items_per_producer] [maxsize]
+
+For 1, 4 and 16 threads each of producers and consumers, reports the
+throughput in items per second and the p99 latency from put() to get().
+"""
+import sys
+import threading
+import time
+
+from bounded import BoundedQueue, BoundedStack
+
+THREAD_COUNTS = (1, 4, 16)
+
+
+def run(container, threads, items_per_producer):
+    """Return (items per second, p99 latency in seconds) for one run.
+    """
+    latencies = [[] for _ in range(threads)]
+    start_barrier = threading.Barrier(2 * threads + 1)
+
+    def produce():
+        start_barrier.wait()
+        for _ in range(items_per_producer):
+            container.put(time.perf_counter())
+
+    def consume(latency):
+        # Each consumer takes as many items as one producer makes, so no stop
+        # marker is needed (one would jump the line in a stack).
+        start_barrier.wait()
+        for _ in range(items_per_producer):
+            sent = container.get()
+            latency.append(time.perf_counter() - sent)
+
+    producers = [threading.Thread(target=produce) for _ in range(threads)]
+    consumers = [threading.Thread(target=consume, args=(latencies[i],))
+                 for i in range(threads)]
+    for thread in producers + consumers:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in producers + consumers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    merged = sorted(latency for latency_list in latencies for latency in latency_list)
+    p99 = merged[int(len(merged) * 0.99) - 1] if merged else 0.0
+    return len(merged) / elapsed, p99
+
+
+def main(items_per_producer=20_000, maxsize=1024):
+    print(f'{"container":<14}{"threads":>8}{"ops/sec":>14}{"p99 (us)":>12}')
+    for cls in (BoundedQueue, BoundedStack):
+        for threads in THREAD_COUNTS:
+            # The total work is split so each thread count moves the same
+            # number of items.
+            per_producer = max(1, items_per_producer // threads)
+            ops, p99 = run(cls(maxsize=maxsize), threads, per_producer)
+            print(f'{cls.__name__:<14}{threads:>8}{ops:>14,.0f}{p99 * 1e6:>12.1f}')
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
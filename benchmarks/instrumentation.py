@@ -0,0 +1,70 @@
+# instrumentation.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Measure the cost of instrument, and show what it finds.
+
+    python -m benchmarks.instrumentation [size]
+
+Times a mixed workload on a LinkedList and a DoublyLinkedList before
+instrument.enable(), while enabled, and after instrument.disable(), in
+k ops/s, best of three runs: the first and last should match, as disabling
+puts the original methods back. Then prints the methods which walked their lists, with the
+call sites behind them.
+"""
+import sys
+import time
+
+import instrument
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList
+
+OPERATIONS = 20_000
+
+
+def workload(size):
+    """Run the workload; return the operations made.
+    """
+    singly = LinkedList(*range(size))
+    doubly = DoublyLinkedList(*range(size))
+    for item in range(OPERATIONS):
+        singly.append_right(item)
+        singly.pop_left()
+        doubly.append_left(item)
+        doubly.pop_right()
+        if item % 1_000 == 0:
+            singly[size // 2]           # O(n): should show up as a walk
+            doubly.contains(-1)         # O(n) too
+    return 4 * OPERATIONS
+
+
+def rate(size, repeats=3):
+    """Return the best k ops/s of repeats runs.
+    """
+    best = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operations = workload(size)
+        best = max(best, operations / (time.perf_counter() - start) / 1e3)
+    return best
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    before = rate(size)
+    with instrument.instrumented():
+        during = rate(size)
+    after = rate(size)
+    print(f'{"":<10}{"k ops/s":>10}')
+    for name, value in (('before', before), ('enabled', during), ('after', after)):
+        print(f'{name:<10}{value:>10.1f}')
+
+    print()
+    print(f'{"method":<30}{"calls":>8}{"walks":>8}{"mean hops":>12}  top site')
+    for name, stats in instrument.snapshot()['methods'].items():
+        if stats['walks']:
+            print(f'{name:<30}{stats["calls"]:>8}{stats["walks"]:>8}'
+                  f'{stats["mean_hops"]:>12.1f}  {stats["sites"][0]["site"]}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# memory.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Report the memory cost per element of each linked list layout.
+
+    python -m benchmarks.memory [size]
+
+Every element holds the same payload object, so the figures are the cost of
+the structure itself, not of the items stored in it.
+"""
+import sys
+import tracemalloc
+
+from doublylinkedlist import CompactDoublyLinkedList, DoublyLinkedList
+from linkedlist import LinkedList
+
+
+class DictNode:
+    """The pre-slots node layout, with a per-instance __dict__.
+    """
+    def __init__(self, item=None):
+        self.item = item
+        self.prev_node = None
+        self.next_node = None
+
+
+def build_dict_nodes(size):
+    head = link = DictNode()
+    for _ in range(size - 1):
+        link.next_node = DictNode()
+        link.next_node.prev_node = link
+        link = link.next_node
+    return head
+
+
+def build_appended(cls):
+    def build(size):
+        linked = cls()
+        for _ in range(size):
+            linked.append_right(None)
+        return linked
+    return build
+
+
+LAYOUTS = [
+    ('python list (reference)', lambda size: [None] * size),
+    ('dict nodes (pre-slots reference)', build_dict_nodes),
+    ('LinkedList', build_appended(LinkedList)),
+    ('DoublyLinkedList', build_appended(DoublyLinkedList)),
+    ('CompactDoublyLinkedList', build_appended(CompactDoublyLinkedList)),
+    ('CompactDoublyLinkedList (preallocated)',
+     lambda size: CompactDoublyLinkedList(*[None] * size, capacity=size)),
+]
+
+
+def bytes_per_element(build, size):
+    """Return the bytes held by the structure build(size) returns, per element.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build(size)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return (after - before) / size
+
+
+def main(size=100_000):
+    print(f'{"layout":<42}{"bytes/element":>14}')
+    for name, build in LAYOUTS:
+        print(f'{name:<42}{bytes_per_element(build, size):>14.1f}')
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
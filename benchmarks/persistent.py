@@ -0,0 +1,70 @@
+# persistent.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Measure PersistentQueue throughput for a range of item sizes and fsync
+policies.
+
+    python -m benchmarks.persistent [count] [directory]
+
+Appends count bytes items of each size to a fresh queue, then pops them
+all, reporting thousands of items per second for each. The policies are:
+
+    every item      sync_every=1, every change durable before it returns
+    every 100       sync_every=100
+    every 1000      sync_every=1000, the default
+    on close        sync_every=None, flushed only by close()
+
+The queue lives in a temporary directory unless one is given. Use a
+directory on the disk of interest: on tmpfs every policy costs the same.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from persistentqueue import PersistentQueue
+
+ITEM_SIZES = (16, 256, 4096)
+POLICIES = (('every item', 1), ('every 100', 100),
+            ('every 1000', 1000), ('on close', None))
+
+
+def measure(directory, item_size, sync_every, count):
+    """Return (appends, pops) per second, in thousands.
+    """
+    path = os.path.join(directory, f'bench-{item_size}-{sync_every}')
+    item = os.urandom(item_size)
+    # Syncing every item is slow, so it gets fewer items to keep runs short.
+    if sync_every == 1:
+        count = max(count // 20, 1)
+    try:
+        queue = PersistentQueue(path, sync_every=sync_every)
+        start = time.perf_counter()
+        for _ in range(count):
+            queue.append(item)
+        queue.flush()
+        appending = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(count):
+            queue.pop()
+        queue.close()
+        popping = time.perf_counter() - start
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+    return count / appending / 1e3, count / popping / 1e3
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    directory = sys.argv[2] if len(sys.argv) > 2 else None
+    with tempfile.TemporaryDirectory(dir=directory) as temporary:
+        print(f'{"item bytes":>10}{"fsync":>12}{"k appends/s":>14}{"k pops/s":>12}')
+        for item_size in ITEM_SIZES:
+            for name, sync_every in POLICIES:
+                appends, pops = measure(temporary, item_size, sync_every, count)
+                print(f'{item_size:>10}{name:>12}{appends:>14.1f}{pops:>12.1f}')
+
+
+if __name__ == "__main__":
+    main()
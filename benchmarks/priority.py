@@ -0,0 +1,112 @@
+# priority.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Compare binary and 4-ary (and 8-ary) heaps in PriorityQueue.
+
+    python -m benchmarks.priority [size]
+
+With size items (100000 by default) of random priority, times in k ops/s:
+
+    append      adding the items one at a time
+    extend      adding them all at once (heapified)
+    update      decrease-key: update_priority() of a random item to a lower
+                priority
+    remove      remove() of a random item
+    tick        a scheduler tick: pop, update one item, append one item
+    pop         popping every item
+
+heapq, with no decrease-key or remove, is shown for append and pop.
+"""
+import heapq
+import random
+import sys
+import time
+
+from queue import PriorityQueue
+
+ARITIES = (2, 4, 8)
+
+
+def rate(operations, seconds):
+    return operations / seconds / 1e3
+
+
+def measure(arity, size, seed=1):
+    """Return {workload: k ops/s} for a heap of the given arity.
+    """
+    rng = random.Random(seed)
+    priorities = [rng.random() for _ in range(size)]
+    results = {}
+
+    queue = PriorityQueue(arity=arity)
+    start = time.perf_counter()
+    for item, priority in enumerate(priorities):
+        queue.append(item, priority)
+    results['append'] = rate(size, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    PriorityQueue(*priorities, arity=arity)
+    results['extend'] = rate(size, time.perf_counter() - start)
+
+    targets = [rng.randrange(size) for _ in range(size)]
+    start = time.perf_counter()
+    for item in targets:
+        queue.update_priority(item, queue.priority(item) - 0.5)
+    results['update'] = rate(size, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for item in rng.sample(range(size), size // 2):
+        queue.remove(item)
+    results['remove'] = rate(size // 2, time.perf_counter() - start)
+    for item in range(size):
+        if item not in queue:
+            queue.append(item, rng.random())
+
+    added = size
+    start = time.perf_counter()
+    for item in targets:
+        queue.pop()
+        if item in queue:
+            queue.update_priority(item, rng.random())
+        queue.append(added, rng.random())
+        added += 1
+    results['tick'] = rate(size, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    while queue:
+        queue.pop()
+    results['pop'] = rate(size, time.perf_counter() - start)
+    return results
+
+
+def measure_heapq(size, seed=1):
+    rng = random.Random(seed)
+    priorities = [rng.random() for _ in range(size)]
+    heap = []
+    start = time.perf_counter()
+    for item, priority in enumerate(priorities):
+        heapq.heappush(heap, (priority, item))
+    append = rate(size, time.perf_counter() - start)
+    start = time.perf_counter()
+    while heap:
+        heapq.heappop(heap)
+    return {'append': append, 'pop': rate(size, time.perf_counter() - start)}
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    workloads = ('append', 'extend', 'update', 'remove', 'tick', 'pop')
+    print(f'n={size}, k ops/s')
+    print(f'{"heap":<10}' + ''.join(f'{name:>10}' for name in workloads))
+    for arity in ARITIES:
+        results = measure(arity, size)
+        print(f'{str(arity) + "-ary":<10}'
+              + ''.join(f'{results[name]:>10.0f}' for name in workloads))
+    results = measure_heapq(size)
+    print(f'{"heapq":<10}'
+          + ''.join(f'{results[name]:>10.0f}' if name in results else f'{"-":>10}'
+                    for name in workloads))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# scaling.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Measure how ConcurrentDeque throughput scales with thread count.
+
+    python -m benchmarks.scaling [items]
+
+For 1, 2, 4 and 8 producer/consumer pairs, producers append_right() and
+consumers pop_left() a fixed total of items, and each deque reports
+thousands of items per second:
+
+    ConcurrentDeque     separate head and tail locks
+    one lock            DoublyLinkedList with one lock around every call
+    collections.deque   for reference; its appends and pops are atomic
+
+Scaling past one pair needs a free-threaded build (python3.13t); with the
+GIL every row is bound to one core and more threads mostly add switching.
+The first line says which kind of interpreter ran.
+"""
+import collections
+import sys
+import threading
+import time
+
+from doublylinkedlist import ConcurrentDeque, DoublyLinkedList
+
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+class LockedList:
+    """DoublyLinkedList with one lock serialising every append and pop.
+    """
+    def __init__(self):
+        self.linked = DoublyLinkedList()
+        self.lock = threading.Lock()
+
+    def append_right(self, item):
+        with self.lock:
+            self.linked.append_right(item)
+
+    def pop_left(self):
+        with self.lock:
+            return self.linked.pop_left()
+
+
+class BuiltinDeque:
+    def __init__(self):
+        self.deque = collections.deque()
+        self.append_right = self.deque.append
+        self.pop_left = self.deque.popleft
+
+
+def run(container, pairs, items):
+    """Return thousands of items per second moved through container.
+    """
+    per_pair = items // pairs
+    start = threading.Barrier(2 * pairs + 1)
+
+    def produce():
+        start.wait()
+        for item in range(per_pair):
+            container.append_right(item)
+
+    def consume():
+        start.wait()
+        taken = 0
+        while taken < per_pair:
+            try:
+                container.pop_left()
+            except IndexError:
+                time.sleep(0)
+                continue
+            taken += 1
+
+    threads = [threading.Thread(target=produce) for _ in range(pairs)]
+    threads += [threading.Thread(target=consume) for _ in range(pairs)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return per_pair * pairs / (time.perf_counter() - began) / 1e3
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}')
+    containers = (('ConcurrentDeque', ConcurrentDeque), ('one lock', LockedList),
+                  ('collections.deque', BuiltinDeque))
+    print(f'{"container":<20}' + ''.join(f'{f"{n} pair" + "s" * (n > 1):>12}' for n in THREAD_COUNTS))
+    for name, cls in containers:
+        cells = ''.join(f'{run(cls(), pairs, items):>12.1f}' for pairs in THREAD_COUNTS)
+        print(f'{name:<20}{cells}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# sort.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Compare in-place merge sort with sorting a python list copy.
+
+    python -m benchmarks.sort
+
+For each linked list class and size n (random integers), reports:
+
+    roundtrip ms    py_list(), sorted() and a new list built from the result,
+                    the old way of sorting
+    sort ms         sort(), relinking the existing nodes
+    roundtrip KiB   peak memory allocated by the roundtrip
+    sort KiB        peak memory allocated by sort()
+
+then the microseconds per add() to a SortedLinkedList of n items, which
+should grow with log n rather than n.
+
+The roundtrip is faster, as it sorts in C, but allocates a second set of
+nodes; sort() allocates nothing that grows with n.
+"""
+import random
+import timeit
+import tracemalloc
+
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList, SortedLinkedList
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def roundtrip(linked):
+    return type(linked)(*sorted(linked.py_list()))
+
+
+def in_place(linked):
+    linked.sort()
+    return linked
+
+
+def best_time(build, operation, repeat=3):
+    """Return the fastest of several timed calls of operation(build()), in ms.
+    """
+    times = []
+    for _ in range(repeat):
+        argument = build()
+        times.append(timeit.timeit(lambda: operation(argument), number=1))
+    return min(times) * 1e3
+
+
+def peak_memory(build, operation):
+    """Return the peak memory operation(build()) allocates, in KiB.
+    """
+    argument = build()
+    tracemalloc.start()
+    result = operation(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak / 1024
+
+
+def time_adds(size, adds=1_000):
+    """Return microseconds per add() to a SortedLinkedList of size items.
+    """
+    sorted_linked = SortedLinkedList(*(random.random() for _ in range(size)))
+    items = [random.random() for _ in range(adds)]
+    # Building the list leaves its index to be made on first use.
+    len(sorted_linked)
+    seconds = timeit.timeit(lambda: [sorted_linked.add(item) for item in items],
+                            number=1)
+    return seconds / adds * 1e6
+
+
+def main():
+    columns = ('roundtrip ms', 'sort ms', 'roundtrip KiB', 'sort KiB')
+    print(f'{"container":<18}{"n":>9}' + ''.join(f'{c:>15}' for c in columns))
+    for cls in (LinkedList, DoublyLinkedList):
+        for size in SIZES:
+            items = [random.randrange(size) for _ in range(size)]
+
+            def build():
+                return cls(*items)
+            row = (best_time(build, roundtrip), best_time(build, in_place),
+                   peak_memory(build, roundtrip), peak_memory(build, in_place))
+            cells = ''.join(f'{cell:>15.1f}' for cell in row)
+            print(f'{cls.__name__:<18}{size:>9}{cells}')
+    print()
+    print(f'{"SortedLinkedList":<18}{"n":>9}{"us per add":>15}')
+    for size in SIZES:
+        print(f'{"":<18}{size:>9}{time_adds(size):>15.2f}')
+
+
+if __name__ == "__main__":
+    main()
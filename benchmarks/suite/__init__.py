@@ -0,0 +1,25 @@
+# suite by nonetypes
+# Last revised on 10/18/2026
+
+"""Regression benchmarks for every public method of LinkedList,
+DoublyLinkedList, Queue and Stack.
+
+    python -m benchmarks.suite [options]
+
+Each operation is timed at sizes from 10 up to --max-size (10**5 by
+default, up to 10**7) and reported as ns per call, along with the net
+memory blocks each call leaves allocated and the peak memory it uses
+(tracemalloc). A complexity curve is then fitted to each operation's
+times, and any operation which grows clearly faster than it should is
+flagged: an O(1) append that has become O(n) makes a loop of appends
+O(n**2).
+
+--output writes the results as JSON, and --baseline compares them with an
+earlier --output, listing operations that got slower. The exit status is 1
+if anything was flagged or slower. Only the standard library is used.
+
+    cases       the operations measured, and how each is repeated
+    measure     timing and memory measurement
+    complexity  fitting the complexity curves
+    report      tables, JSON and baseline comparison
+"""
@@ -0,0 +1,135 @@
+# __main__.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Command line for the suite; see the package docstring.
+
+    python -m benchmarks.suite --max-size 1000000 --output now.json
+    python -m benchmarks.suite --baseline now.json --match pop
+"""
+import argparse
+import math
+import sys
+
+from benchmarks.suite import complexity, report
+from benchmarks.suite.cases import cases
+from benchmarks.suite.measure import Builds, measure
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.suite',
+        description='Benchmark every public method of LinkedList, '
+                    'DoublyLinkedList, Queue and Stack.')
+    parser.add_argument('--min-size', type=int, default=10,
+                        help='smallest size, a power of ten (default 10)')
+    parser.add_argument('--max-size', type=int, default=100_000,
+                        help='largest size, a power of ten up to 10000000 '
+                             '(default 100000)')
+    parser.add_argument('--budget', type=float, default=0.05,
+                        help='seconds of timing per case and size (default 0.05)')
+    parser.add_argument('--max-call', type=float, default=1.0,
+                        help='skip sizes at which one call is predicted to take '
+                             'longer than this many seconds (default 1)')
+    parser.add_argument('--containers', default='',
+                        help='comma separated class names to measure (default all)')
+    parser.add_argument('--match', default='',
+                        help='only measure operations whose name contains this')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the memory measurements')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='compare with results saved by --output')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='ratio to the baseline counted as slower (default 1.5)')
+    return parser.parse_args(argv)
+
+
+def predicted(points, size):
+    """Return the predicted ns per call at size from the earlier points.
+    """
+    if not points:
+        return 0.0
+    last_size, last_ns = points[-1]
+    exponent = 1.0
+    if len(points) > 1:
+        (previous_size, previous_ns) = points[-2]
+        exponent = max(exponent, math.log(last_ns / previous_ns)
+                       / math.log(last_size / previous_size))
+    return last_ns * (size / last_size) ** exponent
+
+
+def main(argv=None):
+    options = parse_args(sys.argv[1:] if argv is None else argv)
+    sizes = []
+    size = options.min_size
+    while size <= options.max_size:
+        sizes.append(size)
+        size *= 10
+    names = set(filter(None, options.containers.split(',')))
+    selected = [case for case in cases()
+                if (not names or case.container.__name__ in names)
+                and options.match in case.operation]
+    if not selected:
+        sys.exit('no cases selected')
+
+    results = []
+    points = {case.name: [] for case in selected}
+    for size in sizes:
+        builds = Builds()
+        for case in selected:
+            if predicted(points[case.name], size) > options.max_call * 1e9:
+                continue
+            measured = measure(case, size, options.budget, builds,
+                               memory=not options.no_memory)
+            points[case.name].append((size, measured.ns_per_call))
+            results.append({
+                'case': case.name,
+                'container': case.container.__name__,
+                'operation': case.operation,
+                'kind': case.kind,
+                'size': size,
+                'ns_per_call': measured.ns_per_call,
+                'blocks_per_call': measured.blocks_per_call,
+                'peak_bytes': measured.peak_bytes,
+            })
+        print(f'n={size}: {sum(1 for entry in results if entry["size"] == size)} '
+              f'cases measured', file=sys.stderr)
+
+    fitted = {}
+    for case in selected:
+        case_sizes = [point[0] for point in points[case.name]]
+        model, slope = complexity.fit(case_sizes,
+                                      [point[1] for point in points[case.name]])
+        fitted[case.name] = {
+            'case': case.name,
+            'expected': case.expected,
+            'fitted': model,
+            'slope': slope,
+            'flagged': complexity.worse(model, slope, case.expected),
+        }
+    document = {
+        'meta': report.meta(vars(options)),
+        'results': results,
+        'complexity': list(fitted.values()),
+    }
+
+    report.print_table(selected, sizes, results, fitted)
+    if not options.no_memory:
+        print()
+        report.print_memory(selected, sizes[-1], results)
+    flagged = [name for name, entry in fitted.items() if entry['flagged']]
+    print()
+    if flagged:
+        print('Growing faster than expected (marked !): ' + ', '.join(flagged))
+    else:
+        print('No operation grows faster than expected.')
+    slower = []
+    if options.baseline:
+        slower = report.compare(document, options.baseline, options.threshold)
+        report.print_slower(slower, options.threshold)
+    if options.output:
+        report.write(options.output, document)
+    sys.exit(1 if flagged or slower else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# cases.py by nonetypes
+# Last revised on 10/18/2026
+
+"""The operations the suite measures.
+
+Each Case names a container class and an operation, and says how a call is
+made and repeated. call(container, i, size) makes the i-th call on a
+container which started with size items. kind is one of:
+
+    read    calls leave the container as it was, so one container serves
+            every call at a size
+    grow    each call adds an item
+    shrink  each call removes an item; the container is built with an
+            item for every call on top of size
+    fresh   each call gets a newly built container, built untimed
+
+expected is the complexity of one call, as named in complexity.MODELS.
+"""
+import collections
+import random
+
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList
+from queue import Queue
+from stack import Stack
+
+CONTAINERS = (LinkedList, DoublyLinkedList, Queue, Stack)
+CHUNK = list(range(10))
+
+
+class Case:
+    """One operation of one container class to measure.
+    """
+    __slots__ = ('container', 'operation', 'call', 'kind', 'expected', 'build')
+
+    def __init__(self, container, operation, call, kind='read', expected='1',
+                 build=None):
+        self.container = container
+        self.operation = operation
+        self.call = call
+        self.kind = kind
+        self.expected = expected
+        # Makes the container from a size; by default size ascending ints.
+        self.build = build or (lambda size: container(*range(size)))
+
+    def __repr__(self):
+        return f'Case({self.name})'
+
+    @property
+    def name(self):
+        return f'{self.container.__name__}.{self.operation}'
+
+
+def exhaust(iterator):
+    collections.deque(iterator, maxlen=0)
+
+
+def shuffled(container):
+    """Return a builder of containers of size items in random order.
+    """
+    def build(size):
+        items = list(range(size))
+        random.shuffle(items)
+        return container(*items)
+    return build
+
+
+def splice_pair(container):
+    """Return a builder of (empty list, list of size items) pairs.
+    """
+    return lambda size: (container(), container(*range(size)))
+
+
+def common_cases(cls, linked):
+    """Cases shared by every container. linked says whether it is a linked
+    list, where indexing walks the nodes.
+    """
+    walk = 'n' if linked else '1'
+    return [
+        Case(cls, '__len__', lambda c, i, n: len(c)),
+        Case(cls, '__getitem__ first', lambda c, i, n: c[0]),
+        Case(cls, '__getitem__ middle', lambda c, i, n: c[n // 2], expected=walk),
+        Case(cls, '__getitem__ last', lambda c, i, n: c[-1]),
+        Case(cls, '__getitem__ slice of 10', lambda c, i, n: c[n // 2:n // 2 + 10],
+             expected=walk),
+        Case(cls, '__setitem__ middle', lambda c, i, n: c.__setitem__(n // 2, i),
+             expected=walk),
+        Case(cls, 'view of 10', lambda c, i, n: exhaust(c.view(n // 2, n // 2 + 10)),
+             expected=walk),
+        Case(cls, 'contains missing', lambda c, i, n: c.contains(-1), expected='n'),
+        Case(cls, '__contains__ missing', lambda c, i, n: -1 in c, expected='n'),
+        Case(cls, 'count', lambda c, i, n: c.count(0), expected='n'),
+        Case(cls, '__iter__', lambda c, i, n: exhaust(iter(c)), expected='n'),
+        Case(cls, '__add__ list', lambda c, i, n: c + [i], expected='n'),
+        Case(cls, 'to_bytes', lambda c, i, n: c.to_bytes(), expected='n'),
+        Case(cls, 'append', lambda c, i, n: c.append(i), 'grow'),
+        Case(cls, 'extend 10', lambda c, i, n: c.extend(CHUNK), 'grow'),
+        Case(cls, '__iadd__ 10', lambda c, i, n: c.__iadd__(CHUNK), 'grow'),
+        Case(cls, 'push_many 10', lambda c, i, n: c.push_many(CHUNK), 'grow'),
+        # Each call removes the item then at index n.
+        Case(cls, 'remove at n', lambda c, i, n: c.remove(n + i), 'shrink', 'n'),
+        Case(cls, '__delitem__ middle', lambda c, i, n: c.__delitem__(n // 2),
+             'shrink', 'n'),
+        Case(cls, 'pop middle', lambda c, i, n: c.pop(n // 2), 'shrink', 'n'),
+        Case(cls, 'extend n', lambda c, i, n: c.extend(range(n)), 'fresh', 'n',
+             build=lambda size: cls()),
+        Case(cls, 'drain', lambda c, i, n: c.drain(), 'fresh', 'n'),
+        Case(cls, 'from_bytes', lambda c, i, n: cls.from_bytes(c), 'fresh', 'n',
+             build=lambda size: cls(*range(size)).to_bytes()),
+        # Linked lists build their indexes on first use, which contains() makes.
+        Case(cls, 'enable_member_index',
+             lambda c, i, n: (c.enable_member_index(), c.contains(-1)), 'fresh', 'n'),
+    ]
+
+
+def linked_cases(cls, pop_right):
+    """Cases for the linked lists. pop_right is the expected complexity of
+    pop_right(), which for a singly linked list walks to the node before
+    the tail.
+    """
+    return common_cases(cls, True) + [
+        Case(cls, '__repr__', lambda c, i, n: repr(c)),
+        Case(cls, 'py_list', lambda c, i, n: c.py_list(), expected='n'),
+        Case(cls, '__reversed__', lambda c, i, n: exhaust(reversed(c)), expected='n'),
+        Case(cls, 'values', lambda c, i, n: exhaust(c.values()), expected='n'),
+        Case(cls, 'nodes', lambda c, i, n: exhaust(c.nodes()), expected='n'),
+        Case(cls, 'append_left', lambda c, i, n: c.append_left(i), 'grow'),
+        Case(cls, 'append_right', lambda c, i, n: c.append_right(i), 'grow'),
+        Case(cls, 'insert middle', lambda c, i, n: c.insert(n // 2, i), 'grow', 'n'),
+        Case(cls, 'pop', lambda c, i, n: c.pop(), 'shrink', pop_right),
+        Case(cls, 'pop_left', lambda c, i, n: c.pop_left(), 'shrink'),
+        Case(cls, 'pop_right', lambda c, i, n: c.pop_right(), 'shrink', pop_right),
+        Case(cls, 'pop_left_many half', lambda c, i, n: c.pop_left_many(n // 2),
+             'fresh', 'n'),
+        Case(cls, 'concat', lambda c, i, n: c.concat(c), expected='n'),
+        Case(cls, 'sort', lambda c, i, n: c.sort(), 'fresh', 'n log n',
+             build=shuffled(cls)),
+        Case(cls, 'merge', lambda c, i, n: c[0].merge(c[1]), 'fresh', 'n',
+             build=lambda size: (cls(*range(0, size, 2)), cls(*range(1, size, 2)))),
+        # Constant time, but one call on a newly built list is slowed by
+        # cache misses which grow with the list, so it is only held to O(n).
+        Case(cls, 'splice', lambda c, i, n: c[0].splice(c[1]), 'fresh', 'n',
+             build=splice_pair(cls)),
+        Case(cls, 'enable_index', lambda c, i, n: (c.enable_index(), c[0]),
+             'fresh', 'n'),
+    ]
+
+
+def cases():
+    """Return every Case, container by container.
+    """
+    all_cases = linked_cases(LinkedList, 'n') + [
+        Case(LinkedList, 'has_cycle', lambda c, i, n: c.has_cycle(), expected='n'),
+        Case(LinkedList, 'find_cycle', lambda c, i, n: c.find_cycle(), expected='n'),
+        Case(LinkedList, 'classify', lambda c, i, n: c.classify(), expected='n'),
+    ]
+    all_cases += linked_cases(DoublyLinkedList, '1') + [
+        Case(DoublyLinkedList, 'cursor middle', lambda c, i, n: c.cursor(n // 2),
+             expected='n'),
+    ]
+    for cls in (Queue, Stack):
+        all_cases += common_cases(cls, False) + [
+            Case(cls, '__repr__', lambda c, i, n: repr(c), expected='n'),
+            Case(cls, 'pop', lambda c, i, n: c.pop(), 'shrink'),
+        ]
+    all_cases.append(Case(Queue, 'items', lambda c, i, n: c.items))
+    all_cases.append(Case(Queue, 'items.copy', lambda c, i, n: c.items.copy(), expected='n'))
+    return all_cases
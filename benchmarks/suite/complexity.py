@@ -0,0 +1,86 @@
+# complexity.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Fitting empirical complexity curves to ns per call against size.
+
+Each model t(n) = a + b * f(n) is fitted by least squares on the relative
+error, so small and large sizes weigh the same, with a and b kept
+non-negative; a soaks up the fixed cost of a call, which dominates at
+small sizes. The simplest model whose error is within TOLERANCE of the
+best model's is taken as the fit, so noise does not promote an O(1) call
+to O(log n).
+"""
+import math
+
+# Complexity of one call, simplest first.
+MODELS = {
+    '1': lambda n: 1.0,
+    'log n': lambda n: math.log2(n),
+    'n': lambda n: float(n),
+    'n log n': lambda n: n * math.log2(n),
+    'n^2': lambda n: float(n) * n,
+}
+ORDER = list(MODELS)
+# Log-log slope of each model at large n, near enough.
+EXPONENTS = {'1': 0, 'log n': 0, 'n': 1, 'n log n': 1, 'n^2': 2}
+# Slack on the best model's root mean square relative error.
+TOLERANCE = 0.05
+
+
+def fit_model(sizes, times, f):
+    """Return (a, b, rms relative error) of t = a + b * f(n).
+    """
+    # Minimise sum(((a + b f) / t - 1) ** 2) by solving the normal equations
+    # in x = 1 / t and y = f / t.
+    xs = [1 / t for t in times]
+    ys = [f(n) / t for n, t in zip(sizes, times)]
+    sxx = sum(x * x for x in xs)
+    syy = sum(y * y for y in ys)
+    sxy = sum(x * y for x, y in zip(xs, ys))
+    sx, sy = sum(xs), sum(ys)
+    determinant = sxx * syy - sxy * sxy
+    a = b = None
+    if determinant > 1e-12 * sxx * syy:
+        a = (sx * syy - sy * sxy) / determinant
+        b = (sy * sxx - sx * sxy) / determinant
+    if a is None or a < 0 or b < 0:
+        # The best fit with one term dropped.
+        candidates = [(sx / sxx, 0.0), (0.0, sy / syy)]
+        a, b = min(candidates, key=lambda ab: _error(xs, ys, *ab))
+    return a, b, _error(xs, ys, a, b)
+
+
+def _error(xs, ys, a, b):
+    return math.sqrt(sum((a * x + b * y - 1) ** 2 for x, y in zip(xs, ys)) / len(xs))
+
+
+def fit(sizes, times):
+    """Return (model name, slope) for ns per call times at sizes.
+
+    slope is the log-log slope fitted to the three largest sizes, a rough
+    exponent which the fixed cost of a call hides less than it does the
+    model. Returns (None, None) with fewer than three sizes.
+    """
+    if len(sizes) < 3:
+        return None, None
+    errors = {name: fit_model(sizes, times, f)[2] for name, f in MODELS.items()}
+    best = min(errors.values())
+    model = next(name for name in ORDER if errors[name] <= best + TOLERANCE)
+    xs = [math.log(n) for n in sizes[-3:]]
+    ys = [math.log(t) for t in times[-3:]]
+    mean_x, mean_y = sum(xs) / 3, sum(ys) / 3
+    slope = (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+             / sum((x - mean_x) ** 2 for x in xs))
+    return model, slope
+
+
+def worse(fitted, slope, expected):
+    """Return True if a call grows clearly faster than expected: the fitted
+    model is a faster growing one, and the slope is over half more than the
+    expected model's exponent.
+
+    Both are needed, as noise and caches bend the timings of a fast call
+    enough to fool either one alone over a few sizes, but not both.
+    """
+    return (fitted is not None and ORDER.index(fitted) > ORDER.index(expected)
+            and slope > EXPONENTS[expected] + 0.5)
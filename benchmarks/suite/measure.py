@@ -0,0 +1,139 @@
+# measure.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Timing and memory measurement of a Case at one size.
+
+Calls are timed in rounds. Each round makes as many calls as fit in about a
+tenth of the time budget, on a container made for the round (see
+cases.Case.kind), and the fastest round gives the ns per call. Rounds go on
+until the budget is spent, building containers included, and there have
+been at least three, or until ten times the budget is spent.
+
+Memory is measured on one more call: the net count of memory blocks it
+leaves allocated (sys.getallocatedblocks()), and the peak bytes traced by
+tracemalloc while it runs, over what was allocated before it.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+# Calls per round at most, so that grow and shrink rounds keep the
+# container near its size.
+MAX_CALLS = 10_000
+
+
+class Measurement:
+    """Results for one case at one size.
+    """
+    __slots__ = ('ns_per_call', 'blocks_per_call', 'peak_bytes', 'calls')
+
+    def __init__(self, ns_per_call, blocks_per_call, peak_bytes, calls):
+        self.ns_per_call = ns_per_call
+        self.blocks_per_call = blocks_per_call
+        self.peak_bytes = peak_bytes
+        self.calls = calls
+
+
+class Builds:
+    """Containers for read cases, built once per class and size.
+    """
+    def __init__(self):
+        self._size = None
+        self._built = {}
+
+    def get(self, case, size):
+        if size != self._size:
+            self._built.clear()
+            self._size = size
+        if case.container not in self._built:
+            self._built[case.container] = case.build(size)
+        return self._built[case.container]
+
+
+def prepare(case, size, calls, builds):
+    """Return the container (or containers) for a round of calls.
+    """
+    if case.kind == 'read':
+        return builds.get(case, size)
+    if case.kind == 'shrink':
+        return case.build(size + calls)
+    if case.kind == 'fresh':
+        return [case.build(size) for _ in range(calls)]
+    return case.build(size)
+
+
+def run_round(case, size, calls, container):
+    """Return the seconds taken by calls calls.
+    """
+    call = case.call
+    if case.kind == 'fresh':
+        start = time.perf_counter()
+        for i, argument in enumerate(container):
+            call(argument, i, size)
+        return time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(calls):
+        call(container, i, size)
+    return time.perf_counter() - start
+
+
+def time_case(case, size, budget, builds):
+    """Return (fastest ns per call, calls per round).
+    """
+    started = time.perf_counter()
+    # One call, first, to see how many fit in a round.
+    seconds = run_round(case, size, 1, prepare(case, size, 1, builds))
+    calls = int(min(MAX_CALLS, max(1, budget / 10 / max(seconds, 1e-9))))
+    if case.kind == 'fresh':
+        # Each call holds a container of its own until the round ends.
+        calls = min(calls, max(1, 100_000 // max(size, 1)))
+    best = seconds
+    rounds = 0
+    while True:
+        spent = time.perf_counter() - started
+        if (spent >= budget and rounds >= 3) or spent >= 10 * budget:
+            break
+        container = prepare(case, size, calls, builds)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            seconds = run_round(case, size, calls, container)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        del container
+        best = min(best, seconds / calls)
+        rounds += 1
+    return best * 1e9, calls
+
+
+def memory_case(case, size, builds):
+    """Return (net blocks left allocated, peak bytes) of one call.
+    """
+    container = prepare(case, size, 1, builds)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    result = case.call(container[0] if case.kind == 'fresh' else container, 0, size)
+    blocks = sys.getallocatedblocks() - blocks
+    del result, container
+
+    container = prepare(case, size, 1, builds)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = case.call(container[0] if case.kind == 'fresh' else container, 0, size)
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    del result, container
+    return blocks, peak
+
+
+def measure(case, size, budget, builds, memory=True):
+    """Return a Measurement of case at size, spending about budget seconds
+    on timing.
+    """
+    ns_per_call, calls = time_case(case, size, budget, builds)
+    blocks, peak = memory_case(case, size, builds) if memory else (None, None)
+    return Measurement(ns_per_call, blocks, peak, calls)
@@ -0,0 +1,100 @@
+# report.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Tables, JSON output and baseline comparison for the suite.
+
+The JSON written by --output holds:
+
+    meta        interpreter, platform, time and the options used
+    results     one entry per case and size: container, operation, kind,
+                size, ns_per_call, blocks_per_call and peak_bytes
+    complexity  one entry per case: expected and fitted models, the
+                log-log slope and whether it was flagged
+"""
+import datetime
+import json
+import platform
+import sys
+
+
+def meta(options):
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'gil': getattr(sys, '_is_gil_enabled', lambda: True)(),
+        'time': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'options': options,
+    }
+
+
+def format_ns(ns):
+    """Return ns as a short string: 950, 12.5k, 3.1M, 2.0G.
+    """
+    if ns is None:
+        return '-'
+    for scale, suffix in ((1e9, 'G'), (1e6, 'M'), (1e3, 'k')):
+        if ns >= scale:
+            return f'{ns / scale:.1f}{suffix}'
+    return f'{ns:.0f}'
+
+
+def print_table(cases, sizes, results, complexity):
+    """Print ns per call for each case and size, with its fitted model.
+    """
+    print(f'{"ns per call":<44}{"expect":>8}{"fit":>8}'
+          + ''.join(f'{f"n={size:.0e}".replace("+0", ""):>9}' for size in sizes))
+    for case in cases:
+        row = {entry['size']: entry['ns_per_call'] for entry in results
+               if entry['case'] == case.name}
+        fitted = complexity[case.name]
+        mark = ' !' if fitted['flagged'] else ''
+        print(f'{case.name:<44}{case.expected:>8}{str(fitted["fitted"] or "-"):>8}'
+              + ''.join(f'{format_ns(row.get(size)):>9}' for size in sizes) + mark)
+
+
+def print_memory(cases, size, results):
+    """Print the memory figures of each case at one size.
+    """
+    print(f'{f"memory at n={size}":<44}{"blocks/call":>12}{"peak bytes":>12}')
+    for case in cases:
+        for entry in results:
+            if entry['case'] == case.name and entry['size'] == size:
+                blocks = entry['blocks_per_call']
+                peak = entry['peak_bytes']
+                print(f'{case.name:<44}{"-" if blocks is None else blocks:>12}'
+                      f'{"-" if peak is None else peak:>12}')
+
+
+def write(path, document):
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=1)
+        file.write('\n')
+
+
+def compare(document, baseline_path, threshold):
+    """Return [(case, size, baseline ns, ns, ratio)] of the calls at least
+    threshold times slower than in the baseline JSON.
+    """
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    before = {(entry['case'], entry['size']): entry['ns_per_call']
+              for entry in baseline['results']}
+    slower = []
+    for entry in document['results']:
+        old = before.get((entry['case'], entry['size']))
+        if old:
+            ratio = entry['ns_per_call'] / old
+            if ratio >= threshold:
+                slower.append((entry['case'], entry['size'], old,
+                               entry['ns_per_call'], ratio))
+    return slower
+
+
+def print_slower(slower, threshold):
+    if not slower:
+        print(f'Nothing {threshold}x or more slower than the baseline.')
+        return
+    print(f'{"slower than baseline":<44}{"n":>9}{"was":>9}{"now":>9}{"ratio":>8}')
+    for case, size, old, new, ratio in slower:
+        print(f'{case:<44}{size:>9}{format_ns(old):>9}{format_ns(new):>9}{ratio:>8.2f}')
@@ -0,0 +1,82 @@
+# unrolled.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Compare the unrolled lists with the one-item-per-node lists.
+
+    python -m benchmarks.unrolled [largest power of ten]
+
+For n from 10**3 up to 10**6 (or the power given, e.g. 7 for ten million
+items, which needs a few GB of memory), reports for each class:
+
+    build ms        extend() with n integers
+    py_list ms      py_list(), a full walk
+    contains ms     contains() of a missing item, a full scan
+    index us        reading the item in the middle, per lookup
+    insert us       insert() and pop() in the middle, per pair
+    ends us         append_right() and pop_left(), per pair
+
+Lists without an index walk to the middle, so index and insert time grow
+with n for all of them; the unrolled lists hop a chunk at a time.
+"""
+import sys
+import time
+
+from doublylinkedlist import DoublyLinkedList
+from linkedlist import LinkedList
+from unrolledlinkedlist import UnrolledDeque, UnrolledLinkedList
+
+CLASSES = (LinkedList, DoublyLinkedList, UnrolledLinkedList, UnrolledDeque)
+
+
+def timed(operation, repeat=1):
+    """Return the time of the fastest of repeat calls of operation, in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(cls, size):
+    items = list(range(size))
+    linked = cls()
+    build = timed(lambda: linked.extend(items))
+    walk = timed(linked.py_list, 3)
+    scan = timed(lambda: linked.contains(-1), 3)
+    middle = size // 2
+    lookups = 20
+    index = timed(lambda: [linked[middle] for _ in range(lookups)]) / lookups
+    inserts = 20
+
+    def insert_and_pop():
+        for _ in range(inserts):
+            linked.insert(middle, -1)
+            linked.pop(middle)
+    insert = timed(insert_and_pop) / inserts
+    pairs = 10_000
+
+    def churn():
+        for item in range(pairs):
+            linked.append_right(item)
+            linked.pop_left()
+    ends = timed(churn) / pairs
+    return (build * 1e3, walk * 1e3, scan * 1e3,
+            index * 1e6, insert * 1e6, ends * 1e6)
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    columns = ('build ms', 'py_list ms', 'contains ms', 'index us',
+               'insert us', 'ends us')
+    print(f'{"container":<20}{"n":>10}' + ''.join(f'{c:>13}' for c in columns))
+    for power in range(3, largest + 1):
+        size = 10 ** power
+        for cls in CLASSES:
+            cells = ''.join(f'{cell:>13.1f}' for cell in measure(cls, size))
+            print(f'{cls.__name__:<20}{size:>10}{cells}')
+
+
+if __name__ == "__main__":
+    main()
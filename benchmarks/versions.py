@@ -0,0 +1,116 @@
+# versions.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Memory per kept version: immutable containers against copying.
+
+    python -m benchmarks.versions [size] [versions]
+
+Starts from a container of size items (10000 by default) and makes
+versions changes to it (200 by default), keeping every version, as an
+undo history or audit trail would. Reports the bytes each kept version
+adds beyond the starting container, traced by tracemalloc, and the
+seconds taken:
+
+    ImmutableStack          push(), keeping each returned stack
+    Stack copy              append(), keeping a Stack copy of the items
+    ImmutableLinkedList     append_left(), keeping each returned list
+    LinkedList copy         append_left(), keeping a LinkedList copy
+
+Then times building a container of size * 10 items: one push() at a time,
+with a StackBuilder, and with ImmutableStack(*items).
+"""
+import sys
+import time
+import tracemalloc
+
+from immutable import ImmutableLinkedList, ImmutableStack
+from linkedlist import LinkedList
+from stack import Stack
+
+
+def immutable_stack(stack, item):
+    return stack.push(item)
+
+
+def copied_stack(stack, item):
+    stack.append(item)
+    return Stack(*stack.items)
+
+
+def immutable_linked(linked, item):
+    return linked.append_left(item)
+
+
+def copied_linked(linked, item):
+    linked.append_left(item)
+    return LinkedList(*linked.values())
+
+
+CASES = (('ImmutableStack', ImmutableStack, immutable_stack, False),
+         ('Stack copy', Stack, copied_stack, True),
+         ('ImmutableLinkedList', ImmutableLinkedList, immutable_linked, False),
+         ('LinkedList copy', LinkedList, copied_linked, True))
+
+
+def measure(cls, change, mutable, size, versions):
+    """Make versions changes to a cls of size items, keeping each version.
+    Return (bytes per version, seconds). The starting container is built
+    before tracing starts, so only what the versions add is counted.
+    """
+    container = cls(*range(size))
+    kept = []
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        for item in range(versions):
+            version = change(container, item)
+            kept.append(version)
+            if not mutable:
+                container = version
+        seconds = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return used / versions, seconds
+
+
+def build_times(count):
+    """Return {way: seconds} to build an ImmutableStack of count items.
+    """
+    items = list(range(count))
+    times = {}
+    start = time.perf_counter()
+    stack = ImmutableStack()
+    for item in items:
+        stack = stack.push(item)
+    times['push() each'] = time.perf_counter() - start
+    start = time.perf_counter()
+    builder = ImmutableStack().transient()
+    for item in items:
+        builder.push(item)
+    builder.persistent()
+    times['StackBuilder push()'] = time.perf_counter() - start
+    start = time.perf_counter()
+    ImmutableStack(*items)
+    times['ImmutableStack(*items)'] = time.perf_counter() - start
+    return times
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    versions = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    print(f'{size} items, {versions} versions kept')
+    print(f'{"":<22}{"bytes/version":>15}{"seconds":>10}')
+    for name, cls, change, mutable in CASES:
+        per_version, seconds = measure(cls, change, mutable, size, versions)
+        print(f'{name:<22}{per_version:>15.0f}{seconds:>10.3f}')
+
+    print()
+    count = size * 10
+    print(f'building {count} items{"seconds":>23}')
+    for name, seconds in build_times(count).items():
+        print(f'{name:<30}{seconds:>10.3f}')
+
+
+if __name__ == "__main__":
+    main()
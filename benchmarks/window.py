@@ -0,0 +1,95 @@
+# window.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Sliding window min, max and sum: AggregateQueue against recomputing.
+
+    python -m benchmarks.window [steps]
+
+Streams steps random numbers (30000 by default) through windows of
+several sizes. Each step appends the new number, pops the oldest once the
+window is full, and asks for the window's min, max and sum. The plain
+Queue recomputes them with min(), max() and sum() over queue.items; the
+AggregateQueue keeps them. Prints k steps/s for each and the speedup, and
+checks that both give the same answers.
+
+A last line does the same for a stack, pushing and popping at random, with
+AggregateStack against min() and max() over a plain Stack's items.
+"""
+import operator
+import random
+import sys
+import time
+
+from queue import AggregateQueue, Queue
+from stack import AggregateStack, Stack
+
+WINDOWS = (10, 100, 1_000, 10_000)
+
+
+def recomputed(queue):
+    items = queue.items
+    return min(items), max(items), sum(items)
+
+
+def aggregated(queue):
+    return queue.min(), queue.max(), queue.reduce()
+
+
+def slide(queue, values, window, query):
+    """Return (seconds, checksum of the answers).
+    """
+    checksum = 0
+    start = time.perf_counter()
+    for value in values:
+        queue.append(value)
+        if len(queue) > window:
+            queue.pop()
+        low, high, total = query(queue)
+        checksum += low + high + total
+    return time.perf_counter() - start, checksum
+
+
+def stack_walk(stack, values, query):
+    """Push or pop at random, asking for the min and max after each step.
+    Return (seconds, checksum).
+    """
+    rng = random.Random(2)
+    checksum = 0
+    start = time.perf_counter()
+    for value in values:
+        if rng.random() < 0.5 or not len(stack):
+            stack.append(value)
+        else:
+            stack.pop()
+        if len(stack):
+            low, high = query(stack)
+            checksum += low + high
+    return time.perf_counter() - start, checksum
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    rng = random.Random(1)
+    values = [rng.randrange(1_000_000) for _ in range(steps)]
+    print(f'{"window":<14}{"recompute":>12}{"aggregate":>12}{"speedup":>10}   k steps/s')
+    for window in WINDOWS:
+        plain_seconds, plain_sum = slide(Queue(), values, window, recomputed)
+        kept_seconds, kept_sum = slide(AggregateQueue(reduce=operator.add),
+                                       values, window, aggregated)
+        assert plain_sum == kept_sum
+        print(f'{"queue " + str(window):<14}{steps / plain_seconds / 1e3:>12.1f}'
+              f'{steps / kept_seconds / 1e3:>12.1f}'
+              f'{plain_seconds / kept_seconds:>9.1f}x')
+
+    plain_seconds, plain_sum = stack_walk(
+        Stack(), values, lambda stack: (min(stack.items), max(stack.items)))
+    kept_seconds, kept_sum = stack_walk(
+        AggregateStack(), values, lambda stack: (stack.min(), stack.max()))
+    assert plain_sum == kept_sum
+    print(f'{"stack walk":<14}{steps / plain_seconds / 1e3:>12.1f}'
+          f'{steps / kept_seconds / 1e3:>12.1f}'
+          f'{plain_seconds / kept_seconds:>9.1f}x')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# bounded.py by nonetypes
+# Last revised on 10/18/2026
+
+import threading
+
+from errors import Empty, Full
+from queue import Queue
+from stack import Stack
+
+
+class _Bounded:
+    """Locking and waiting shared by BoundedQueue and BoundedStack, mixed in
+    ahead of Queue or Stack.
+
+    get() takes the item that the container's own pop() would, the first
+    for a queue and the last for a stack. _noun names the container in
+    error messages.
+    """
+    _noun = 'container'
+
+    def __init__(self, *items, maxsize=0):
+        if 0 < maxsize < len(items):
+            raise Full('more items than maxsize')
+        self.maxsize = maxsize
+        self.mutex = threading.Lock()
+        # Both conditions share the one lock. Putters wait on not_full,
+        # getters on not_empty, and each side notifies the other.
+        self.not_empty = threading.Condition(self.mutex)
+        self.not_full = threading.Condition(self.mutex)
+        super().__init__(*items)
+
+    def _kwargs(self):
+        return {'maxsize': self.maxsize}
+
+    def _check_room(self, size):
+        """Raise Full if size items would not fit.
+        """
+        if 0 < self.maxsize < size:
+            raise Full('more items than maxsize')
+
+    def _resized(self, size):
+        """Wake the waiters that a change from size items to len(self) lets
+        carry on. The mutex must be held.
+        """
+        grown = len(self) - size
+        if grown > 0:
+            self.not_empty.notify(grown)
+        elif grown < 0:
+            self.not_full.notify(-grown)
+
+    def _replace(self, replace, items):
+        """Call replace(items) under the lock, if items fit.
+        """
+        items = list(items)
+        with self.mutex:
+            self._check_room(len(items))
+            size = len(self)
+            replace(items)
+            self._resized(size)
+
+    def __getitem__(self, index):
+        with self.mutex:
+            return super().__getitem__(index)
+
+    def __setitem__(self, index, new_item):
+        with self.mutex:
+            if not isinstance(index, slice):
+                super().__setitem__(index, new_item)
+                return
+            new_item = list(new_item)
+            size = len(self)
+            if index.step in (None, 1):
+                removed = len(range(*index.indices(size)))
+                self._check_room(size - removed + len(new_item))
+            super().__setitem__(index, new_item)
+            self._resized(size)
+
+    def __delitem__(self, index):
+        with self.mutex:
+            size = len(self)
+            super().__delitem__(index)
+            self._resized(size)
+
+    def _is_full(self):
+        return 0 < self.maxsize <= len(self)
+
+    def full(self):
+        """Return True if the container is at capacity. False otherwise.
+        """
+        with self.mutex:
+            return self._is_full()
+
+    def empty(self):
+        """Return True if the container holds no items. False otherwise.
+        """
+        with self.mutex:
+            return len(self) == 0
+
+    def put(self, item, block=True, timeout=None):
+        """Add an item, waiting for room if full.
+
+        Raises Full if block is False and the container is full, or if
+        timeout seconds pass without room becoming available.
+        """
+        with self.not_full:
+            if self._is_full():
+                if not block:
+                    raise Full(f'put to full {self._noun}')
+                if timeout is not None and timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                if not self.not_full.wait_for(lambda: not self._is_full(), timeout):
+                    raise Full(f'put to full {self._noun}')
+            super().append(item)
+            self.not_empty.notify()
+
+    def put_nowait(self, item):
+        """Add an item without waiting, raising Full if there is no room.
+        """
+        self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        """Remove the next item and return it, waiting for one if the
+        container is empty.
+
+        Raises Empty if block is False and the container is empty, or if
+        timeout seconds pass without an item arriving.
+        """
+        with self.not_empty:
+            if len(self) == 0:
+                if not block:
+                    raise Empty(f'get from empty {self._noun}')
+                if timeout is not None and timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                if not self.not_empty.wait_for(lambda: len(self) > 0, timeout):
+                    raise Empty(f'get from empty {self._noun}')
+            popped_item = super().pop()
+            self.not_full.notify()
+            return popped_item
+
+    def get_nowait(self):
+        """Remove and return the next item without waiting, raising Empty if
+        there is none.
+        """
+        return self.get(block=False)
+
+    def append(self, item):
+        """Add an item, raising Full if there is no room.
+        """
+        self.put(item, block=False)
+
+    def extend(self, items):
+        """Add every item from an iterable.
+
+        Raises Full, adding nothing, if they would not all fit.
+        """
+        items = list(items)
+        with self.mutex:
+            self._check_room(len(self) + len(items))
+            super().extend(items)
+            self.not_empty.notify(len(items))
+
+    def pop(self, index=None):
+        """Remove an item at given index and return it, or the next item if
+        index is omitted.
+        """
+        with self.mutex:
+            popped_item = super().pop(index)
+            self.not_full.notify()
+            return popped_item
+
+    def pop_many(self, n):
+        """Remove up to n items and return them as pop_many() does on the
+        container.
+        """
+        with self.mutex:
+            popped_items = super().pop_many(n)
+            self.not_full.notify(len(popped_items))
+            return popped_items
+
+    def drain(self):
+        """Remove every item and return them as pop_many() does.
+        """
+        with self.mutex:
+            popped_items = super().pop_many(len(self))
+            self.not_full.notify(len(popped_items))
+            return popped_items
+
+    def remove(self, item):
+        """Remove the given item.
+        """
+        with self.mutex:
+            super().remove(item)
+            self.not_full.notify()
+
+    def contains(self, item):
+        """Return True if the given item is within the container. False
+        otherwise.
+        """
+        with self.mutex:
+            return super().contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs.
+        """
+        with self.mutex:
+            return super().count(item)
+
+
+class BoundedQueue(_Bounded, Queue):
+    """Thread-safe Queue with an optional capacity.
+
+    put() and get() block (optionally with a timeout) until there is room or
+    an item to take, waking on condition variables rather than polling.
+    A maxsize of 0 or less means the queue is never full.
+
+    append(), pop(), remove(), contains(), count() and indexing hold the same
+    lock; iterating a view() does not.
+    append() never blocks; it raises Full when the queue is at capacity, as
+    do slice assignment and assigning to items when the result would not
+    fit.
+    """
+    _noun = 'queue'
+
+    @Queue.items.setter
+    def items(self, items):
+        self._replace(super()._load, items)
+
+
+class BoundedStack(_Bounded, Stack):
+    """Thread-safe Stack with an optional capacity.
+
+    put() and get() block (optionally with a timeout) until there is room or
+    an item to take, waking on condition variables rather than polling.
+    A maxsize of 0 or less means the stack is never full.
+
+    append(), pop(), remove(), contains(), count() and indexing hold the same
+    lock; iterating a view() does not.
+    append() never blocks; it raises Full when the stack is at capacity, as
+    do slice assignment and assigning to items when the result would not
+    fit. Changes made to the items list in place bypass the lock and the
+    capacity.
+    """
+    _noun = 'stack'
+
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        if not hasattr(self, '_items'):
+            # Stack.__init__ setting the first items, already checked.
+            self._items = items
+        else:
+            self._replace(self._set_items, items)
+
+    def _set_items(self, items):
+        self._items = items
+        if self._members is not None:
+            self.enable_member_index()
@@ -0,0 +1,5 @@
+# conftest.py by nonetypes
+# Last revised on 10/18/2026
+#
+# Marks the repository root, so that pytest puts it on sys.path and the
+# tests under tests/ can import the modules here.
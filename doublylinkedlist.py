@@ -1,11 +1,24 @@
 # doublylinkedlist.py by nonetypes
-# Last revised on 02/04/2021
+# Last revised on 10/18/2026
+
+import io
+import threading
+from array import array
+
+import serialize
+from mergesort import Anchor, merge_runs, merge_sort
+from positionindex import PositionIndex, tracked_node_class
+from sliceview import SliceView
+
 
 class Node:
     """Node obect to make up the links within a DoublyLinkedList.
 
     Contains an item and the next and previous nodes in the chain.
+    Slotted so that nodes carry no per-instance __dict__.
     """
+    __slots__ = ('item', 'prev_node', 'next_node')
+
     def __init__(self, item=None):
         self.item = item
         self.prev_node = None
@@ -15,6 +28,55 @@ class Node:
         return str(self.item)
 
 
+class NodePool:
+    """Free-list of detached Nodes for DoublyLinkedLists to reuse, so that
+    lists which append and pop many items allocate few new nodes.
+
+    Holds at most capacity nodes; nodes released beyond that are left to the
+    garbage collector. Released nodes have their item and links cleared, so
+    the pool keeps nothing else alive. hits and misses count the nodes
+    acquired from the pool and the ones newly made.
+
+    One pool can be shared by several lists; it is not thread-safe.
+    """
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._free = []
+
+    def __repr__(self):
+        return (f'NodePool({len(self._free)}/{self.capacity} nodes, '
+                f'{self.hits} hits, {self.misses} misses)')
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, item, node_class=Node):
+        """Return a node of node_class (Node or a subclass of it) holding item.
+        """
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node.item = item
+            if node_class is not Node:
+                node.__class__ = node_class
+            return node
+        self.misses += 1
+        return node_class(item)
+
+    def release(self, node):
+        """Take back a node which is no longer part of any list, if there is room.
+        """
+        if len(self._free) < self.capacity:
+            self._free.append(node)
+
+    def clear(self):
+        """Drop every node held.
+        """
+        self._free.clear()
+
+
 class DoublyLinkedList:
     """Linear data structure -- list like object.
     Contains a head node and a tail node.
@@ -24,32 +86,301 @@ class DoublyLinkedList:
 
     Arguments are optional.
     Multiple argumets can be given to create multiple nodes in the list.
+
+    The length is cached, so index based operations walk from whichever of
+    the head, the tail or the last node looked up is closest.
+    enable_index() makes indexed access, insert and pop O(log n), and
+    enable_member_index() makes contains(), `in`, count() and discard_any()
+    O(1), and remove() O(1) for items held once.
+
+    enable_node_pool() recycles the nodes of popped items for new ones.
+    With clear_popped_links set, popped nodes have their links cleared so
+    they hold nothing of the list alive.
+
+    Not thread-safe; ConcurrentDeque is a deque which is.
     """
+    # Set to True to clear the links of nodes removed from the list.
+    clear_popped_links = False
+
     def __init__(self, *items):
         # Only create nodes if the items are not already nodes.
-        items = [item if isinstance(item, Node) else Node(item) for item in items]
+        nodes = [item if isinstance(item, Node) else Node(item) for item in items]
         # Assign each node's next_node and prev_node attributes.
         # 1 less than the len of items to avoid index out of range error.
-        for i in range(len(items)-1):
-            items[i].next_node = items[i+1]
-            items[i+1].prev_node = items[i]
+        for i in range(len(nodes)-1):
+            nodes[i].next_node = nodes[i+1]
+            nodes[i+1].prev_node = nodes[i]
         # Both a head and tail are assigned. If there is only one item in the list,
         # the head and tail will be the same.
-        self.head = items[0] if items else None
-        self.tail = items[-1] if items else None
+        self.head = nodes[0] if nodes else None
+        self.tail = nodes[-1] if nodes else None
+        self._size = len(nodes)
+        # Given nodes may carry links of their own (or be given twice),
+        # so count the chain rather than trusting len(nodes).
+        if any(isinstance(item, Node) for item in items):
+            self._size = None
+        # Bumped by every change to the list's structure.
+        self._version = 0
+        # (version, index, node) of the last node looked up by index.
+        self._finger = None
+        # Index state; see enable_index() and enable_member_index().
+        self._index = None
+        self._members = None
+        self._node_class = Node
+        self._index_writes = 0
+        self._item_writes = 0
+        self._index_stale = False
+        # See enable_node_pool().
+        self.node_pool = None
+
+    # Most items shown by repr(); longer lists end with '...'.
+    repr_limit = 100
 
     def __repr__(self):
-        return str(self.py_list())
+        """Return a printable string of at most repr_limit of the list's
+        items, without copying the list.
+        """
+        parts = []
+        for item in self.values():
+            if len(parts) == self.repr_limit:
+                parts.append('...')
+                break
+            parts.append(repr(item))
+        return '[' + ', '.join(parts) + ']'
 
     def __len__(self):
         """Return the number of items in the list.
         """
+        # Only lists keeping an index have tracked nodes to check.
+        if self._node_class is not Node:
+            self._check_index()
+        if self._size is None:
+            self._sync()
+        return self._size
+
+    def _sync(self):
+        """Recount the length by walking from the head.
+
+        Only needed after pre-linked nodes have been added to the list.
+        """
+        link = self.head
+        list_length = 0
+        while link is not None:
+            list_length += 1
+            link = link.next_node
+        self._size = list_length
+
+    def _node(self, item):
+        """Return the given item as a Node.
+
+        A Node which is already linked to others, or is the head or tail,
+        may already be part of this list, so the cached length is marked
+        stale.
+        """
+        if not isinstance(item, Node):
+            if self.node_pool is None:
+                node = self._node_class(item)
+            else:
+                node = self.node_pool.acquire(item, self._node_class)
+            if self._members is not None:
+                self._remember(node)
+            return node
+        if (item.next_node is not None or item.prev_node is not None
+                or item is self.head or item is self.tail):
+            self._size = None
+        if self._node_class is not Node:
+            # Rebuilding switches the node to the tracked class.
+            self._index_stale = True
+        return item
+
+    def enable_index(self, spacing=16):
+        """Keep a positional index of the list's nodes.
+
+        Indexed access, insert and pop then take O(log n) rather than O(n),
+        at the cost of O(log n) bookkeeping on every append and pop.
+        Roughly one node in every spacing is a checkpoint in the index.
+
+        While indexed, the list's nodes are switched to a subclass of Node
+        which counts writes to next_node and prev_node, so if links are
+        changed by hand the index is rebuilt on next use.
+        """
+        self._track_nodes()
+        self._index = PositionIndex(spacing)
+        self._index_stale = True
+
+    def disable_index(self):
+        """Stop keeping a positional index.
+        """
+        self._index = None
+        self._untrack_nodes()
+
+    def enable_member_index(self):
+        """Keep a map from each hashable item to the nodes holding it.
+
+        contains(), `in`, count() and discard_any() then take O(1) for
+        hashable items, as does remove() for items held by a single node;
+        unhashable ones are still looked for by walking the list.
+        As with enable_index(), items or links changed by hand on the nodes
+        are noticed and the map rebuilt on next use.
+        """
+        self._track_nodes()
+        self._members = {}
+        self._index_stale = True
+
+    def disable_member_index(self):
+        """Stop keeping a map of the list's items.
+        """
+        self._members = None
+        self._untrack_nodes()
+
+    def enable_node_pool(self, pool=None):
+        """Reuse the nodes of removed items for new items, rather than
+        leaving them to the garbage collector and allocating afresh.
+
+        pool is a NodePool, which may be shared with other lists; by default
+        the list gets one of its own. A removed node has its item and links
+        cleared before it goes into the pool, so keep no references to the
+        list's nodes (from head, tail, nodes() or cursors) past their removal.
+        """
+        self.node_pool = NodePool() if pool is None else pool
+
+    def disable_node_pool(self):
+        """Stop reusing nodes.
+        """
+        self.node_pool = None
+
+    def _track_nodes(self):
+        """Give the list its own tracked node class, if it has none yet.
+        """
+        if self._node_class is Node:
+            self._node_class = tracked_node_class(Node, ('next_node', 'prev_node'))
+
+    def _untrack_nodes(self):
+        """Switch the nodes back to Node once no index is being kept.
+        """
+        if self._index is not None or self._members is not None:
+            return
+        if self._node_class is Node:
+            return
+        link = self.head
+        while link is not None:
+            link.__class__ = Node
+            link = link.next_node
+        self._node_class = Node
+
+    def _check_index(self):
+        """Return True if the list keeps a positional index.
+
+        Any index kept is rebuilt first if the nodes have been changed since
+        it was last brought up to date.
+        """
+        node_class = self._node_class
+        if node_class is Node:
+            return False
+        if (self._index_stale or node_class.link_writes != self._index_writes
+                or (self._members is not None
+                    and node_class.item_writes != self._item_writes)):
+            self._rebuild_indexes()
+        return self._index is not None
+
+    def _rebuild_indexes(self):
+        """Rebuild the cached length and any index kept, switching every
+        node to the list's tracked node class on the way.
+        """
+        if self._members is not None:
+            self._members = {}
         link = self.head
+        tail = None
         list_length = 0
         while link is not None:
+            link.__class__ = self._node_class
+            if self._members is not None:
+                self._remember(link)
             list_length += 1
+            tail = link
             link = link.next_node
-        return list_length
+        self.tail = tail
+        self._size = list_length
+        if self._index is not None:
+            self._index.rebuild(self.head)
+        self._index_stale = False
+        self._index_done()
+
+    def _index_done(self):
+        """Mark the indexes as up to date with the nodes the list just wrote.
+        """
+        if self._node_class is not Node:
+            self._index_writes = self._node_class.link_writes
+            self._item_writes = self._node_class.item_writes
+
+    def _remember(self, node):
+        """Add node to the member index under its item.
+        """
+        try:
+            nodes = self._members.setdefault(node.item, {})
+        except TypeError:
+            # Unhashable items are found by walking the list instead.
+            return
+        # A dict of nodes rather than a set keeps them in the order added.
+        nodes[node] = None
+
+    def _forget(self, node):
+        """Remove node from the member index.
+        """
+        try:
+            nodes = self._members.get(node.item)
+        except TypeError:
+            return
+        if nodes is not None:
+            nodes.pop(node, None)
+            if not nodes:
+                del self._members[node.item]
+
+    def _assign(self, node, new_item):
+        """Set a node's item, keeping the member index up to date.
+        """
+        if self._members is not None:
+            self._check_index()
+            self._forget(node)
+            node.item = new_item
+            self._remember(node)
+            self._index_done()
+        else:
+            node.item = new_item
+
+    def _node_at(self, index):
+        """Return the node at the given index, raising IndexError if out of range.
+        """
+        list_length = len(self)
+        # Negative index support.
+        if index < 0:
+            index = list_length + index
+        if index >= list_length or index < 0:
+            raise IndexError('list index out of range')
+        if self._index is not None:
+            return self._index.locate(index, self.head)
+        # Walk from whichever of the head, the tail or the last node looked
+        # up is closest. Negative steps walk back along prev_node.
+        link, steps = self.head, index
+        if list_length - 1 - index < steps:
+            link, steps = self.tail, index - (list_length - 1)
+        finger = self._finger
+        if (finger is not None and finger[0] == self._version
+                and abs(index - finger[1]) < abs(steps)):
+            link, steps = finger[2], index - finger[1]
+        if steps > 0:
+            for _ in range(steps):
+                link = link.next_node
+        else:
+            for _ in range(-steps):
+                link = link.prev_node
+        self._finger = (self._version, index, link)
+        return link
+
+    def cursor(self, index=0):
+        """Return a Cursor placed at the given index.
+        """
+        return Cursor(self, index)
 
     def __getitem__(self, index):
         """
@@ -57,22 +388,18 @@ class DoublyLinkedList:
 
             linked = DoublyLinkedList('a', 'b', 'c')
             linked[1]                # returns 'b'
-        Slices not supported.
+            linked[::-1]             # returns ['c', 'b', 'a']
+
+        A slice gives a new DoublyLinkedList of the items, found in one walk.
         """
+        if isinstance(index, slice):
+            new_linked = DoublyLinkedList()
+            new_linked.extend([link.item for link in self._iter_range(
+                range(*index.indices(len(self))))])
+            return new_linked
         if not isinstance(index, int):
-            raise TypeError('list indices must be integers')
-        # Negative index support.
-        if index < 0:
-            index = len(self) + index
-        i = 0
-        link = self.head
-        while link is not None:
-            if index == i:
-                return link.item
-            link = link.next_node
-            i += 1
-        if index >= i or index < 0:
-            raise IndexError('list index out of range')
+            raise TypeError('list indices must be integers or slices')
+        return self._node_at(index).item
 
     def __setitem__(self, index, new_item):
         """
@@ -80,58 +407,208 @@ class DoublyLinkedList:
 
             linked = DoublyLinkedList(1, 5, 3)
             linked[1] = 2                # Changes 5 to 2
+            linked[1:] = [6, 7, 8]       # Now [1, 6, 7, 8]
         """
+        if isinstance(index, slice):
+            self._assign_range(range(*index.indices(len(self))), new_item)
+            return
         if not isinstance(index, int):
-            raise TypeError('list indices must be integers')
-        # Negative index support.
-        if index < 0:
-            index = len(self) + index
-        i = 0
-        link = self.head
-        while link is not None:
-            if i == index:
-                link.item = new_item
-            link = link.next_node
-            i += 1
-        if index >= i or index < 0:
-            raise IndexError('list index out of range')
+            raise TypeError('list indices must be integers or slices')
+        self._assign(self._node_at(index), new_item)
+
+    def __delitem__(self, index):
+        """
+        Item deletion.
+
+            linked = DoublyLinkedList(1, 2, 3, 4)
+            del linked[0]                # Removes 1
+            del linked[::2]              # Removes 2 and 4
+        """
+        if isinstance(index, slice):
+            self._delete_range(range(*index.indices(len(self))))
+        else:
+            self.pop(index)
+
+    def view(self, *args):
+        """Return a SliceView of the list without copying it.
+
+        Takes the same arguments as itertools.islice, view(stop) or
+        view(start, stop[, step]), but indices and the step may be negative.
+        """
+        return SliceView(self, slice(*args))
+
+    def _iter_range(self, window):
+        """Iterate over the nodes at the indices in the given range, which
+        must be in bounds, walking the list once.
+
+        The walk starts from whichever end or finger is closest, and goes
+        back along prev_node for a negative step.
+        """
+        if not window:
+            return
+        link = self._node_at(window.start)
+        yield link
+        step = window.step
+        for _ in range(len(window) - 1):
+            if step > 0:
+                for _ in range(step):
+                    link = link.next_node
+            else:
+                for _ in range(-step):
+                    link = link.prev_node
+            yield link
+
+    def _assign_range(self, window, items):
+        """Assign the given iterable of items to the indices in the range.
+        """
+        if isinstance(items, DoublyLinkedList):
+            items = items.py_list()
+        else:
+            items = list(items)
+        if window.step == 1:
+            # As with python lists, an empty slice marks where to insert.
+            self._replace_range(window.start, max(window.start, window.stop), items)
+            return
+        if len(items) != len(window):
+            raise ValueError(f'attempt to assign sequence of size {len(items)}'
+                             f' to extended slice of size {len(window)}')
+        for link, item in zip(self._iter_range(window), items):
+            self._assign(link, item)
+
+    def _replace_range(self, start, stop, items):
+        """Replace the nodes from start up to stop with new nodes of items,
+        in one walk.
+        """
+        indexed = self._check_index()
+        if start < len(self):
+            link = self._node_at(start)
+            before = link.prev_node
+        else:
+            link, before = None, self.tail
+        for _ in range(start, stop):
+            next_link = link.next_node
+            self._unlink(link, start)
+            link = next_link
+        for offset, item in enumerate(items):
+            node = self._node(item)
+            node.prev_node = before
+            if before is None:
+                self.head = node
+            else:
+                before.next_node = node
+            if indexed:
+                self._index.inserted(start + offset, node)
+            before = node
+        if before is None:
+            self.head = link
+        else:
+            before.next_node = link
+        if link is None:
+            self.tail = before
+        else:
+            link.prev_node = before
+        if self._size is not None:
+            self._size += len(items)
+        self._version += 1
+        self._index_done()
+
+    def _delete_range(self, window):
+        """Unlink the nodes at the indices in the given range in one walk.
+        """
+        if window.step < 0:
+            window = window[::-1]
+        if not window:
+            return
+        deleted = 0
+        link = self._node_at(window.start)
+        for position in range(window.start, window[-1] + 1):
+            next_link = link.next_node
+            if (position - window.start) % window.step == 0:
+                self._unlink(link, position - deleted)
+                deleted += 1
+            link = next_link
 
     def __add__(self, other_item):
-        """Concatenation support.
         """
-        # To keep the original linkedlist intact:
+        Concatenation support. Returns a new DoublyLinkedList holding copies
+        of both operands' items; neither operand is modified.
+
+            linked = DoublyLinkedList(1, 2)
+            linked + DoublyLinkedList(3)    # returns [1, 2, 3]
+            linked + [3, 4]                 # returns [1, 2, 3, 4]
+            linked + (3, 4)                 # returns [1, 2, (3, 4)]
+        """
         new_linked = DoublyLinkedList()
-        for node in self:
-            new_linked.append(node.item)
+        new_linked.extend(self.py_list())
+        new_linked.extend(self._concat_items(other_item))
+        return new_linked
+
+    def __iadd__(self, other_item):
+        """In place concatenation, following the same rules as +.
+        """
+        self.extend(self._concat_items(other_item))
+        return self
+
+    @staticmethod
+    def _concat_items(other_item):
+        """Return the items other_item contributes to a concatenation.
 
+        Another DoublyLinkedList contributes its items and a python list its
+        elements; anything else is a single item. Reasoning for having it
+        work this way: it quickly allows en mass appends.
+        """
         if isinstance(other_item, DoublyLinkedList):
-            if new_linked.head is not None:
-                new_linked.tail.next_node = other_item.head
-                other_item.head.prev_node = new_linked.tail
-                new_linked.tail = other_item.tail
-            else:
-                new_linked.head = other_item.head
-                new_linked.tail = other_item.tail
-        # Reasoning for having it work this way: it quickly allows en mass appends.
+            return other_item.py_list()
         elif isinstance(other_item, list):
-            for item in other_item:
-                new_linked.append(item)
-        else:
-            new_linked.append(other_item)
-        return new_linked
+            return other_item
+        return [other_item]
 
     def __iter__(self):
         """Iteration support.
         """
-        link = self.head
-        while link is not None:
-            yield link
-            link = link.next_node
+        return self.nodes()
+
+    def __reversed__(self):
+        return self.nodes(reverse=True)
+
+    def nodes(self, reverse=False):
+        """Iterate over the list's nodes from head to tail, or back along
+        prev_node from tail to head if reverse is True.
+
+        Raises RuntimeError if the list is changed through its methods
+        during iteration.
+        """
+        version = self._version
+        if reverse:
+            link = self.tail
+            while link is not None:
+                yield link
+                if self._version != version:
+                    raise RuntimeError('list changed during iteration')
+                link = link.prev_node
+        else:
+            link = self.head
+            while link is not None:
+                yield link
+                if self._version != version:
+                    raise RuntimeError('list changed during iteration')
+                link = link.next_node
+
+    def values(self, reverse=False):
+        """Iterate over the list's items from head to tail, or from tail to
+        head if reverse is True, without copying the list.
+
+        Raises RuntimeError if the list is changed through its methods
+        during iteration.
+        """
+        for link in self.nodes(reverse):
+            yield link.item
 
     def append_left(self, item):
         """Append an item to the beginning of the list.
         """
-        item = item if isinstance(item, Node) else Node(item)
+        indexed = self._check_index()
+        item = self._node(item)
         # Assign the given item's (new node) next_node to the old head.
         item.next_node = self.head
         # In case a Node is passed which has a prev_node.
@@ -144,11 +621,18 @@ class DoublyLinkedList:
             self.tail = item
         # Finally, the new node becomes the new head.
         self.head = item
+        if self._size is not None:
+            self._size += 1
+        self._version += 1
+        if indexed:
+            self._index.inserted(0, item)
+        self._index_done()
 
     def append_right(self, item):
         """Append an item to the end of the list.
         """
-        item = item if isinstance(item, Node) else Node(item)
+        indexed = self._check_index()
+        item = self._node(item)
         item.prev_node = self.tail
         item.next_node = None
         if self.tail is not None:
@@ -156,72 +640,233 @@ class DoublyLinkedList:
         if self.head is None:
             self.head = item
         self.tail = item
+        if self._size is not None:
+            self._size += 1
+        self._version += 1
+        if indexed:
+            self._index.inserted(self._index.size, item)
+        self._index_done()
 
     def append(self, item):
         """Append an item to the end of the list.
         """
         self.append_right(item)
 
+    def extend(self, items):
+        """Append every item from an iterable to the end of the list.
+
+        The new nodes are chained together first and then linked onto the
+        tail in one step. Items from another DoublyLinkedList are copied.
+        """
+        if isinstance(items, DoublyLinkedList):
+            items = items.py_list()
+        indexed = self._check_index()
+        head = tail = None
+        count = 0
+        for item in items:
+            node = self._node(item)
+            node.prev_node = tail
+            if head is None:
+                head = node
+            else:
+                tail.next_node = node
+            tail = node
+            count += 1
+            if indexed:
+                self._index.inserted(self._index.size, node)
+        if head is None:
+            return
+        tail.next_node = None
+        if self.tail is None:
+            self.head = head
+        else:
+            self.tail.next_node = head
+            head.prev_node = self.tail
+        self.tail = tail
+        if self._size is not None:
+            self._size += count
+        self._version += 1
+        self._index_done()
+
+    def push_many(self, items):
+        """Append every item from an iterable to the end of the list, as
+        extend().
+        """
+        self.extend(items)
+
+    def splice(self, other):
+        """Move every node of another DoublyLinkedList onto the end of this one.
+
+        Constant time: the nodes themselves are relinked rather than copied,
+        and other is left empty.
+        """
+        if other is self:
+            raise ValueError('cannot splice a list onto itself')
+        if other.head is None:
+            return
+        list_length, other_length = len(self), len(other)
+        if self.tail is None:
+            self.head = other.head
+        else:
+            self.tail.next_node = other.head
+            other.head.prev_node = self.tail
+        self.tail = other.tail
+        other.head, other.tail = None, None
+        self._size = list_length + other_length
+        other._size = 0
+        self._version += 1
+        other._version += 1
+        # The moved nodes are indexed (and switched to the right node class)
+        # when each list's indexes are next used.
+        if self._node_class is not Node:
+            self._index_stale = True
+        if other._node_class is not Node:
+            other._index_stale = True
+
+    def concat(self, other, steal=False):
+        """Return a new DoublyLinkedList of this list's items followed by other's.
+
+        By default both lists are copied and left as they were. With
+        steal=True the new list takes both lists' nodes in constant time
+        and both are left empty.
+        """
+        if not steal:
+            return self + other
+        new_linked = DoublyLinkedList()
+        new_linked.splice(self)
+        new_linked.splice(other)
+        return new_linked
+
     def insert(self, index, item):
         """Insert the given item at the given index.
         """
         if not isinstance(index, int):
             raise TypeError('list indices must be integers')
-        item = item if isinstance(item, Node) else Node(item)
+        list_length = len(self)
         # Negative index support.
         if index < 0:
-            index = len(self) + index
+            index = list_length + index
+        if index > list_length or index < 0:
+            raise IndexError('list index out of range')
         # To simplify inserting into an empty list.
         if index == 0:
             self.append_left(item)
+        # Inserting at the end of the list.
+        elif index == list_length:
+            self.append_right(item)
         else:
-            inserted = False
-            i = 0
-            link = self.head
-            while link is not None:
-                if i == index:
-                    item.prev_node = link.prev_node
-                    item.next_node = link
-                    link.prev_node.next_node = item
-                    link.prev_node = item
-                    inserted = True
-                link = link.next_node
-                i += 1
-            # Inserting at the end of the list.
-            if i == index:
-                self.append_right(item)
-                inserted = True
-            # Assume index out of range if nothing was inserted.
-            if not inserted:
-                raise IndexError('list index out of range')
+            link = self._node_at(index)
+            item = self._node(item)
+            item.prev_node = link.prev_node
+            item.next_node = link
+            link.prev_node.next_node = item
+            link.prev_node = item
+            if self._size is not None:
+                self._size += 1
+            self._version += 1
+            if self._index is not None:
+                self._index.inserted(index, item)
+            self._index_done()
+
+    def _unlink(self, link, index):
+        """Remove the given node, which is at the given index, from the list.
+
+        index may be None if it is not known, in which case any positional
+        index is rebuilt on next use.
+        """
+        if link.prev_node is None:
+            self.head = link.next_node
+        else:
+            link.prev_node.next_node = link.next_node
+        if link.next_node is None:
+            self.tail = link.prev_node
+        else:
+            link.next_node.prev_node = link.prev_node
+        if self._size is not None:
+            self._size -= 1
+        self._version += 1
+        if self._index is not None:
+            if index is None:
+                self._index_stale = True
+            else:
+                self._index.removed(index, link)
+        if self._members is not None:
+            self._forget(link)
+        self._index_done()
+        item = link.item
+        if self.node_pool is not None or self.clear_popped_links:
+            self._detach(link)
+        return item
+
+    def _detach(self, link):
+        """Clear a removed node's item and links, and give it to the node pool
+        if there is one.
+        """
+        # Back to a plain Node first, so that clearing it is not counted as
+        # a change to the list's links.
+        if link.__class__ is self._node_class:
+            link.__class__ = Node
+        link.prev_node = link.next_node = None
+        # Nodes of other subclasses, given as items, are not pooled.
+        if self.node_pool is not None and link.__class__ is Node:
+            link.item = None
+            self.node_pool.release(link)
+
+    def _unlink_run(self, start, count):
+        """Remove count nodes from the given index onward, which must be in
+        bounds, relinking the nodes either side once. Return their items in
+        order.
+        """
+        if count == 0:
+            return []
+        link = self._node_at(start)
+        before = link.prev_node
+        detach = self.node_pool is not None or self.clear_popped_links
+        if self._index is not None or self._members is not None or detach:
+            popped_items = []
+            for _ in range(count):
+                next_link = link.next_node
+                popped_items.append(link.item)
+                if self._index is not None:
+                    self._index.removed(start, link)
+                if self._members is not None:
+                    self._forget(link)
+                if detach:
+                    self._detach(link)
+                link = next_link
+        else:
+            # Nothing to do per node but read its item, which a
+            # comprehension does fastest.
+            popped_items = [link.item]
+            popped_items += [(link := link.next_node).item for _ in range(count - 1)]
+            link = link.next_node
+        if before is None:
+            self.head = link
+        else:
+            before.next_node = link
+        if link is None:
+            self.tail = before
+        else:
+            link.prev_node = before
+        self._size -= count
+        self._version += 1
+        self._index_done()
+        return popped_items
 
     def pop_left(self):
         """Remove the left most item in the list and return it.
         """
         if self.head is None:
             raise IndexError('pop from empty list')
-        popped_item = self.head.item
-        # i.e. if there is only one item in the list:
-        if self.head is self.tail:
-            self.head, self.tail = None, None
-        else:
-            self.head = self.head.next_node
-            self.head.prev_node = None
-        return popped_item
+        self._check_index()
+        return self._unlink(self.head, 0)
 
     def pop_right(self):
         """Remove the right most item in the list and return it.
         """
         if self.head is None:
             raise IndexError('pop from empty list')
-        popped_item = self.tail.item
-        # i.e. if there is only one item in the list:
-        if self.head is self.tail:
-            self.head, self.tail = None, None
-        else:
-            self.tail = self.tail.prev_node
-            self.tail.next_node = None
-        return popped_item
+        return self._unlink(self.tail, len(self) - 1)
 
     def pop(self, index=None):
         """Remove an item at the given index from the list and return it.
@@ -238,29 +883,105 @@ class DoublyLinkedList:
             # Negative index support.
             if index < 0:
                 index = len(self) + index
-            link = self.head
-            i = 0
-            while link is not None:
-                if i == index:
-                    popped_item = link.item
-                    if link.prev_node is None:
-                        return self.pop_left()
-                    elif link.next_node is None:
-                        return self.pop_right()
-                    else:
-                        # Overwrite the current link from the prev_node's
-                        # next_node and the from the next_node's prev_node.
-                        link.prev_node.next_node = link.next_node
-                        link.next_node.prev_node = link.prev_node
-                    return popped_item
-                link = link.next_node
-                i += 1
-            if index >= i or index < 0:
-                raise IndexError('list index out of range')
+                if index < 0:
+                    raise IndexError('list index out of range')
+            return self._unlink(self._node_at(index), index)
+
+    def pop_left_many(self, n):
+        """Remove up to n items from the left of the list and return them as
+        a python list, left to right.
+
+        The nodes are unlinked in one walk and the head relinked once.
+        """
+        n = max(0, min(n, len(self)))
+        return self._unlink_run(0, n)
+
+    def pop_right_many(self, n):
+        """Remove up to n items from the right of the list and return them
+        as a python list, right to left.
+
+        The nodes are unlinked in one walk and the tail relinked once.
+        """
+        list_length = len(self)
+        n = max(0, min(n, list_length))
+        popped_items = self._unlink_run(list_length - n, n)
+        popped_items.reverse()
+        return popped_items
+
+    def pop_many(self, n):
+        """Remove up to n items from the right of the list, as pop() does,
+        and return them as a python list, right to left.
+        """
+        return self.pop_right_many(n)
+
+    def drain(self):
+        """Remove every item and return them as pop_many() does.
+        """
+        return self.pop_many(len(self))
+
+    def remove(self, item):
+        """Remove the first occurrence of the given item from the list.
+
+        With a member index, an item held by a single node is unlinked
+        without walking the list, and a missing item is reported at once.
+        """
+        if self._members is not None:
+            self._check_index()
+            try:
+                nodes = self._members.get(item)
+            except TypeError:
+                pass
+            else:
+                if not nodes:
+                    raise ValueError(f'{item!r} is not in list')
+                if len(nodes) == 1:
+                    self._unlink(next(iter(nodes)), None)
+                    return
+        link = self.head
+        index = 0
+        while link is not None:
+            if link.item == item:
+                self._check_index()
+                self._unlink(link, index)
+                return
+            link = link.next_node
+            index += 1
+        raise ValueError(f'{item!r} is not in list')
+
+    def discard_any(self, item):
+        """Remove one occurrence of the given item from the list, if there
+        is one. Return True if an item was removed, False otherwise.
+
+        With a member index this takes O(1) for hashable items, and the
+        occurrence removed is the one added to the list earliest, which
+        need not be the first in order. Otherwise the first is removed.
+        """
+        if self._members is not None:
+            self._check_index()
+            try:
+                nodes = self._members.get(item)
+            except TypeError:
+                pass
+            else:
+                if not nodes:
+                    return False
+                self._unlink(next(iter(nodes)), None)
+                return True
+        try:
+            self.remove(item)
+        except ValueError:
+            return False
+        return True
 
     def contains(self, item):
         """Return True if the given item is within the list. False otherwise.
         """
+        if self._members is not None:
+            self._check_index()
+            try:
+                return item in self._members
+            except TypeError:
+                pass
         link = self.head
         while link is not None:
             if link.item == item:
@@ -268,6 +989,75 @@ class DoublyLinkedList:
             link = link.next_node
         return False
 
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the list.
+        """
+        if self._members is not None:
+            self._check_index()
+            try:
+                return len(self._members.get(item, ()))
+            except TypeError:
+                pass
+        occurrences = 0
+        link = self.head
+        while link is not None:
+            if link.item == item:
+                occurrences += 1
+            link = link.next_node
+        return occurrences
+
+    def sort(self, key=None, reverse=False):
+        """Sort the list in place, stably, by relinking its nodes.
+
+        Takes the same arguments as list.sort(). No nodes are created or
+        copied: a bottom-up merge sort takes O(n log n) time and O(1) extra
+        memory. key is called for an item each time it is compared in a
+        merge pass, about log2(n) times, rather than just once.
+        """
+        self._relink(merge_sort, len(self), key, reverse)
+
+    def merge(self, other, key=None, reverse=False):
+        """Merge the nodes of another list, sorted in the same way, into
+        this sorted list, leaving other empty.
+
+        Stable, with this list's items first among equals. O(n + m) time;
+        the nodes are relinked rather than copied.
+        """
+        list_length = len(self)
+        other_length = len(other)
+        self.splice(other)
+        if list_length and other_length:
+            self._relink(merge_runs, list_length, other_length, key, reverse)
+
+    def _relink(self, sorter, *args):
+        """Run a mergesort function over the list's nodes and bring the
+        prev_node links and the list's caches up to date afterwards, even
+        if it raises.
+        """
+        self._check_index()
+        anchor = Anchor(self.head)
+        try:
+            sorter(anchor, *args)
+        finally:
+            self.head = anchor.next_node
+            # The sort only relinks next_node, so prev_node and the tail
+            # are set again in one walk.
+            before = None
+            link = self.head
+            while link is not None:
+                link.prev_node = before
+                before = link
+                link = link.next_node
+            self.tail = before
+            self._version += 1
+            # Positions have changed but items have not.
+            if self._index is not None:
+                self._index_stale = True
+            self._index_done()
+
     def py_list(self):
         """Return a python list of all items from head to tail.
         """
@@ -278,6 +1068,52 @@ class DoublyLinkedList:
             link = link.next_node
         return py_list
 
+    def __reduce__(self):
+        """Pickle as a flat sequence of items rather than a chain of nodes,
+        which would recurse once per node.
+        """
+        return _restore, (type(self), self._state(), list(self._chunks()))
+
+    def _state(self):
+        """Return what, besides its items, is needed to rebuild the list:
+        see _restore().
+        """
+        return {
+            'index_spacing': None if self._index is None else self._index.spacing,
+            'member_index': self._members is not None,
+        }
+
+    def _chunks(self):
+        return serialize.chunks(self.values())
+
+    def dump(self, fp):
+        """Write the list to a binary file object, in chunks of items; see
+        serialize.
+        """
+        serialize.dump(fp, (type(self), self._state()), self._chunks())
+
+    @classmethod
+    def load(cls, fp):
+        """Read a list written by dump() from a binary file object.
+        """
+        (saved_class, state), item_chunks = serialize.load(fp)
+        if not issubclass(saved_class, cls):
+            raise TypeError(f'expected a {cls.__name__}, not a {saved_class.__name__}')
+        return _restore(saved_class, state, item_chunks)
+
+    def to_bytes(self):
+        """Return the list as bytes in the format written by dump().
+        """
+        buffer = io.BytesIO()
+        self.dump(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the list held in bytes from to_bytes().
+        """
+        return cls.load(io.BytesIO(data))
+
     def print_nodes(self):
         """Print each node's previous and next nodes.
         """
@@ -287,6 +1123,880 @@ class DoublyLinkedList:
             link = link.next_node
 
 
+class Cursor:
+    """A position within a DoublyLinkedList which remembers its node.
+
+    Moving a cursor a few places costs a few steps wherever it is in the
+    list, so walking through positions one after another is O(1) each.
+    Changing the list's structure (appending, inserting, popping) invalidates
+    the cursor; using it afterwards raises RuntimeError. Assigning to item
+    does not.
+
+        cursor = linked.cursor(2)
+        cursor.item              # same as linked[2]
+        cursor.move(1)           # cursor.index is now 3
+    """
+    def __init__(self, linked, index=0):
+        self.linked = linked
+        self.seek(index)
+
+    def __repr__(self):
+        return f'Cursor({self.index}: {self.node})'
+
+    def _check(self):
+        if self._version != self.linked._version:
+            raise RuntimeError('list changed since cursor was placed')
+
+    @property
+    def node(self):
+        self._check()
+        return self._node
+
+    @property
+    def item(self):
+        self._check()
+        return self._node.item
+
+    @item.setter
+    def item(self, new_item):
+        self._check()
+        self.linked._assign(self._node, new_item)
+
+    def seek(self, index):
+        """Place the cursor at the given index.
+        """
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers')
+        self._node = self.linked._node_at(index)
+        self.index = index if index >= 0 else len(self.linked) + index
+        self._version = self.linked._version
+
+    def move(self, steps=1):
+        """Move the cursor the given number of places; back if negative.
+
+        Raises IndexError, leaving the cursor where it was, if that would
+        take it past either end of the list.
+        """
+        self._check()
+        if not 0 <= self.index + steps < len(self.linked):
+            raise IndexError('cursor moved out of range')
+        link = self._node
+        if steps > 0:
+            for _ in range(steps):
+                link = link.next_node
+        else:
+            for _ in range(-steps):
+                link = link.prev_node
+        self._node = link
+        self.index += steps
+
+
+class ConcurrentDeque:
+    """Thread-safe deque of Nodes, for free-threaded builds as much as for
+    ones with a GIL, where DoublyLinkedList's several unguarded writes per
+    append or pop can leave head and tail corrupt.
+
+    A two-lock queue (Michael and Scott): the chain always starts with a
+    sentinel node, so the left end and the right end are separate nodes
+    even when the deque is empty. append_right() takes only the right lock
+    and pop_left() only the left lock, so producers at the tail and
+    consumers at the head never wait for each other. pop_left() makes the
+    popped node the new sentinel, and reads next_node, the one link an
+    appender writes, after the new node is complete.
+
+    append_left() and pop_right() take both locks, left then right, so they
+    are correct but serialise with everything else. len() is a snapshot of
+    two counters; iteration, py_list() and contains() take both locks and
+    work on a copy.
+    """
+    def __init__(self, *items):
+        self._sentinel = Node()
+        self._tail = self._sentinel
+        self._left_lock = threading.Lock()
+        self._right_lock = threading.Lock()
+        # Items ever added and removed; added only changes under the right
+        # lock and removed under the left lock.
+        self._added = 0
+        self._removed = 0
+        for item in items:
+            self.append_right(item)
+
+    def __repr__(self):
+        return str(self.py_list())
+
+    def __len__(self):
+        """Return the number of items, as of some moment during the call.
+        """
+        with self._left_lock, self._right_lock:
+            return self._added - self._removed
+
+    def __iter__(self):
+        """Iterate over a copy of the items from left to right.
+        """
+        return iter(self.py_list())
+
+    def append_right(self, item):
+        """Append an item to the end of the deque.
+        """
+        node = Node(item)
+        with self._right_lock:
+            node.prev_node = self._tail
+            # Publishing the node is the last write, so a popper which
+            # sees it sees it whole.
+            self._tail.next_node = node
+            self._tail = node
+            self._added += 1
+
+    def append(self, item):
+        """Append an item to the end of the deque.
+        """
+        self.append_right(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the deque, as one
+        change; poppers see none of them or all of them.
+        """
+        head = tail = None
+        count = 0
+        for item in items:
+            node = Node(item)
+            node.prev_node = tail
+            if head is None:
+                head = node
+            else:
+                tail.next_node = node
+            tail = node
+            count += 1
+        if head is None:
+            return
+        with self._right_lock:
+            head.prev_node = self._tail
+            self._tail.next_node = head
+            self._tail = tail
+            self._added += count
+
+    def append_left(self, item):
+        """Append an item to the beginning of the deque.
+        """
+        node = Node(item)
+        with self._left_lock, self._right_lock:
+            sentinel = self._sentinel
+            node.prev_node = sentinel
+            node.next_node = sentinel.next_node
+            if node.next_node is None:
+                self._tail = node
+            else:
+                node.next_node.prev_node = node
+            sentinel.next_node = node
+            self._added += 1
+
+    def pop_left(self):
+        """Remove the left most item in the deque and return it.
+        """
+        with self._left_lock:
+            sentinel = self._sentinel
+            first = sentinel.next_node
+            if first is None:
+                raise IndexError('pop from empty deque')
+            item = first.item
+            # The first node becomes the sentinel. It may also be the tail,
+            # which appenders go on linking after as before.
+            first.item = None
+            first.prev_node = None
+            self._sentinel = first
+            sentinel.next_node = None
+            self._removed += 1
+        return item
+
+    def pop_right(self):
+        """Remove the right most item in the deque and return it.
+        """
+        with self._left_lock, self._right_lock:
+            last = self._tail
+            if last is self._sentinel:
+                raise IndexError('pop from empty deque')
+            self._tail = last.prev_node
+            self._tail.next_node = None
+            last.prev_node = None
+            self._removed += 1
+        return last.item
+
+    def pop(self):
+        """Remove the right most item in the deque and return it.
+        """
+        return self.pop_right()
+
+    def py_list(self):
+        """Return a python list of all items from left to right.
+        """
+        py_list = []
+        with self._left_lock, self._right_lock:
+            link = self._sentinel.next_node
+            while link is not None:
+                py_list.append(link.item)
+                link = link.next_node
+        return py_list
+
+    def contains(self, item):
+        """Return True if the given item is within the deque. False otherwise.
+        """
+        return item in self.py_list()
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+
+class CompactNode:
+    """Handle to a node slot within a CompactDoublyLinkedList.
+
+    Reads and writes item, prev_node and next_node through the list's pools,
+    so it can be used in place of a Node. Handles are created on demand;
+    two handles to the same slot compare equal.
+    """
+    __slots__ = ('linked', 'index')
+
+    def __init__(self, linked, index):
+        self.linked = linked
+        self.index = index
+
+    def __repr__(self):
+        return str(self.item)
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactNode)
+                and other.linked is self.linked and other.index == self.index)
+
+    def __hash__(self):
+        return hash((id(self.linked), self.index))
+
+    @property
+    def item(self):
+        return self.linked._items[self.index]
+
+    @item.setter
+    def item(self, new_item):
+        self.linked._items[self.index] = new_item
+
+    @property
+    def prev_node(self):
+        return self.linked._handle(self.linked._prev[self.index])
+
+    @prev_node.setter
+    def prev_node(self, node):
+        self.linked._prev[self.index] = -1 if node is None else node.index
+
+    @property
+    def next_node(self):
+        return self.linked._handle(self.linked._next[self.index])
+
+    @next_node.setter
+    def next_node(self, node):
+        self.linked._next[self.index] = -1 if node is None else node.index
+
+
+class CompactDoublyLinkedList:
+    """DoublyLinkedList stored in flat pools rather than Node objects.
+
+    Items are kept in a python list while each slot's previous and next links
+    are kept as integer indices in array('q') pools, -1 standing in for None.
+    Slots freed by pops go on a free-list and are reused before the pools grow.
+    The optional capacity keyword preallocates that many slots.
+
+    Supports this part of DoublyLinkedList's API: indexing and slices,
+    view(), +, +=, iteration, nodes(), values(), reversed(), append(),
+    append_left(), append_right(), extend(), push_many(), insert(), pop(),
+    pop_left(), pop_right(), pop_left_many(), pop_right_many(), pop_many(),
+    drain(), remove(), discard_any(), contains(), `in`, count(), py_list(),
+    print_nodes(), pickling, dump(), load(), to_bytes() and from_bytes().
+
+    It has no positional or member index, node pool (its free-list does that
+    job), clear_popped_links (freed slots are always cleared), cursor(),
+    splice(), concat(), sort() or merge(). Iteration, head and tail give
+    CompactNode handles. Node objects given as items are copied by item.
+    """
+    def __init__(self, *items, capacity=0):
+        self._items = []
+        self._prev = array('q')
+        self._next = array('q')
+        # Head of the free-list, chained through the _next pool.
+        self._free = -1
+        self._head = -1
+        self._tail = -1
+        self._size = 0
+        # Bumped by every change to the list's structure; see nodes().
+        self._version = 0
+        self._grow(max(capacity, len(items)))
+        for item in items:
+            self.append_right(item)
+
+    # Most items shown by repr(); longer lists end with '...'.
+    repr_limit = 100
+
+    def __repr__(self):
+        """Return a printable string of at most repr_limit of the list's
+        items, without copying the list.
+        """
+        parts = []
+        for item in self.values():
+            if len(parts) == self.repr_limit:
+                parts.append('...')
+                break
+            parts.append(repr(item))
+        return '[' + ', '.join(parts) + ']'
+
+    def __len__(self):
+        """Return the number of items in the list.
+        """
+        return self._size
+
+    def __getitem__(self, index):
+        """
+        Return an item from an index:
+
+            linked = CompactDoublyLinkedList('a', 'b', 'c')
+            linked[1]                # returns 'b'
+            linked[::-1]             # returns ['c', 'b', 'a']
+
+        A slice gives a new CompactDoublyLinkedList of the items.
+        """
+        if isinstance(index, slice):
+            slots = self._slots_in(range(*index.indices(len(self))))
+            return CompactDoublyLinkedList(*[self._items[slot] for slot in slots])
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers or slices')
+        return self._items[self._slot_at(index)]
+
+    def __setitem__(self, index, new_item):
+        """
+        Item assignment.
+
+            linked = CompactDoublyLinkedList(1, 5, 3)
+            linked[1] = 2                # Changes 5 to 2
+            linked[1:] = [6, 7, 8]       # Now [1, 6, 7, 8]
+        """
+        if isinstance(index, slice):
+            self._assign_range(range(*index.indices(len(self))), new_item)
+            return
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers or slices')
+        self._items[self._slot_at(index)] = new_item
+
+    def __delitem__(self, index):
+        """
+        Item deletion.
+
+            linked = CompactDoublyLinkedList(1, 2, 3, 4)
+            del linked[0]                # Removes 1
+            del linked[::2]              # Removes 2 and 4
+        """
+        if isinstance(index, slice):
+            window = range(*index.indices(len(self)))
+            if window.step < 0:
+                window = window[::-1]
+            for slot in list(self._slots_in(window)):
+                self._unlink(slot)
+        else:
+            self.pop(index)
+
+    def view(self, *args):
+        """Return a SliceView of the list without copying it.
+
+        Takes the same arguments as itertools.islice, view(stop) or
+        view(start, stop[, step]), but indices and the step may be negative.
+        """
+        return SliceView(self, slice(*args))
+
+    def _iter_range(self, window):
+        """Iterate over CompactNode handles for the indices in the given
+        range, which must be in bounds.
+        """
+        for slot in self._slots_in(window):
+            yield CompactNode(self, slot)
+
+    def _slots_in(self, window):
+        """Iterate over the slots at the indices in the given range, which
+        must be in bounds, walking the pools once from the nearer end.
+        """
+        if not window:
+            return
+        slot = self._slot_at(window.start)
+        yield slot
+        links = self._next if window.step > 0 else self._prev
+        for _ in range(len(window) - 1):
+            for _ in range(abs(window.step)):
+                slot = links[slot]
+            yield slot
+
+    def _assign_range(self, window, items):
+        """Assign the given iterable of items to the indices in the range.
+        """
+        if isinstance(items, (DoublyLinkedList, CompactDoublyLinkedList)):
+            items = items.py_list()
+        else:
+            items = [item.item if isinstance(item, (Node, CompactNode)) else item
+                     for item in items]
+        if window.step != 1 and len(items) != len(window):
+            raise ValueError(f'attempt to assign sequence of size {len(items)}'
+                             f' to extended slice of size {len(window)}')
+        if window.step != 1:
+            for slot, item in zip(self._slots_in(window), items):
+                self._items[slot] = item
+            return
+        # Replace the slice in one walk: unlink its slots, then link new
+        # slots in after the slot before it.
+        start, stop = window.start, max(window.start, window.stop)
+        slot = self._slot_at(start) if start < self._size else -1
+        before = self._tail if slot == -1 else self._prev[slot]
+        for _ in range(start, stop):
+            next_slot = self._next[slot]
+            self._unlink(slot)
+            slot = next_slot
+        free_slots = len(self._items) - self._size
+        if len(items) > free_slots:
+            self._grow(len(items) - free_slots)
+        for item in items:
+            new_slot = self._allocate(item)
+            self._prev[new_slot] = before
+            if before == -1:
+                self._head = new_slot
+            else:
+                self._next[before] = new_slot
+            before = new_slot
+        if before == -1:
+            self._head = slot
+        else:
+            self._next[before] = slot
+        if slot == -1:
+            self._tail = before
+        else:
+            self._prev[slot] = before
+        self._size += len(items)
+        self._version += 1
+
+    def __add__(self, other_item):
+        """Concatenation support.
+
+        Returns a new CompactDoublyLinkedList; neither operand is modified.
+        """
+        new_linked = CompactDoublyLinkedList(capacity=self._size)
+        new_linked.extend(self.py_list())
+        new_linked.extend(self._concat_items(other_item))
+        return new_linked
+
+    def __iadd__(self, other_item):
+        """In place concatenation, following the same rules as +.
+        """
+        self.extend(self._concat_items(other_item))
+        return self
+
+    @staticmethod
+    def _concat_items(other_item):
+        """Return the items other_item contributes to a concatenation.
+        """
+        if isinstance(other_item, (DoublyLinkedList, CompactDoublyLinkedList)):
+            return other_item.py_list()
+        elif isinstance(other_item, list):
+            return other_item
+        return [other_item]
+
+    def __iter__(self):
+        """Iteration support.
+        """
+        return self.nodes()
+
+    def __reversed__(self):
+        return self.nodes(reverse=True)
+
+    def nodes(self, reverse=False):
+        """Iterate over CompactNode handles from head to tail, or from tail
+        to head if reverse is True.
+
+        Raises RuntimeError if the list is changed during iteration.
+        """
+        for slot in self._slots(reverse):
+            yield CompactNode(self, slot)
+
+    def values(self, reverse=False):
+        """Iterate over the list's items from head to tail, or from tail to
+        head if reverse is True, without copying the list.
+
+        Raises RuntimeError if the list is changed during iteration.
+        """
+        items = self._items
+        for slot in self._slots(reverse):
+            yield items[slot]
+
+    def _slots(self, reverse):
+        """Iterate over the list's slots in order, checking that the list
+        is not changed along the way.
+        """
+        version = self._version
+        if reverse:
+            slot, links = self._tail, self._prev
+        else:
+            slot, links = self._head, self._next
+        while slot != -1:
+            yield slot
+            if self._version != version:
+                raise RuntimeError('list changed during iteration')
+            slot = links[slot]
+
+    @property
+    def head(self):
+        return self._handle(self._head)
+
+    @property
+    def tail(self):
+        return self._handle(self._tail)
+
+    def _handle(self, slot):
+        """Return a CompactNode for the given slot, or None for -1.
+        """
+        return None if slot == -1 else CompactNode(self, slot)
+
+    def _grow(self, extra):
+        """Add at least the given number of free slots to the pools.
+        """
+        old_capacity = len(self._items)
+        # Double the pools so that growth is amortised over many appends.
+        extra = max(extra, old_capacity, 8)
+        new_capacity = old_capacity + extra
+        self._items.extend([None] * extra)
+        self._prev.extend(array('q', [-1]) * extra)
+        # Chain the new slots onto the free-list.
+        self._next.extend(array('q', range(old_capacity + 1, new_capacity + 1)))
+        self._next[new_capacity - 1] = self._free
+        self._free = old_capacity
+
+    def _allocate(self, item):
+        """Take a slot from the free-list, growing the pools if it is empty.
+        """
+        if isinstance(item, (Node, CompactNode)):
+            item = item.item
+        if self._free == -1:
+            self._grow(1)
+        slot = self._free
+        self._free = self._next[slot]
+        self._items[slot] = item
+        return slot
+
+    def _release(self, slot):
+        """Return a slot to the free-list, dropping its item reference.
+        """
+        self._items[slot] = None
+        self._prev[slot] = -1
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _slot_at(self, index):
+        """Return the slot at the given index, raising IndexError if out of range.
+        """
+        # Negative index support.
+        if index < 0:
+            index = self._size + index
+        if index >= self._size or index < 0:
+            raise IndexError('list index out of range')
+        # Walk from whichever end is closer.
+        if index <= self._size // 2:
+            slot = self._head
+            for _ in range(index):
+                slot = self._next[slot]
+        else:
+            slot = self._tail
+            for _ in range(self._size - 1 - index):
+                slot = self._prev[slot]
+        return slot
+
+    def append_left(self, item):
+        """Append an item to the beginning of the list.
+        """
+        slot = self._allocate(item)
+        self._prev[slot] = -1
+        self._next[slot] = self._head
+        if self._head != -1:
+            self._prev[self._head] = slot
+        else:
+            self._tail = slot
+        self._head = slot
+        self._size += 1
+        self._version += 1
+
+    def append_right(self, item):
+        """Append an item to the end of the list.
+        """
+        slot = self._allocate(item)
+        self._prev[slot] = self._tail
+        self._next[slot] = -1
+        if self._tail != -1:
+            self._next[self._tail] = slot
+        else:
+            self._head = slot
+        self._tail = slot
+        self._size += 1
+        self._version += 1
+
+    def append(self, item):
+        """Append an item to the end of the list.
+        """
+        self.append_right(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the list.
+
+        The pools are grown once up front when the number of items is known.
+        """
+        if isinstance(items, (DoublyLinkedList, CompactDoublyLinkedList)):
+            items = items.py_list()
+        elif not isinstance(items, (list, tuple)):
+            items = list(items)
+        free_slots = len(self._items) - self._size
+        if len(items) > free_slots:
+            self._grow(len(items) - free_slots)
+        for item in items:
+            self.append_right(item)
+
+    def push_many(self, items):
+        """Append every item from an iterable to the end of the list, as
+        extend().
+        """
+        self.extend(items)
+
+    def insert(self, index, item):
+        """Insert the given item at the given index.
+        """
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers')
+        # Negative index support.
+        if index < 0:
+            index = self._size + index
+        if index > self._size or index < 0:
+            raise IndexError('list index out of range')
+        if index == 0:
+            self.append_left(item)
+        elif index == self._size:
+            self.append_right(item)
+        else:
+            after = self._slot_at(index)
+            before = self._prev[after]
+            slot = self._allocate(item)
+            self._prev[slot] = before
+            self._next[slot] = after
+            self._next[before] = slot
+            self._prev[after] = slot
+            self._size += 1
+            self._version += 1
+
+    def pop_left(self):
+        """Remove the left most item in the list and return it.
+        """
+        if self._head == -1:
+            raise IndexError('pop from empty list')
+        slot = self._head
+        popped_item = self._items[slot]
+        self._head = self._next[slot]
+        if self._head == -1:
+            self._tail = -1
+        else:
+            self._prev[self._head] = -1
+        self._release(slot)
+        self._size -= 1
+        self._version += 1
+        return popped_item
+
+    def pop_right(self):
+        """Remove the right most item in the list and return it.
+        """
+        if self._tail == -1:
+            raise IndexError('pop from empty list')
+        slot = self._tail
+        popped_item = self._items[slot]
+        self._tail = self._prev[slot]
+        if self._tail == -1:
+            self._head = -1
+        else:
+            self._next[self._tail] = -1
+        self._release(slot)
+        self._size -= 1
+        self._version += 1
+        return popped_item
+
+    def pop(self, index=None):
+        """Remove an item at the given index from the list and return it.
+
+        Remove the last item if index is omitted.
+        """
+        if index is None:
+            return self.pop_right()
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers')
+        elif self._head == -1:
+            raise IndexError('pop from empty list')
+        return self._unlink(self._slot_at(index))
+
+    def pop_left_many(self, n):
+        """Remove up to n items from the left of the list and return them as
+        a python list, left to right.
+        """
+        n = max(0, min(n, self._size))
+        return [self.pop_left() for _ in range(n)]
+
+    def pop_right_many(self, n):
+        """Remove up to n items from the right of the list and return them
+        as a python list, right to left.
+        """
+        n = max(0, min(n, self._size))
+        return [self.pop_right() for _ in range(n)]
+
+    def pop_many(self, n):
+        """Remove up to n items from the right of the list, as pop() does,
+        and return them as a python list, right to left.
+        """
+        return self.pop_right_many(n)
+
+    def drain(self):
+        """Remove every item and return them as pop_many() does.
+        """
+        return self.pop_many(self._size)
+
+    def _unlink(self, slot):
+        """Unlink the given slot, release it and return its item.
+        """
+        popped_item = self._items[slot]
+        before, after = self._prev[slot], self._next[slot]
+        if before == -1:
+            self._head = after
+        else:
+            self._next[before] = after
+        if after == -1:
+            self._tail = before
+        else:
+            self._prev[after] = before
+        self._release(slot)
+        self._size -= 1
+        self._version += 1
+        return popped_item
+
+    def _find(self, item):
+        """Return the slot of the first occurrence of item, or -1.
+        """
+        items, links = self._items, self._next
+        slot = self._head
+        while slot != -1:
+            if items[slot] == item:
+                return slot
+            slot = links[slot]
+        return -1
+
+    def remove(self, item):
+        """Remove the first occurrence of the given item from the list.
+        """
+        slot = self._find(item)
+        if slot == -1:
+            raise ValueError(f'{item!r} is not in list')
+        self._unlink(slot)
+
+    def discard_any(self, item):
+        """Remove one occurrence of the given item from the list, if there
+        is one. Return True if an item was removed, False otherwise.
+
+        There is no member index, so this is the first occurrence.
+        """
+        slot = self._find(item)
+        if slot == -1:
+            return False
+        self._unlink(slot)
+        return True
+
+    def contains(self, item):
+        """Return True if the given item is within the list. False otherwise.
+        """
+        return self._find(item) != -1
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the list.
+        """
+        return sum(1 for stored in self.values() if stored == item)
+
+    def py_list(self):
+        """Return a python list of all items from head to tail.
+        """
+        py_list = []
+        slot = self._head
+        while slot != -1:
+            py_list.append(self._items[slot])
+            slot = self._next[slot]
+        return py_list
+
+    def __reduce__(self):
+        """Pickle as a flat sequence of items rather than a chain of nodes,
+        which would recurse once per node.
+        """
+        return _restore, (type(self), self._state(), list(self._chunks()))
+
+    def _state(self):
+        """Return what, besides its items, is needed to rebuild the list:
+        see _restore().
+        """
+        return {
+            'index_spacing': None,
+            'member_index': False,
+        }
+
+    def _chunks(self):
+        return serialize.chunks(self.values())
+
+    def dump(self, fp):
+        """Write the list to a binary file object, in chunks of items; see
+        serialize.
+        """
+        serialize.dump(fp, (type(self), self._state()), self._chunks())
+
+    @classmethod
+    def load(cls, fp):
+        """Read a list written by dump() from a binary file object.
+        """
+        (saved_class, state), item_chunks = serialize.load(fp)
+        if not issubclass(saved_class, cls):
+            raise TypeError(f'expected a {cls.__name__}, not a {saved_class.__name__}')
+        return _restore(saved_class, state, item_chunks)
+
+    def to_bytes(self):
+        """Return the list as bytes in the format written by dump().
+        """
+        buffer = io.BytesIO()
+        self.dump(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the list held in bytes from to_bytes().
+        """
+        return cls.load(io.BytesIO(data))
+
+    def print_nodes(self):
+        """Print each node's previous and next nodes.
+        """
+        for link in self:
+            print(f'{link}: {(link.prev_node, link.next_node)}')
+
+
+def _restore(cls, state, item_chunks):
+    """Rebuild a DoublyLinkedList or CompactDoublyLinkedList from its state
+    and its items.
+    """
+    linked = cls()
+    for chunk in item_chunks:
+        linked.extend(chunk)
+    if state['index_spacing'] is not None:
+        linked.enable_index(state['index_spacing'])
+    if state['member_index']:
+        linked.enable_member_index()
+    return linked
+
+
 if __name__ == "__main__":
     linked = DoublyLinkedList()
     linked.append(2)
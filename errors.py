@@ -0,0 +1,12 @@
+# errors.py by nonetypes
+# Last revised on 10/18/2026
+
+
+class Empty(IndexError):
+    """Raised by non-blocking or timed out gets from an empty container.
+    """
+
+
+class Full(Exception):
+    """Raised by non-blocking or timed out puts into a full container.
+    """
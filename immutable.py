@@ -0,0 +1,510 @@
+# immutable.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Stacks and linked lists which are never changed in place.
+
+Each change returns a new version, which shares every cell it did not
+change with the version it came from, so keeping old versions around (for
+undo, or for auditing) costs memory in proportion to the changes made
+rather than a copy of the container per version. These are persistent data
+structures in the functional sense; for a queue persisted to disk see
+persistentqueue.
+
+The cells are (item, rest) tuples, rest being the next cell or None.
+Tuples can't be changed, so no version can change another's cells.
+
+Building a large container one new version at a time makes a throwaway
+version per item. transient() gives a builder which is changed in place
+instead, and which hands out versions with persistent().
+"""
+import collections
+
+from linkedlist import LinkedList
+from stack import Stack
+
+
+def _chain(items, rest=None):
+    """Return the cell of the first of items, linked in order onto rest.
+    """
+    for item in reversed(items):
+        rest = (item, rest)
+    return rest
+
+
+def _same_items(cell, other_cell):
+    """Return True if two chains of the same length hold equal items,
+    comparing only up to the first cell they share.
+    """
+    while cell is not other_cell:
+        if cell[0] != other_cell[0]:
+            return False
+        cell, other_cell = cell[1], other_cell[1]
+    return True
+
+
+def _walk(cell):
+    """Iterate over the items of the cells from cell onward.
+    """
+    while cell is not None:
+        yield cell[0]
+        cell = cell[1]
+
+
+class ImmutableStack:
+    """Stack which is never changed in place. Last in, first out.
+
+    push() and pop() return a new stack in O(1), sharing every item below
+    the top with the stack they were called on:
+
+        empty = ImmutableStack()
+        one = empty.push(1)
+        two = one.push(2)           # one is still [1]
+        two.peek()                  # returns 2
+        two.pop() == one            # True
+
+    As with Stack, items and iteration go from first pushed to last.
+    """
+    __slots__ = ('_top', '_size')
+
+    def __init__(self, *items):
+        # Cells run from the top down, so the last item is chained first.
+        self._top = _chain(items[::-1])
+        self._size = len(items)
+
+    @classmethod
+    def _make(cls, top, size):
+        stack = object.__new__(cls)
+        stack._top = top
+        stack._size = size
+        return stack
+
+    def __repr__(self):
+        """Return a printable string version of self.items
+        """
+        return str(self.items)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Iterate over the items from first pushed to last.
+        """
+        return iter(self.items)
+
+    def __eq__(self, other):
+        if not isinstance(other, ImmutableStack):
+            return NotImplemented
+        return self._size == other._size and _same_items(self._top, other._top)
+
+    def __hash__(self):
+        return hash(tuple(_walk(self._top)))
+
+    @property
+    def items(self):
+        """A python list of the items from first pushed to last.
+        """
+        items = list(_walk(self._top))
+        items.reverse()
+        return items
+
+    def peek(self):
+        """Return the last item pushed.
+        """
+        if self._top is None:
+            raise IndexError('peek at empty stack')
+        return self._top[0]
+
+    def push(self, item):
+        """Return a new stack with the given item pushed on top.
+        """
+        return self._make((item, self._top), self._size + 1)
+
+    def append(self, item):
+        """Return a new stack with the given item pushed on top, as push().
+        """
+        return self.push(item)
+
+    def push_many(self, items):
+        """Return a new stack with every item from an iterable pushed on
+        top, in order.
+        """
+        top = self._top
+        size = self._size
+        for item in items:
+            top = (item, top)
+            size += 1
+        return self._make(top, size)
+
+    def pop(self):
+        """Return a new stack without the top item.
+        """
+        if self._top is None:
+            raise IndexError('pop from empty stack')
+        return self._make(self._top[1], self._size - 1)
+
+    def contains(self, item):
+        """Return True if the given item is within the stack. False otherwise.
+        """
+        return any(stacked == item for stacked in _walk(self._top))
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the stack.
+        """
+        return sum(1 for stacked in _walk(self._top) if stacked == item)
+
+    def transient(self):
+        """Return a StackBuilder starting from this stack.
+        """
+        return StackBuilder(self)
+
+    def to_stack(self):
+        """Return a Stack of the items, which is a copy.
+        """
+        return Stack(*self.items)
+
+
+class StackBuilder:
+    """Changeable stand-in for an ImmutableStack, for building one in bulk.
+
+    push(), pop() and extend() change the builder in place, making no new
+    stack per call. persistent() returns an ImmutableStack of the items so
+    far in O(1); building can carry on afterwards without changing it.
+    """
+    __slots__ = ('_top', '_size')
+
+    def __init__(self, stack=None):
+        self._top = None if stack is None else stack._top
+        self._size = 0 if stack is None else stack._size
+
+    def __repr__(self):
+        return f'StackBuilder({self._size} items)'
+
+    def __len__(self):
+        return self._size
+
+    def peek(self):
+        """Return the last item pushed.
+        """
+        if self._top is None:
+            raise IndexError('peek at empty stack')
+        return self._top[0]
+
+    def push(self, item):
+        """Push an item onto the stack.
+        """
+        self._top = (item, self._top)
+        self._size += 1
+
+    def append(self, item):
+        """Push an item onto the stack, as push().
+        """
+        self.push(item)
+
+    def extend(self, items):
+        """Push every item from an iterable onto the stack, in order.
+        """
+        top = self._top
+        size = self._size
+        for item in items:
+            top = (item, top)
+            size += 1
+        self._top = top
+        self._size = size
+
+    def pop(self):
+        """Remove the top item and return it.
+        """
+        if self._top is None:
+            raise IndexError('pop from empty stack')
+        item, self._top = self._top
+        self._size -= 1
+        return item
+
+    def persistent(self):
+        """Return an ImmutableStack of the items so far.
+        """
+        return ImmutableStack._make(self._top, self._size)
+
+
+class ImmutableLinkedList:
+    """Singly linked list which is never changed in place.
+
+    append_left() and pop_left() return a new list in O(1), sharing every
+    node after the head with the list they were called on. Changes further
+    in (insert(), set(), pop(index), remove()) copy the nodes before the
+    change and share the rest, so they cost O(index) time and memory;
+    append_right() and pop_right() copy the whole list.
+
+        linked = ImmutableLinkedList(2, 3)
+        longer = linked.append_left(1)  # [1, 2, 3]; linked is still [2, 3]
+        changed = longer.set(1, 'b')    # [1, 'b', 3], sharing the 3
+    """
+    __slots__ = ('_head', '_size')
+
+    # Most items shown by repr(); longer lists end with '...'.
+    repr_limit = 100
+
+    def __init__(self, *items):
+        self._head = _chain(items)
+        self._size = len(items)
+
+    @classmethod
+    def _make(cls, head, size):
+        linked = object.__new__(cls)
+        linked._head = head
+        linked._size = size
+        return linked
+
+    def __repr__(self):
+        """Return a printable string of at most repr_limit of the list's
+        items.
+        """
+        parts = []
+        for item in _walk(self._head):
+            if len(parts) == self.repr_limit:
+                parts.append('...')
+                break
+            parts.append(repr(item))
+        return '[' + ', '.join(parts) + ']'
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Iterate over the items from first to last.
+        """
+        return _walk(self._head)
+
+    def __eq__(self, other):
+        if not isinstance(other, ImmutableLinkedList):
+            return NotImplemented
+        return self._size == other._size and _same_items(self._head, other._head)
+
+    def __hash__(self):
+        return hash(tuple(_walk(self._head)))
+
+    def _index(self, index, list_length):
+        """Return a non-negative index, raising IndexError if out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers')
+        # Negative index support.
+        if index < 0:
+            index = list_length + index
+        if index >= list_length or index < 0:
+            raise IndexError('list index out of range')
+        return index
+
+    def _split(self, index):
+        """Return (python list of the items before index, cell at index).
+        """
+        before = []
+        cell = self._head
+        for _ in range(index):
+            before.append(cell[0])
+            cell = cell[1]
+        return before, cell
+
+    def __getitem__(self, index):
+        """
+        Return an item from an index:
+
+            linked = ImmutableLinkedList('a', 'b', 'c')
+            linked[1]                # returns 'b'
+            linked[::-1]             # returns ['c', 'b', 'a']
+
+        A slice gives a new ImmutableLinkedList, which shares the end of
+        this one if the slice runs to the end in steps of 1.
+        """
+        if isinstance(index, slice):
+            window = range(*index.indices(self._size))
+            if window.step == 1 and window.stop >= self._size:
+                return self._make(self._split(window.start)[1], len(window))
+            items = self.py_list()
+            return ImmutableLinkedList(*[items[i] for i in window])
+        index = self._index(index, self._size)
+        return self._split(index)[1][0]
+
+    def py_list(self):
+        """Return a python list of the items.
+        """
+        return list(_walk(self._head))
+
+    def append_left(self, item):
+        """Return a new list with the given item at the beginning.
+        """
+        return self._make((item, self._head), self._size + 1)
+
+    def pop_left(self):
+        """Return a new list without its first item.
+        """
+        if self._head is None:
+            raise IndexError('pop from empty list')
+        return self._make(self._head[1], self._size - 1)
+
+    def insert(self, index, item):
+        """Return a new list with the given item inserted at the given index.
+        """
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers')
+        # Negative index support.
+        if index < 0:
+            index = self._size + index
+        if index > self._size or index < 0:
+            raise IndexError('list index out of range')
+        before, rest = self._split(index)
+        return self._make(_chain(before, (item, rest)), self._size + 1)
+
+    def append_right(self, item):
+        """Return a new list with the given item at the end, copying every
+        node.
+        """
+        return self.insert(self._size, item)
+
+    def append(self, item):
+        """Return a new list with the given item at the end, as
+        append_right().
+        """
+        return self.append_right(item)
+
+    def set(self, index, new_item):
+        """Return a new list with the item at the given index replaced.
+        """
+        index = self._index(index, self._size)
+        before, cell = self._split(index)
+        return self._make(_chain(before, (new_item, cell[1])), self._size)
+
+    def pop(self, index=None):
+        """Return a new list without the item at the given index.
+
+        Without the last item if index is omitted.
+        """
+        if self._head is None:
+            raise IndexError('pop from empty list')
+        index = self._index(self._size - 1 if index is None else index, self._size)
+        before, cell = self._split(index)
+        return self._make(_chain(before, cell[1]), self._size - 1)
+
+    def pop_right(self):
+        """Return a new list without its last item, copying every other
+        node.
+        """
+        return self.pop()
+
+    def remove(self, item):
+        """Return a new list without the first occurrence of the given item.
+        """
+        for index, listed in enumerate(_walk(self._head)):
+            if listed == item:
+                return self.pop(index)
+        raise ValueError(f'{item!r} is not in list')
+
+    def __add__(self, other_item):
+        """Concatenation, following the same rules as LinkedList's +. This
+        list's nodes are copied; another ImmutableLinkedList's are shared.
+        """
+        if isinstance(other_item, ImmutableLinkedList):
+            rest, size = other_item._head, other_item._size
+        else:
+            other_items = other_item if isinstance(other_item, list) else [other_item]
+            rest, size = _chain(other_items), len(other_items)
+        return self._make(_chain(self.py_list(), rest), self._size + size)
+
+    def contains(self, item):
+        """Return True if the given item is within the list and False otherwise.
+        """
+        return any(listed == item for listed in _walk(self._head))
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the list.
+        """
+        return sum(1 for listed in _walk(self._head) if listed == item)
+
+    def transient(self):
+        """Return a LinkedListBuilder starting from this list.
+        """
+        return LinkedListBuilder(self)
+
+    def to_linked_list(self):
+        """Return a LinkedList of the items, which is a copy.
+        """
+        return LinkedList(*_walk(self._head))
+
+
+class LinkedListBuilder:
+    """Changeable stand-in for an ImmutableLinkedList, for building one in
+    bulk.
+
+    Items appended on either side are gathered in python lists around the
+    list the builder started from, and only chained into nodes by
+    persistent(). That shares the starting list if nothing was appended on
+    the right, and copies it once otherwise, however many items were.
+    Building can carry on afterwards without changing the list returned.
+    """
+    __slots__ = ('_left', '_head', '_size', '_right')
+
+    def __init__(self, linked=None):
+        # Items appended on the left, the last appended first in the list.
+        self._left = []
+        self._head = None if linked is None else linked._head
+        self._size = 0 if linked is None else linked._size
+        self._right = collections.deque()
+
+    def __repr__(self):
+        return f'LinkedListBuilder({len(self)} items)'
+
+    def __len__(self):
+        return len(self._left) + self._size + len(self._right)
+
+    def append_left(self, item):
+        """Append an item to the beginning of the list.
+        """
+        self._left.append(item)
+
+    def append_right(self, item):
+        """Append an item to the end of the list.
+        """
+        self._right.append(item)
+
+    def append(self, item):
+        """Append an item to the end of the list, as append_right().
+        """
+        self._right.append(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the list.
+        """
+        self._right.extend(items)
+
+    def pop_left(self):
+        """Remove the first item and return it.
+        """
+        if self._left:
+            return self._left.pop()
+        if self._head is not None:
+            item, self._head = self._head
+            self._size -= 1
+            return item
+        if self._right:
+            return self._right.popleft()
+        raise IndexError('pop from empty list')
+
+    def persistent(self):
+        """Return an ImmutableLinkedList of the items so far.
+        """
+        size = len(self)
+        head = self._head
+        if self._right:
+            head = _chain(list(_walk(head)) + list(self._right))
+            self._right.clear()
+        for item in self._left:
+            head = (item, head)
+        self._left.clear()
+        self._head, self._size = head, size
+        return ImmutableLinkedList._make(head, size)
@@ -0,0 +1,313 @@
+# instrument.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Opt-in counting of node hops, latency and size per linked list call.
+
+    import instrument
+    instrument.enable()
+    ...                                 # the workload
+    print(instrument.to_json())
+    instrument.disable()
+
+enable() replaces the public methods of LinkedList, SortedLinkedList and
+DoublyLinkedList (or the classes given) with wrappers, and the next_node and
+prev_node slots of their Node classes with descriptors which count every
+read: a hop from one node to another. disable() puts the originals back,
+so while instrumentation is off the classes are exactly as written and
+cost nothing extra.
+
+For every call, under 'Class.method' with the class of the list called,
+the stats record the hops taken, the time taken and the list's size at the
+start (None while its cached length is stale), as totals, maxima and
+histograms with power of two buckets. Calls which hop over half or more
+of a list of 16 or more nodes are counted as walks. Each call is also
+charged to its call site, the first frame outside the list modules, so
+that the code behind the O(n) calls can be found.
+
+Counts are inclusive: a method called by another is counted in both.
+Generator methods such as nodes() and values() are counted when they
+finish, with the hops and time spent inside them. The counters are
+shared, so calls made from several threads at once mix their hops.
+"""
+import inspect
+import json
+import sys
+import time
+
+import doublylinkedlist
+import linkedlist
+
+# Dunder methods instrumented along with the public ones.
+DUNDERS = ('__len__', '__getitem__', '__setitem__', '__delitem__',
+           '__contains__', '__iter__', '__reversed__', '__add__', '__iadd__',
+           '__repr__')
+# Call sites kept per method in a snapshot, most hops first.
+TOP_SITES = 10
+# Smallest list whose calls can count as walks.
+WALK_SIZE = 16
+
+# Node hops so far, read by the wrappers before and after each call.
+_hops = 0
+# {'Class.method': MethodStats} since the last reset().
+_stats = {}
+# [(owner, name, original)] of everything replaced by enable().
+_patched = []
+# Files of the list modules, skipped when looking for a call site.
+_internal_files = {linkedlist.__file__, doublylinkedlist.__file__, __file__}
+
+
+class HopCounter:
+    """Stand-in for a node slot descriptor which counts every read.
+    """
+    __slots__ = ('slot',)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        global _hops
+        _hops += 1
+        return self.slot.__get__(node, owner)
+
+    def __set__(self, node, value):
+        self.slot.__set__(node, value)
+
+    def __delete__(self, node):
+        self.slot.__delete__(node)
+
+
+class MethodStats:
+    """Running totals and histograms for one method.
+    """
+    __slots__ = ('calls', 'hops', 'max_hops', 'walks', 'total_ns', 'max_ns',
+                 'latency', 'sizes', 'sites')
+
+    def __init__(self):
+        self.calls = 0
+        self.hops = 0
+        self.max_hops = 0
+        self.walks = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        # {bit length: count}; bucket k holds values below 2**k.
+        self.latency = {}
+        self.sizes = {}
+        # {'file:line': [calls, hops]}
+        self.sites = {}
+
+    def add(self, hops, ns, size, site):
+        self.calls += 1
+        self.hops += hops
+        self.max_hops = max(self.max_hops, hops)
+        self.total_ns += ns
+        self.max_ns = max(self.max_ns, ns)
+        bucket = ns.bit_length()
+        self.latency[bucket] = self.latency.get(bucket, 0) + 1
+        if size is not None:
+            bucket = size.bit_length()
+            self.sizes[bucket] = self.sizes.get(bucket, 0) + 1
+            if size >= WALK_SIZE and hops >= size // 2:
+                self.walks += 1
+        totals = self.sites.get(site)
+        if totals is None:
+            self.sites[site] = [1, hops]
+        else:
+            totals[0] += 1
+            totals[1] += hops
+
+    def as_dict(self):
+        sites = sorted(self.sites.items(), key=lambda entry: -entry[1][1])
+        return {
+            'calls': self.calls,
+            'hops': self.hops,
+            'mean_hops': self.hops / self.calls,
+            'max_hops': self.max_hops,
+            'walks': self.walks,
+            'total_ns': self.total_ns,
+            'mean_ns': self.total_ns / self.calls,
+            'max_ns': self.max_ns,
+            'latency_ns': _histogram(self.latency),
+            'size': _histogram(self.sizes),
+            'sites': [{'site': site, 'calls': calls, 'hops': hops}
+                      for site, (calls, hops) in sites[:TOP_SITES]],
+        }
+
+
+def _histogram(buckets):
+    """Return {'<2**k': count} in bucket order.
+    """
+    return {f'<{1 << bucket}': buckets[bucket] for bucket in sorted(buckets)}
+
+
+def _call_site():
+    """Return 'file:line' of the innermost frame outside the list modules.
+    """
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename in _internal_files:
+        frame = frame.f_back
+    if frame is None:
+        return '?'
+    return f'{frame.f_code.co_filename}:{frame.f_lineno}'
+
+
+def _record(linked, name, hops, ns, size, site):
+    key = f'{type(linked).__name__}.{name}'
+    stats = _stats.get(key)
+    if stats is None:
+        stats = _stats[key] = MethodStats()
+    stats.add(hops, ns, size, site)
+
+
+def _wrap(name, method):
+    """Return a counting wrapper for a method.
+    """
+    def wrapper(self, *args, **kwargs):
+        site = _call_site()
+        size = getattr(self, '_size', None)
+        hops = _hops
+        start = time.perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _record(self, name, _hops - hops, time.perf_counter_ns() - start,
+                    size, site)
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = method.__qualname__
+    wrapper.__doc__ = method.__doc__
+    wrapper.__wrapped__ = method
+    return wrapper
+
+
+def _wrap_generator(name, method):
+    """Return a counting wrapper for a generator method, which counts the
+    hops and time spent inside the generator until it finishes.
+    """
+    def wrapper(self, *args, **kwargs):
+        site = _call_site()
+        size = getattr(self, '_size', None)
+        iterator = method(self, *args, **kwargs)
+        hops = ns = 0
+        try:
+            while True:
+                before = _hops
+                start = time.perf_counter_ns()
+                try:
+                    value = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    hops += _hops - before
+                    ns += time.perf_counter_ns() - start
+                yield value
+        finally:
+            iterator.close()
+            _record(self, name, hops, ns, size, site)
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = method.__qualname__
+    wrapper.__doc__ = method.__doc__
+    wrapper.__wrapped__ = method
+    return wrapper
+
+
+def _node_class(cls):
+    """Return (Node class, link names) for a list class.
+    """
+    for base in cls.__mro__:
+        if base is linkedlist.LinkedList:
+            return linkedlist.Node, ('next_node',)
+        if base is doublylinkedlist.DoublyLinkedList:
+            return doublylinkedlist.Node, ('next_node', 'prev_node')
+    raise TypeError(f'cannot instrument {cls.__name__}')
+
+
+def enabled():
+    """Return True while instrumentation is on.
+    """
+    return bool(_patched)
+
+
+def enable(*classes):
+    """Start counting calls to the given list classes, by default LinkedList,
+    SortedLinkedList and DoublyLinkedList. Stats carry on from before
+    unless reset().
+    """
+    if _patched:
+        raise RuntimeError('instrumentation is already enabled')
+    classes = classes or (linkedlist.LinkedList, linkedlist.SortedLinkedList,
+                          doublylinkedlist.DoublyLinkedList)
+    node_classes = {}
+    for cls in classes:
+        node_class, link_names = _node_class(cls)
+        node_classes[node_class] = link_names
+        for name, attribute in list(vars(cls).items()):
+            if not inspect.isfunction(attribute):
+                continue
+            if name.startswith('_') and name not in DUNDERS:
+                continue
+            if inspect.isgeneratorfunction(attribute):
+                wrapper = _wrap_generator(name, attribute)
+            else:
+                wrapper = _wrap(name, attribute)
+            _patched.append((cls, name, attribute))
+            setattr(cls, name, wrapper)
+    for node_class, link_names in node_classes.items():
+        for name in link_names:
+            slot = vars(node_class)[name]
+            _patched.append((node_class, name, slot))
+            setattr(node_class, name, HopCounter(slot))
+
+
+def disable():
+    """Stop counting, putting back every original method and slot. The
+    stats are kept.
+    """
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+
+
+class instrumented:
+    """Context manager which enables instrumentation for its block:
+
+        with instrument.instrumented():
+            run_workload()
+        print(instrument.snapshot())
+    """
+    def __init__(self, *classes):
+        self.classes = classes
+
+    def __enter__(self):
+        enable(*self.classes)
+        return self
+
+    def __exit__(self, *exc_info):
+        disable()
+
+
+def reset():
+    """Forget every stat recorded so far.
+    """
+    _stats.clear()
+
+
+def snapshot():
+    """Return the stats as a dict of plain values:
+
+        {'enabled': bool, 'methods': {'Class.method': {...}}}
+
+    methods are ordered by their total hops, most first.
+    """
+    methods = sorted(_stats.items(), key=lambda entry: -entry[1].hops)
+    return {
+        'enabled': enabled(),
+        'methods': {key: stats.as_dict() for key, stats in methods},
+    }
+
+
+def to_json(**kwargs):
+    """Return snapshot() as a JSON string; kwargs go to json.dumps().
+    """
+    kwargs.setdefault('indent', 1)
+    return json.dumps(snapshot(), **kwargs)
@@ -1,11 +1,24 @@
 # linkedlist.py by nonetypes
-# Last revised on 02/17/2021
+# Last revised on 10/18/2026
+
+import io
+import itertools
+import math
+
+import serialize
+from mergesort import Anchor, merge_runs, merge_sort
+from positionindex import PositionIndex, tracked_node_class
+from sliceview import SliceView
+
 
 class Node:
     """Node obect to make up the links within a LinkedList.
 
     Contains an item and the next node in the chain.
+    Slotted so that nodes carry no per-instance __dict__.
     """
+    __slots__ = ('item', 'next_node')
+
     def __init__(self, item=None):
         self.item = item
         self.next_node = None
@@ -23,27 +36,220 @@ class LinkedList:
 
     Arguments are optional.
     Multiple argumets can be given to create multiple nodes in the list.
+
+    The list keeps its length and tail node cached so that len() and appends
+    are constant time. Passing Node objects which are already linked to other
+    nodes marks the cache as stale; it is rebuilt from the head on next use.
+
+    enable_index() makes indexed access, insert and pop O(log n), and
+    enable_member_index() makes contains(), `in` and count() O(1).
     """
     def __init__(self, *items):
         # Only create nodes if the items are not already nodes.
-        items = [item if isinstance(item, Node) else Node(item) for item in items]
+        nodes = [item if isinstance(item, Node) else Node(item) for item in items]
         # Assign each node's next_node attribute.
-        for i in range(len(items)-1):
-            items[i].next_node = items[i+1]
-        self.head = items[0] if items else None
+        for i in range(len(nodes)-1):
+            nodes[i].next_node = nodes[i+1]
+        self.head = nodes[0] if nodes else None
+        self.tail = nodes[-1] if nodes else None
+        self._size = len(nodes)
+        # Given nodes may carry links of their own (or be given twice),
+        # so count the chain rather than trusting len(nodes).
+        if any(isinstance(item, Node) for item in items):
+            self._size = None
+        # Bumped by every change to the list's structure, so that iterators
+        # can tell if the list changes under them.
+        self._version = 0
+        # Index state; see enable_index() and enable_member_index().
+        self._index = None
+        self._members = None
+        self._node_class = Node
+        self._index_writes = 0
+        self._item_writes = 0
+        self._index_stale = False
+
+    # Most items shown by repr(); longer lists end with '...'.
+    repr_limit = 100
 
     def __repr__(self):
-        return str(self.py_list())
+        """Return a printable string of at most repr_limit of the list's
+        items, without copying the list.
+        """
+        parts = []
+        for item in self.values():
+            if len(parts) == self.repr_limit:
+                parts.append('...')
+                break
+            parts.append(repr(item))
+        return '[' + ', '.join(parts) + ']'
 
     def __len__(self):
         """Return the length of the list.
         """
+        # Only lists keeping an index have tracked nodes to check.
+        if self._node_class is not Node:
+            self._check_index()
+        if self._size is None:
+            self._sync()
+        return self._size
+
+    def _sync(self):
+        """Recount the length and find the tail by walking from the head.
+
+        Only needed after pre-linked nodes have been added to the list.
+        """
+        link = self.head
+        tail = None
+        list_length = 0
+        while link is not None:
+            list_length += 1
+            tail = link
+            link = link.next_node
+        self.tail = tail
+        self._size = list_length
+
+    def _node(self, item):
+        """Return the given item as a Node.
+
+        A Node which already links onward, or which is the current tail, may
+        already be part of this list (or bring a chain of its own), so the
+        cached length and tail are marked stale.
+        """
+        if not isinstance(item, Node):
+            node = self._node_class(item)
+            if self._members is not None:
+                self._remember(item)
+            return node
+        if item.next_node is not None or item is self.tail:
+            self._size = None
+        if self._node_class is not Node:
+            # Rebuilding switches the node to the tracked class.
+            self._index_stale = True
+        return item
+
+    def enable_index(self, spacing=16):
+        """Keep a positional index of the list's nodes.
+
+        Indexed access, insert and pop then take O(log n) rather than O(n),
+        at the cost of O(log n) bookkeeping on every append and pop.
+        Roughly one node in every spacing is a checkpoint in the index.
+
+        While indexed, the list's nodes are switched to a subclass of Node
+        which counts writes to next_node, so if links are changed by hand
+        the index (and the cached length and tail) is rebuilt on next use.
+        """
+        self._track_nodes()
+        self._index = PositionIndex(spacing)
+        self._index_stale = True
+
+    def disable_index(self):
+        """Stop keeping a positional index.
+        """
+        self._index = None
+        self._untrack_nodes()
+
+    def enable_member_index(self):
+        """Keep a count of each hashable item in the list.
+
+        contains(), `in` and count() then take O(1) for hashable items;
+        unhashable ones are still looked for by walking the list. As with
+        enable_index(), items or links changed by hand on the nodes are
+        noticed and the counts rebuilt on next use.
+        """
+        self._track_nodes()
+        self._members = {}
+        self._index_stale = True
+
+    def disable_member_index(self):
+        """Stop keeping a count of the list's items.
+        """
+        self._members = None
+        self._untrack_nodes()
+
+    def _track_nodes(self):
+        """Give the list its own tracked node class, if it has none yet.
+        """
+        if self._node_class is Node:
+            self._node_class = tracked_node_class(Node, ('next_node',))
+
+    def _untrack_nodes(self):
+        """Switch the nodes back to Node once no index is being kept.
+        """
+        if self._index is not None or self._members is not None:
+            return
+        if self._node_class is Node:
+            return
+        link = self.head
+        while link is not None:
+            link.__class__ = Node
+            link = link.next_node
+        self._node_class = Node
+
+    def _check_index(self):
+        """Return True if the list keeps a positional index.
+
+        Any index kept is rebuilt first if the nodes have been changed since
+        it was last brought up to date.
+        """
+        node_class = self._node_class
+        if node_class is Node:
+            return False
+        if (self._index_stale or node_class.link_writes != self._index_writes
+                or (self._members is not None
+                    and node_class.item_writes != self._item_writes)):
+            self._rebuild_indexes()
+        return self._index is not None
+
+    def _rebuild_indexes(self):
+        """Rebuild the cached length and tail and any index kept, switching
+        every node to the list's tracked node class on the way.
+        """
+        if self._members is not None:
+            self._members = {}
         link = self.head
+        tail = None
         list_length = 0
         while link is not None:
+            link.__class__ = self._node_class
+            if self._members is not None:
+                self._remember(link.item)
             list_length += 1
+            tail = link
             link = link.next_node
-        return list_length
+        self.tail = tail
+        self._size = list_length
+        if self._index is not None:
+            self._index.rebuild(self.head)
+        self._index_stale = False
+        self._index_done()
+
+    def _index_done(self):
+        """Mark the indexes as up to date with the nodes the list just wrote.
+        """
+        if self._node_class is not Node:
+            self._index_writes = self._node_class.link_writes
+            self._item_writes = self._node_class.item_writes
+
+    def _remember(self, item):
+        """Count one more of item in the member index.
+        """
+        try:
+            self._members[item] = self._members.get(item, 0) + 1
+        except TypeError:
+            # Unhashable items are found by walking the list instead.
+            pass
+
+    def _forget(self, item):
+        """Count one less of item in the member index.
+        """
+        try:
+            count = self._members[item]
+        except (KeyError, TypeError):
+            return
+        if count == 1:
+            del self._members[item]
+        else:
+            self._members[item] = count - 1
 
     def __getitem__(self, index):
         """
@@ -51,22 +257,18 @@ class LinkedList:
 
             linked = LinkedList('a', 'b', 'c')
             linked[1]                # returns 'b'
-        Slices not supported.
+            linked[::-1]             # returns ['c', 'b', 'a']
+
+        A slice gives a new LinkedList of the items, found in one walk.
         """
+        if isinstance(index, slice):
+            new_linked = LinkedList()
+            new_linked.extend([link.item for link in self._iter_range(
+                range(*index.indices(len(self))))])
+            return new_linked
         if not isinstance(index, int):
-            raise TypeError('list indices must be integers')
-        # Negative index support.
-        if index < 0:
-            index = len(self) + index
-        i = 0
-        link = self.head
-        while link is not None:
-            if index == i:
-                return link
-            link = link.next_node
-            i += 1
-        if index >= i or index < 0:
-            raise IndexError('list index out of range')
+            raise TypeError('list indices must be integers or slices')
+        return self._link_at(index)
 
     def __setitem__(self, index, new_item):
         """
@@ -74,50 +276,342 @@ class LinkedList:
 
             linked = LinkedList(1, 5, 3)
             linked[1] = 2                # Changes 5 to 2
+            linked[1:] = [6, 7, 8]       # Now [1, 6, 7, 8]
         """
+        if isinstance(index, slice):
+            self._assign_range(range(*index.indices(len(self))), new_item)
+            return
         if not isinstance(index, int):
-            raise TypeError('list indices must be integers')
+            raise TypeError('list indices must be integers or slices')
+        link = self._link_at(index)
+        if self._members is not None:
+            self._forget(link.item)
+            self._remember(new_item)
+        link.item = new_item
+        self._index_done()
+
+    def __delitem__(self, index):
+        """
+        Item deletion.
+
+            linked = LinkedList(1, 2, 3, 4)
+            del linked[0]                # Removes 1
+            del linked[::2]              # Removes 2 and 4
+        """
+        if isinstance(index, slice):
+            self._delete_range(range(*index.indices(len(self))))
+        else:
+            self.pop(index)
+
+    def view(self, *args):
+        """Return a SliceView of the list without copying it.
+
+        Takes the same arguments as itertools.islice, view(stop) or
+        view(start, stop[, step]), but indices and the step may be negative.
+        """
+        return SliceView(self, slice(*args))
+
+    def _iter_range(self, window):
+        """Iterate over the nodes at the indices in the given range, which
+        must be in bounds, walking the list once.
+        """
+        if not window:
+            return
+        if window.step < 0:
+            # Nodes only link forward, so the window's nodes are gathered
+            # walking forward and handed out in reverse.
+            yield from reversed(list(self._iter_range(window[::-1])))
+            return
+        link = self._link_at(window.start)
+        yield link
+        for _ in range(len(window) - 1):
+            for _ in range(window.step):
+                link = link.next_node
+            yield link
+
+    def _assign_range(self, window, items):
+        """Assign the given iterable of items to the indices in the range.
+        """
+        if isinstance(items, LinkedList):
+            items = items.py_list()
+        else:
+            items = list(items)
+        if window.step == 1:
+            # As with python lists, an empty slice marks where to insert.
+            self._replace_range(window.start, max(window.start, window.stop), items)
+            return
+        if len(items) != len(window):
+            raise ValueError(f'attempt to assign sequence of size {len(items)}'
+                             f' to extended slice of size {len(window)}')
+        if window.step < 0:
+            window, items = window[::-1], items[::-1]
+        self._check_index()
+        for link, item in zip(self._iter_range(window), items):
+            if self._members is not None:
+                self._forget(link.item)
+                self._remember(item)
+            link.item = item
+        self._index_done()
+
+    def _replace_range(self, start, stop, items):
+        """Replace the nodes from start up to stop with new nodes of items,
+        in one walk.
+        """
+        indexed = self._check_index()
+        before = self._link_at(start - 1) if start > 0 else None
+        link = self.head if before is None else before.next_node
+        for _ in range(start, stop):
+            if indexed:
+                self._index.removed(start, link)
+            if self._members is not None:
+                self._forget(link.item)
+            link = link.next_node
+        for offset, item in enumerate(items):
+            node = self._node(item)
+            if before is None:
+                self.head = node
+            else:
+                before.next_node = node
+            if indexed:
+                self._index.inserted(start + offset, node)
+            before = node
+        if before is None:
+            self.head = link
+        else:
+            before.next_node = link
+        if link is None:
+            self.tail = before
+        if self._size is not None:
+            self._size += len(items) - (stop - start)
+        self._version += 1
+        self._index_done()
+
+    def _delete_range(self, window):
+        """Unlink the nodes at the indices in the given range in one walk.
+        """
+        if window.step < 0:
+            window = window[::-1]
+        if not window:
+            return
+        indexed = self._check_index()
+        before = self._link_at(window.start - 1) if window.start > 0 else None
+        link = self.head if before is None else before.next_node
+        deleted = 0
+        for position in range(window.start, window[-1] + 1):
+            next_link = link.next_node
+            if (position - window.start) % window.step == 0:
+                if before is None:
+                    self.head = next_link
+                else:
+                    before.next_node = next_link
+                if indexed:
+                    self._index.removed(position - deleted, link)
+                if self._members is not None:
+                    self._forget(link.item)
+                deleted += 1
+            else:
+                before = link
+            link = next_link
+        if link is None:
+            self.tail = before
+        self._size -= deleted
+        self._version += 1
+        self._index_done()
+
+    def _unlink_run(self, start, count):
+        """Unlink count nodes from the given index onward, which must be in
+        bounds, relinking the nodes either side once. Return their items in
+        order.
+        """
+        if count == 0:
+            return []
+        indexed = self._check_index()
+        before = self._link_at(start - 1) if start > 0 else None
+        link = self.head if before is None else before.next_node
+        if indexed or self._members is not None:
+            popped_items = []
+            for _ in range(count):
+                popped_items.append(link.item)
+                if indexed:
+                    self._index.removed(start, link)
+                if self._members is not None:
+                    self._forget(link.item)
+                link = link.next_node
+        else:
+            # Cut the run off before walking it, so that nothing but the
+            # walk refers to its nodes and each is freed as the walk leaves
+            # it, rather than all at once in a chain when the list is
+            # relinked. Nothing else is done per node but read its item,
+            # which a comprehension does fastest.
+            if before is None:
+                self.head = None
+            else:
+                before.next_node = None
+            popped_items = [link.item]
+            popped_items += [(link := link.next_node).item for _ in range(count - 1)]
+            link = link.next_node
+        if before is None:
+            self.head = link
+        else:
+            before.next_node = link
+        if link is None:
+            self.tail = before
+        self._size -= count
+        self._version += 1
+        self._index_done()
+        return popped_items
+
+    def _link_at(self, index):
+        """Return the node at the given index, raising IndexError if out of range.
+        """
+        list_length = len(self)
         # Negative index support.
         if index < 0:
-            index = len(self) + index
-        i = 0
+            index = list_length + index
+        if index >= list_length or index < 0:
+            raise IndexError('list index out of range')
+        if index == list_length - 1:
+            return self.tail
+        if self._index is not None:
+            return self._index.locate(index, self.head)
         link = self.head
-        while link is not None:
-            if i == index:
-                link.item = new_item
+        for _ in range(index):
             link = link.next_node
-            i += 1
-        if index >= i or index < 0:
-            raise IndexError('list index out of range')
+        return link
+
+    def __add__(self, other_item):
+        """
+        Concatenation support. Returns a new LinkedList holding copies of
+        both operands' items; neither operand is modified.
+
+            linked = LinkedList(1, 2)
+            linked + LinkedList(3)      # returns [1, 2, 3]
+            linked + [3, 4]             # returns [1, 2, 3, 4]
+            linked + (3, 4)             # returns [1, 2, (3, 4)]
+        """
+        new_linked = LinkedList()
+        new_linked.extend(self.py_list())
+        new_linked.extend(self._concat_items(other_item))
+        return new_linked
+
+    def __iadd__(self, other_item):
+        """In place concatenation, following the same rules as +.
+        """
+        self.extend(self._concat_items(other_item))
+        return self
+
+    @staticmethod
+    def _concat_items(other_item):
+        """Return the items other_item contributes to a concatenation.
+
+        Another LinkedList contributes its items and a python list its
+        elements; anything else is a single item.
+        """
+        if isinstance(other_item, LinkedList):
+            return other_item.py_list()
+        elif isinstance(other_item, list):
+            return other_item
+        return [other_item]
 
     def __iter__(self):
+        return self.nodes()
+
+    def __reversed__(self):
+        return self.nodes(reverse=True)
+
+    def nodes(self, reverse=False):
+        """Iterate over the list's nodes from head to tail, or from tail to
+        head if reverse is True.
+
+        Raises RuntimeError if the list is changed through its methods
+        during iteration.
+        """
+        version = self._version
+        links = self._backward() if reverse else self._forward()
+        for link in links:
+            yield link
+            if self._version != version:
+                raise RuntimeError('list changed during iteration')
+
+    def values(self, reverse=False):
+        """Iterate over the list's items from head to tail, or from tail to
+        head if reverse is True, without copying the list.
+
+        Raises RuntimeError if the list is changed through its methods
+        during iteration.
+        """
+        for link in self.nodes(reverse):
+            yield link.item
+
+    def _forward(self):
+        """Iterate over the nodes from head to tail.
+        """
         link = self.head
         while link is not None:
             yield link
             link = link.next_node
 
+    def _backward(self):
+        """Iterate over the nodes from tail to head.
+
+        Nodes only link forward, so one walk notes every block-th node and
+        the blocks are then gathered and handed out last first. That is two
+        walks of the list and O(sqrt(n)) memory rather than O(n).
+        """
+        list_length = len(self)
+        block = max(1, math.isqrt(list_length))
+        starts = []
+        link = self.head
+        for index in range(list_length):
+            if index % block == 0:
+                starts.append(link)
+            link = link.next_node
+        last_block = list_length - (len(starts) - 1) * block
+        for start in reversed(starts):
+            links = []
+            link = start
+            for _ in range(last_block):
+                links.append(link)
+                link = link.next_node
+            yield from reversed(links)
+            last_block = block
+
     def append_left(self, item):
         """Append an item to the beginning of the list.
         """
-        item = item if isinstance(item, Node) else Node(item)
+        indexed = self._check_index()
+        item = self._node(item)
         # Create a new head. The old head becomes the new head's next_node.
         item.next_node = self.head
         self.head = item
+        if self._size is not None:
+            if self._size == 0:
+                self.tail = item
+            self._size += 1
+        if indexed:
+            self._index.inserted(0, item)
+        self._version += 1
+        self._index_done()
 
     def append_right(self, item):
         """Append an item to the end of the list.
         """
-        item = item if isinstance(item, Node) else Node(item)
+        indexed = self._check_index()
+        if self._size is None:
+            self._sync()
+        item = self._node(item)
         if self.head is None:
             self.head = item
         else:
-            # Start with the head.
-            # Work through each node until the next_node is None (the tail),
-            # and assign the given item (new node) to its next_node.
-            link = self.head
-            while link.next_node is not None:
-                link = link.next_node
-            link.next_node = item
+            # The cached tail's next_node becomes the given item (new node).
+            self.tail.next_node = item
+        self.tail = item
+        if self._size is not None:
+            self._size += 1
+        if indexed:
+            self._index.inserted(self._index.size, item)
+        self._version += 1
+        self._index_done()
 
     def append(self, item):
         """Append an item to the end of the list.
@@ -125,33 +619,118 @@ class LinkedList:
         # For ease of use. Functions like built-in [].append()
         self.append_right(item)
 
+    def extend(self, items):
+        """Append every item from an iterable to the end of the list.
+
+        The new nodes are chained together first and then linked onto the
+        tail in one step. Items from another LinkedList are copied.
+        """
+        if isinstance(items, LinkedList):
+            items = items.py_list()
+        indexed = self._check_index()
+        if self._size is None:
+            self._sync()
+        head = tail = None
+        count = 0
+        for item in items:
+            node = self._node(item)
+            if head is None:
+                head = node
+            else:
+                tail.next_node = node
+            tail = node
+            count += 1
+            if indexed:
+                self._index.inserted(self._index.size, node)
+        if head is None:
+            return
+        if self.head is None:
+            self.head = head
+        else:
+            self.tail.next_node = head
+        self.tail = tail
+        if self._size is not None:
+            self._size += count
+        self._version += 1
+        self._index_done()
+
+    def push_many(self, items):
+        """Append every item from an iterable to the end of the list, as
+        extend().
+        """
+        self.extend(items)
+
+    def splice(self, other):
+        """Move every node of another LinkedList onto the end of this one.
+
+        Constant time: the nodes themselves are relinked rather than copied,
+        and other is left empty.
+        """
+        if other is self:
+            raise ValueError('cannot splice a list onto itself')
+        if other.head is None:
+            return
+        if self._size is None:
+            self._sync()
+        if other._size is None:
+            other._sync()
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next_node = other.head
+        self.tail = other.tail
+        self._size += other._size
+        other.head, other.tail, other._size = None, None, 0
+        self._version += 1
+        other._version += 1
+        # The moved nodes are indexed (and switched to the right node class)
+        # when each list's indexes are next used.
+        if self._node_class is not Node:
+            self._index_stale = True
+        if other._node_class is not Node:
+            other._index_stale = True
+
+    def concat(self, other, steal=False):
+        """Return a new LinkedList of this list's items followed by other's.
+
+        By default both lists are copied and left as they were. With
+        steal=True the new list takes both lists' nodes in constant time
+        and both are left empty.
+        """
+        if not steal:
+            return self + other
+        new_linked = LinkedList()
+        new_linked.splice(self)
+        new_linked.splice(other)
+        return new_linked
+
     def insert(self, index, item):
         """Insert the given item at the given index.
         """
         if not isinstance(index, int):
             raise TypeError('list indices must be integers')
-        item = item if isinstance(item, Node) else Node(item)
+        list_length = len(self)
         # Negative index support.
         if index < 0:
-            index = len(self) + index
+            index = list_length + index
+        if index > list_length or index < 0:
+            raise IndexError('list index out of range')
         if index == 0:
             self.append_left(item)
+        elif index == list_length:
+            self.append_right(item)
         else:
-            inserted = False
-            # Start at 1 rather than 0 for i because the link preceding the
-            # given index is what must be altered.
-            i = 1
-            link = self.head
-            while link is not None:
-                if i == index:
-                    item.next_node = link.next_node
-                    link.next_node = item
-                    inserted = True
-                link = link.next_node
-                i += 1
-            # Assume index out of range if nothing was inserted.
-            if not inserted:
-                raise IndexError('list index out of range')
+            # The link preceding the given index is what must be altered.
+            link = self._link_at(index - 1)
+            item = self._node(item)
+            item.next_node = link.next_node
+            link.next_node = item
+            if self._size is not None:
+                self._size += 1
+            if self._index is not None:
+                self._index.inserted(index, item)
+            self._version += 1
+            self._index_done()
 
     def pop_left(self):
         """Remove the left most item in the list and return it.
@@ -159,30 +738,45 @@ class LinkedList:
         if self.head is None:
             raise IndexError('pop from empty list')
         else:
+            indexed = self._check_index()
             # Reassign the head to the head's next_node effectively deleting it
-            popped_item = self.head.item
-            self.head = self.head.next_node
-            return popped_item
+            popped = self.head
+            self.head = popped.next_node
+            if self._size is not None:
+                self._size -= 1
+                if self.head is None:
+                    self.tail = None
+            if indexed:
+                self._index.removed(0, popped)
+            if self._members is not None:
+                self._forget(popped.item)
+            self._version += 1
+            self._index_done()
+            return popped.item
 
     def pop_right(self):
         """Remove the right most item in the list and return it.
         """
         if self.head is None:
             raise IndexError('pop from empty list')
-        if self.head.next_node is None:
-            popped_item = self.head.item
-            self.head = None
+        list_length = len(self)
+        popped = self.tail
+        if list_length == 1:
+            self.head, self.tail = None, None
         else:
-            link = self.head
-            while link.next_node is not None:
-                # Detect if the node after the next is the tail because the
-                # preceding node is what must be altered in order to delete it.
-                if link.next_node.next_node is None:
-                    popped_item = link.next_node.item
-                    link.next_node = None
-                else:
-                    link = link.next_node
-        return popped_item
+            # Nodes only link forward, so the node preceding the tail has to
+            # be found from the head in order to delete the tail.
+            link = self._link_at(list_length - 2)
+            link.next_node = None
+            self.tail = link
+        self._size -= 1
+        if self._index is not None:
+            self._index.removed(list_length - 1, popped)
+        if self._members is not None:
+            self._forget(popped.item)
+        self._version += 1
+        self._index_done()
+        return popped.item
 
     def pop(self, index=None):
         """Remove an item at the given index from the list and return it.
@@ -196,30 +790,87 @@ class LinkedList:
                 raise TypeError('list indices must be integers')
             elif self.head is None:
                 raise IndexError('pop from empty list')
+            list_length = len(self)
             # Negative index support.
             if index < 0:
-                index = len(self) + index
+                index = list_length + index
+            if index >= list_length or index < 0:
+                raise IndexError('list index out of range')
             if index == 0:
                 return self.pop_left()
+            elif index == list_length - 1:
+                return self.pop_right()
             else:
-                # Start at 1 rather than 0 for i because the link preceding the
-                # given index is what must be altered.
-                i = 1
-                link = self.head
-                while link is not None:
-                    if i == index:
-                        if link.next_node is not None:
-                            popped_item = link.next_node.item
-                            link.next_node = link.next_node.next_node
-                            return popped_item
-                    link = link.next_node
-                    i += 1
-                # Assume index out of range if function got this far.
-                raise IndexError('list index out of range')
+                # The link preceding the given index is what must be altered.
+                link = self._link_at(index - 1)
+                popped = link.next_node
+                link.next_node = popped.next_node
+                self._size -= 1
+                if self._index is not None:
+                    self._index.removed(index, popped)
+                if self._members is not None:
+                    self._forget(popped.item)
+                self._version += 1
+                self._index_done()
+                return popped.item
+
+    def pop_left_many(self, n):
+        """Remove up to n items from the left of the list and return them as
+        a python list, left to right.
+
+        The nodes are unlinked in one walk and the head moved once.
+        """
+        n = max(0, min(n, len(self)))
+        return self._unlink_run(0, n)
+
+    def pop_right_many(self, n):
+        """Remove up to n items from the right of the list and return them
+        as a python list, right to left.
+
+        The node before them is found in one walk (or through the index),
+        and the tail moved once.
+        """
+        list_length = len(self)
+        n = max(0, min(n, list_length))
+        popped_items = self._unlink_run(list_length - n, n)
+        popped_items.reverse()
+        return popped_items
+
+    def pop_many(self, n):
+        """Remove up to n items from the right of the list, as pop() does,
+        and return them as a python list, right to left.
+        """
+        return self.pop_right_many(n)
+
+    def drain(self):
+        """Remove every item and return them as pop_many() does.
+        """
+        return self.pop_many(len(self))
+
+    def remove(self, item):
+        """Remove the first occurrence of the given item from the list.
+        """
+        if self._members is not None and not self.contains(item):
+            raise ValueError(f'{item!r} is not in list')
+        link = self.head
+        index = 0
+        while link is not None:
+            if link.item == item:
+                self.pop(index)
+                return
+            link = link.next_node
+            index += 1
+        raise ValueError(f'{item!r} is not in list')
 
     def contains(self, item):
         """Return True if the given item is within the list and False otherwise.
         """
+        if self._members is not None:
+            self._check_index()
+            try:
+                return item in self._members
+            except TypeError:
+                pass
         link = self.head
         while link is not None:
             if link.item == item:
@@ -227,6 +878,69 @@ class LinkedList:
             link = link.next_node
         return False
 
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the list.
+        """
+        if self._members is not None:
+            self._check_index()
+            try:
+                return self._members.get(item, 0)
+            except TypeError:
+                pass
+        occurrences = 0
+        link = self.head
+        while link is not None:
+            if link.item == item:
+                occurrences += 1
+            link = link.next_node
+        return occurrences
+
+    def sort(self, key=None, reverse=False):
+        """Sort the list in place, stably, by relinking its nodes.
+
+        Takes the same arguments as list.sort(). No nodes are created or
+        copied: a bottom-up merge sort takes O(n log n) time and O(1) extra
+        memory. key is called for an item each time it is compared in a
+        merge pass, about log2(n) times, rather than just once.
+        """
+        self._relink(merge_sort, len(self), key, reverse)
+
+    def merge(self, other, key=None, reverse=False):
+        """Merge the nodes of another list, sorted in the same way, into
+        this sorted list, leaving other empty.
+
+        Stable, with this list's items first among equals. O(n + m) time;
+        the nodes are relinked rather than copied.
+        """
+        list_length = len(self)
+        other_length = len(other)
+        self.splice(other)
+        if list_length and other_length:
+            self._relink(merge_runs, list_length, other_length, key, reverse)
+
+    def _relink(self, sorter, *args):
+        """Run a mergesort function over the list's nodes and bring the
+        list's caches up to date afterwards, even if it raises.
+        """
+        self._check_index()
+        anchor = Anchor(self.head)
+        try:
+            self.tail = sorter(anchor, *args)
+        except BaseException:
+            # Every node is still linked, but the tail may have moved.
+            self._size = None
+            raise
+        finally:
+            self.head = anchor.next_node
+            self._version += 1
+            # Positions have changed but items have not.
+            if self._index is not None:
+                self._index_stale = True
+            self._index_done()
+
     def py_list(self):
         """Return a python list of all items from head to tail.
         """
@@ -237,6 +951,67 @@ class LinkedList:
             link = link.next_node
         return py_list
 
+    def __reduce__(self):
+        """Pickle as a flat sequence of items rather than a chain of nodes,
+        which would recurse once per node.
+        """
+        return _restore, (type(self), self._state(), list(self._chunks()))
+
+    def _kwargs(self):
+        """Return the keyword arguments to make an empty copy of the list.
+        """
+        return {}
+
+    def _state(self):
+        """Return what, besides its items, is needed to rebuild the list:
+        see _restore().
+
+        A cycle is recorded as the index of the node the tail links back to.
+        """
+        entry, tail_length, _ = self.find_cycle()
+        return {
+            'kwargs': self._kwargs(),
+            'back_edge': None if entry is None else tail_length,
+            'index_spacing': None if self._index is None else self._index.spacing,
+            'member_index': self._members is not None,
+        }
+
+    def _chunks(self):
+        """Iterate over the items in chunks, each node once even if the list
+        has a cycle.
+        """
+        _, tail_length, cycle_length = self.find_cycle()
+        items = (link.item for link in self._forward())
+        return serialize.chunks(itertools.islice(items, tail_length + cycle_length))
+
+    def dump(self, fp):
+        """Write the list to a binary file object, in chunks of items; see
+        serialize.
+        """
+        serialize.dump(fp, (type(self), self._state()), self._chunks())
+
+    @classmethod
+    def load(cls, fp):
+        """Read a list written by dump() from a binary file object.
+        """
+        (saved_class, state), item_chunks = serialize.load(fp)
+        if not issubclass(saved_class, cls):
+            raise TypeError(f'expected a {cls.__name__}, not a {saved_class.__name__}')
+        return _restore(saved_class, state, item_chunks)
+
+    def to_bytes(self):
+        """Return the list as bytes in the format written by dump().
+        """
+        buffer = io.BytesIO()
+        self.dump(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the list held in bytes from to_bytes().
+        """
+        return cls.load(io.BytesIO(data))
+
     def classify(self):
         """Returns one of three strings: 'terminating', 'circle', or 'lollipop'.
 
@@ -271,16 +1046,268 @@ class LinkedList:
     def has_cycle(self):
         """Determine if the list contains a cycle, i.e. if a node points to an earlier
         node in the list, returning True if it does and False otherwise.
+
+        Uses Brent's algorithm: O(n) time and O(1) memory.
         """
-        node_list = []
-        link = self.head
-        while link is not None:
-            if link in node_list:
-                return True
-            else:
-                node_list.append(link)
+        return self.cycle_check().run()
+
+    def cycle_check(self):
+        """Return a CycleCheck which can look for a cycle a few steps at a time.
+        """
+        return CycleCheck(self.head)
+
+    def find_cycle(self):
+        """Return (entry, tail_length, cycle_length) describing the list's shape.
+
+        entry is the first node on the cycle, tail_length the number of nodes
+        before it and cycle_length the number of nodes on the cycle. A circle
+        has a tail_length of 0; a terminating list gives (None, length, 0).
+        Runs in O(n) time and O(1) memory.
+        """
+        check = self.cycle_check()
+        if not check.run():
+            return None, check.steps, 0
+        cycle_length = check.cycle_length
+        # A hare cycle_length nodes ahead of the tortoise meets it exactly
+        # at the first node on the cycle.
+        tort = hare = self.head
+        for _ in range(cycle_length):
+            hare = hare.next_node
+        tail_length = 0
+        while tort is not hare:
+            tort = tort.next_node
+            hare = hare.next_node
+            tail_length += 1
+        return tort, tail_length, cycle_length
+
+
+class CycleCheck:
+    """Resumable cycle check of the nodes starting at head, using Brent's
+    algorithm in O(1) memory.
+
+    run(steps) follows at most steps links and returns True or False once
+    the answer is known, or None if it needs to be run again:
+
+        check = linked.cycle_check()
+        while check.run(10000) is None:
+            ...                     # do other work in between
+
+    Once a cycle is found, cycle_length holds the number of nodes on it.
+    steps counts the nodes visited so far; for a terminating list it ends
+    as the list's length.
+    """
+    def __init__(self, head):
+        self.result = None if head is not None else False
+        self.steps = 0 if head is None else 1
+        self.cycle_length = 0
+        # The tortoise jumps to the hare each time the hare has run a power
+        # of two steps past it, so the hare lands on it within one lap once
+        # both are on the cycle.
+        self._tort = head
+        self._hare = head
+        self._power = 1
+        self._lam = 0
+
+    def run(self, steps=None):
+        """Follow up to steps more links (or as many as needed, if None) and
+        return the result, or None if it is not yet known.
+        """
+        if self.result is not None:
+            return self.result
+        tort, hare = self._tort, self._hare
+        power, lam = self._power, self._lam
+        remaining = steps
+        while remaining is None or remaining > 0:
+            if power == lam:
+                tort = hare
+                power *= 2
+                lam = 0
+            hare = hare.next_node
+            lam += 1
+            if hare is None:
+                self.result = False
+                break
+            if hare is tort:
+                self.result = True
+                self.cycle_length = lam
+                break
+            self.steps += 1
+            if remaining is not None:
+                remaining -= 1
+        self._tort, self._hare = tort, hare
+        self._power, self._lam = power, lam
+        return self.result
+
+
+class SortedLinkedList(LinkedList):
+    """LinkedList which keeps its items in sorted order.
+
+    key and reverse are as for sorted(). add() places each item after any
+    equal to it, finding its place through a positional index (a skip list
+    over the nodes, see enable_index()) in O(log n); contains(), count()
+    and remove() find items the same way. append() and extend() add items.
+
+    Methods which would put an item at a given place, append_left(),
+    insert(), item assignment, splice() and sort(), raise TypeError.
+    """
+    def __init__(self, *items, key=None, reverse=False, spacing=16):
+        super().__init__()
+        self.key = key
+        self.reverse = reverse
+        self.enable_index(spacing)
+        self.extend(items)
+
+    def _key(self, item):
+        return item if self.key is None else self.key(item)
+
+    def _precedes(self, key, other_key):
+        """Return True if an item with key sorts strictly before one with
+        other_key.
+        """
+        if self.reverse:
+            return other_key < key
+        return key < other_key
+
+    def _search(self, before):
+        """Return (position, node) for the last node for which before(node)
+        is True, or (-1, None) if there is none.
+        """
+        if self._check_index():
+            return self._index.search(before, self.head)
+        # Without the index, walk from the head.
+        position, link = -1, None
+        following = self.head
+        while following is not None and before(following):
+            position, link = position + 1, following
+            following = following.next_node
+        return position, link
+
+    def _matches(self, item):
+        """Iterate over (position, node) for each node equal to item.
+        """
+        key = self._key(item)
+        position, link = self._search(
+            lambda node: self._precedes(self._key(node.item), key))
+        link = self.head if link is None else link.next_node
+        position += 1
+        while link is not None and not self._precedes(key, self._key(link.item)):
+            if link.item == item:
+                yield position, link
             link = link.next_node
-        return False
+            position += 1
+
+    def add(self, item):
+        """Insert the given item after any items equal to it.
+        """
+        indexed = self._check_index()
+        if self._size is None:
+            self._sync()
+        key = self._key(item)
+        position, before = self._search(
+            lambda node: not self._precedes(key, self._key(node.item)))
+        node = self._node(item)
+        if before is None:
+            node.next_node = self.head
+            self.head = node
+        else:
+            node.next_node = before.next_node
+            before.next_node = node
+        if node.next_node is None:
+            self.tail = node
+        if self._size is not None:
+            self._size += 1
+        self._version += 1
+        if indexed:
+            self._index.inserted(position + 1, node)
+        self._index_done()
+
+    def append(self, item):
+        """Add an item in its sorted place.
+        """
+        self.add(item)
+
+    def append_right(self, item):
+        self.add(item)
+
+    def extend(self, items):
+        """Add every item from an iterable in its sorted place.
+
+        Many items are sorted together and merged in; a few are added one
+        at a time.
+        """
+        if isinstance(items, LinkedList):
+            items = items.py_list()
+        else:
+            items = list(items)
+        if len(items) * 8 < len(self):
+            for item in items:
+                self.add(item)
+            return
+        other = LinkedList()
+        other.extend(sorted(items, key=self.key, reverse=self.reverse))
+        self.merge(other)
+
+    def merge(self, other):
+        """Merge the nodes of another list, sorted with this list's key and
+        reverse, into this one, leaving other empty.
+        """
+        list_length = len(self)
+        other_length = len(other)
+        LinkedList.splice(self, other)
+        if list_length and other_length:
+            self._relink(merge_runs, list_length, other_length,
+                         self.key, self.reverse)
+
+    def contains(self, item):
+        """Return True if the given item is within the list. False otherwise.
+        """
+        if self._members is not None:
+            return super().contains(item)
+        return next(self._matches(item), None) is not None
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the list.
+        """
+        if self._members is not None:
+            return super().count(item)
+        return sum(1 for _ in self._matches(item))
+
+    def remove(self, item):
+        """Remove the first occurrence of the given item from the list.
+        """
+        match = next(self._matches(item), None)
+        if match is None:
+            raise ValueError(f'{item!r} is not in list')
+        self.pop(match[0])
+
+    def _kwargs(self):
+        return {
+            'key': self.key,
+            'reverse': self.reverse,
+            'spacing': 16 if self._index is None else self._index.spacing,
+        }
+
+    def _fixed_order(self, *args, **kwargs):
+        raise TypeError('SortedLinkedList keeps its own order; use add()')
+
+    append_left = insert = __setitem__ = splice = sort = _fixed_order
+
+
+def _restore(cls, state, item_chunks):
+    """Rebuild a LinkedList, or subclass, from its state and its items.
+    """
+    linked = cls(**state['kwargs'])
+    for chunk in item_chunks:
+        # The items are already in order, even for a SortedLinkedList.
+        LinkedList.extend(linked, chunk)
+    if state['index_spacing'] is not None:
+        linked.enable_index(state['index_spacing'])
+    if state['member_index']:
+        linked.enable_member_index()
+    if state['back_edge'] is not None:
+        # Link the tail back to where the cycle started.
+        linked.tail.next_node = linked._link_at(state['back_edge'])
+    return linked
 
 
 if __name__ == "__main__":
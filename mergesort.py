@@ -0,0 +1,76 @@
+# mergesort.py by nonetypes
+# Last revised on 10/18/2026
+
+
+class Anchor:
+    """Stand-in for the node before a chain's head, so that the head can be
+    relinked like any other node.
+    """
+    __slots__ = ('next_node',)
+
+    def __init__(self, next_node=None):
+        self.next_node = next_node
+
+
+def merge_sort(anchor, length, key=None, reverse=False):
+    """Stably sort the chain of length nodes after anchor by relinking their
+    next_node links, and return the last node.
+
+    Bottom-up: neighbouring runs of 1, 2, 4, ... nodes are merged in place,
+    so the sort takes O(n log n) time and O(1) extra memory. key and reverse
+    are as for sorted(). Nodes are only ever moved from one place in the
+    chain to another, so if key or a comparison raises, the chain after
+    anchor still holds every node, partly sorted.
+    """
+    last = anchor.next_node
+    width = 1
+    while width < length:
+        before = anchor
+        start = 0
+        while start + width < length:
+            last = merge_runs(before, width, min(width, length - start - width),
+                              key, reverse)
+            before = last
+            start += 2 * width
+        width *= 2
+    return last
+
+
+def merge_runs(before, left_count, right_count, key=None, reverse=False):
+    """Stably merge two sorted runs of nodes, the first starting after the
+    node before and the second straight after it, and return the last node
+    of the merged run.
+
+    Nodes of the right run are moved in front of the first left node which
+    sorts after them; left nodes never move. Equal items keep their order.
+    """
+    left = before.next_node
+    right_before = left
+    for _ in range(left_count - 1):
+        right_before = right_before.next_node
+    right = right_before.next_node
+    left_key = left.item if key is None else key(left.item)
+    right_key = right.item if key is None else key(right.item)
+    while True:
+        if (left_key < right_key) if reverse else (right_key < left_key):
+            # Move the right node in front of the left one.
+            after = right.next_node
+            right_before.next_node = after
+            right.next_node = left
+            before.next_node = right
+            before = right
+            right_count -= 1
+            if right_count == 0:
+                return right_before
+            right = after
+            right_key = right.item if key is None else key(right.item)
+        else:
+            before = left
+            left_count -= 1
+            if left_count == 0:
+                # The rest of the right run is already in place.
+                for _ in range(right_count - 1):
+                    right = right.next_node
+                return right
+            left = left.next_node
+            left_key = left.item if key is None else key(left.item)
@@ -0,0 +1,356 @@
+# persistentqueue.py by nonetypes
+# Last revised on 10/18/2026
+
+import mmap
+import os
+import pickle
+import struct
+import time
+import zlib
+
+# Segment header: magic, offset and count of the records already popped,
+# and the total count of records, which is 0 until the segment is sealed.
+HEADER = struct.Struct('<4sQQQ')
+HEADER_SIZE = 32
+MAGIC = b'PQS1'
+# Record header: payload length and CRC-32 of the payload. A length of 0
+# marks the end of the records written so far.
+RECORD = struct.Struct('<II')
+
+
+def _sync_directory(directory):
+    """Make the creation, renaming and removal of files in directory
+    durable.
+    """
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class Segment:
+    """One append-only file of a PersistentQueue, mapped into memory while
+    it is the head or the tail.
+    """
+    def __init__(self, path, number, size=None):
+        self.path = path
+        self.number = number
+        self.map = None
+        if size is not None:
+            # A new segment: the file is made at full size up front, and
+            # its zero bytes read as the end of the records. It is written
+            # and synced under a temporary name and then renamed, so that
+            # a crash never leaves a segment without its header.
+            temporary = path + '.tmp'
+            with open(temporary, 'wb') as file:
+                file.write(HEADER.pack(MAGIC, HEADER_SIZE, 0, 0))
+                file.truncate(size)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, path)
+            _sync_directory(os.path.dirname(path) or '.')
+            self.open()
+        else:
+            self.open()
+            if self.map[:4] != MAGIC:
+                raise ValueError(f'{path} is not a queue segment')
+        self.capacity = len(self.map)
+        sealed_count = self.header[2]
+        if sealed_count:
+            # A sealed segment is never appended to again, so its records
+            # need not be scanned.
+            self.write_offset, self.written = self.capacity, sealed_count
+        else:
+            self.write_offset, self.written = self._scan()
+
+    @staticmethod
+    def is_blank(path):
+        """Return True if the file at path is too short to hold a header or
+        starts with zeros where the magic should be.
+
+        A crash during rollover could leave the newest segment this way
+        before its header was synced ahead of the rename.
+        """
+        with open(path, 'rb') as file:
+            start = file.read(HEADER_SIZE)
+        return len(start) < HEADER_SIZE or not start[:len(MAGIC)].strip(b'\0')
+
+    def open(self):
+        """Map the file into memory.
+        """
+        if self.map is None:
+            with open(self.path, 'r+b') as file:
+                self.map = mmap.mmap(file.fileno(), 0)
+
+    def close(self):
+        """Unmap the file, leaving it to the page cache and the disk.
+        """
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    @property
+    def header(self):
+        """(read_offset, read_count, sealed_count) from the header.
+        """
+        return HEADER.unpack_from(self.map)[1:]
+
+    def set_read(self, read_offset, read_count):
+        HEADER.pack_into(self.map, 0, MAGIC, read_offset, read_count, self.header[2])
+
+    def seal(self):
+        """Record how many records the segment holds; nothing more will be
+        appended to it.
+        """
+        read_offset, read_count, _ = self.header
+        HEADER.pack_into(self.map, 0, MAGIC, read_offset, read_count, self.written)
+
+    def _scan(self):
+        """Return (end offset, count) of the intact records.
+
+        A record cut short by a crash, or whose payload fails its checksum,
+        ends the segment; it and anything after it are zeroed.
+        """
+        offset, count = HEADER_SIZE, 0
+        while offset + RECORD.size <= self.capacity:
+            length, checksum = RECORD.unpack_from(self.map, offset)
+            end = offset + RECORD.size + length
+            if (length == 0 or end > self.capacity
+                    or zlib.crc32(self.map[offset + RECORD.size:end]) != checksum):
+                break
+            offset, count = end, count + 1
+        if offset < self.capacity and self.map[offset:offset + RECORD.size].strip(b'\0'):
+            self.map[offset:] = bytes(self.capacity - offset)
+        return offset, count
+
+    def fits(self, length):
+        return self.write_offset + RECORD.size + length <= self.capacity
+
+    def write(self, payload):
+        offset = self.write_offset
+        end = offset + RECORD.size + len(payload)
+        self.map[offset + RECORD.size:end] = payload
+        # The header goes in last, so a torn write never looks complete.
+        RECORD.pack_into(self.map, offset, len(payload), zlib.crc32(payload))
+        self.write_offset = end
+        self.written += 1
+
+    def read(self, offset):
+        """Return (payload, next offset) for the record at offset.
+        """
+        length, _ = RECORD.unpack_from(self.map, offset)
+        start = offset + RECORD.size
+        return self.map[start:start + length], start + length
+
+    def payloads(self):
+        """Iterate over the payloads of the records not yet popped.
+        """
+        offset, read_count, _ = self.header
+        for _ in range(self.written - read_count):
+            payload, offset = self.read(offset)
+            yield payload
+
+
+class PersistentQueue:
+    """Queue kept on disk in segment files, so that it can outgrow memory
+    and survives restarts. First in, first out.
+
+    Items are pickled into append-only segment files of about segment_size
+    bytes in directory. Only the head segment, popped from, and the tail
+    segment, appended to, are mapped into memory; the segments in between
+    are left to the page cache, which can drop them when memory is short.
+    Popped segments are deleted.
+
+    Opening a directory that already holds segments carries on where the
+    queue was left. A record torn by a crash is dropped, along with any
+    after it in the same segment. A newest segment that is empty or has no
+    header held no records, and is deleted.
+
+    Changes reach the disk when flush() is called, every sync_every appends
+    and pops, and when sync_interval seconds have passed since the last
+    flush (checked on each append and pop). sync_every=1 makes every change
+    durable before it returns; None leaves flushing to flush() and close().
+
+    Not thread-safe.
+    """
+    def __init__(self, directory, segment_size=1 << 22, sync_every=1000,
+                 sync_interval=None):
+        if segment_size < HEADER_SIZE + RECORD.size:
+            raise ValueError('segment_size is too small')
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._dirty_directory = False
+        os.makedirs(directory, exist_ok=True)
+        names = os.listdir(directory)
+        for name in names:
+            if name.endswith('.seg.tmp'):
+                # A segment that was being created when the process died.
+                os.remove(os.path.join(directory, name))
+        numbers = sorted(int(name[:-4]) for name in names
+                         if name.endswith('.seg') and name[:-4].isdigit())
+        if numbers and Segment.is_blank(self._path(numbers[-1])):
+            # Rollover was cut short before the new tail's header reached
+            # the disk; nothing was ever appended to it.
+            os.remove(self._path(numbers.pop()))
+            _sync_directory(directory)
+        if not numbers:
+            self._new_segment(1).close()
+            numbers = [1]
+        # Middle segments are only visited to count their records.
+        self._numbers = numbers
+        self._head = self._open_segment(numbers[0])
+        self._tail = self._head
+        if len(numbers) > 1:
+            self._tail = self._open_segment(numbers[-1])
+        self._size = self._tail.written - self._head.header[1]
+        if self._head is not self._tail:
+            self._size += self._head.written
+        for number in numbers[1:-1]:
+            segment = self._open_segment(number)
+            self._size += segment.written
+            segment.close()
+
+    def __repr__(self):
+        return f'PersistentQueue({self.directory!r}, {self._size} items)'
+
+    def __len__(self):
+        return self._size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _path(self, number):
+        return os.path.join(self.directory, f'{number:020d}.seg')
+
+    def _open_segment(self, number):
+        return Segment(self._path(number), number)
+
+    def _new_segment(self, number, size=None):
+        return Segment(self._path(number), number, max(size or 0, self.segment_size))
+
+    def _changed(self):
+        """Count one change towards the next flush.
+        """
+        self._unsynced += 1
+        if ((self.sync_every is not None and self._unsynced >= self.sync_every)
+                or (self.sync_interval is not None
+                    and time.monotonic() - self._last_sync >= self.sync_interval)):
+            self.flush()
+
+    def append(self, item):
+        """Append an item to the end of the queue.
+        """
+        payload = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        if not self._tail.fits(len(payload)):
+            self._tail.seal()
+            if self._tail is not self._head:
+                # The old tail becomes a cold middle segment.
+                self._tail.map.flush()
+                self._tail.close()
+            number = self._tail.number + 1
+            self._tail = self._new_segment(
+                number, HEADER_SIZE + RECORD.size + len(payload))
+            self._numbers.append(number)
+        self._tail.write(payload)
+        self._size += 1
+        self._changed()
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the queue.
+        """
+        for item in items:
+            self.append(item)
+
+    def pop(self):
+        """Remove the first item from the queue and return it.
+        """
+        if self._size == 0:
+            raise IndexError('pop from empty queue')
+        head = self._head
+        read_offset, read_count, _ = head.header
+        if read_count == head.written:
+            # The head is used up, and as the queue is not empty it is
+            # sealed with a later segment after it.
+            self._drop_head()
+            head = self._head
+            read_offset, read_count, _ = head.header
+        payload, read_offset = head.read(read_offset)
+        head.set_read(read_offset, read_count + 1)
+        self._size -= 1
+        self._changed()
+        return pickle.loads(payload)
+
+    def _drop_head(self):
+        """Delete the used up head segment and map the next one.
+        """
+        old_head = self._head
+        self._numbers.pop(0)
+        if self._numbers[0] == self._tail.number:
+            self._head = self._tail
+        else:
+            self._head = self._open_segment(self._numbers[0])
+        old_head.close()
+        os.remove(old_head.path)
+        self._dirty_directory = True
+
+    def contains(self, item):
+        """Return True if the given item is within the queue. False otherwise.
+
+        Reads every segment, including those on disk.
+        """
+        for payload in self._payloads():
+            if pickle.loads(payload) == item:
+                return True
+        return False
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def __iter__(self):
+        """Iterate over the items from first to last without removing them.
+        """
+        for payload in self._payloads():
+            yield pickle.loads(payload)
+
+    def _payloads(self):
+        for number in list(self._numbers):
+            if number == self._head.number:
+                yield from self._head.payloads()
+            elif number == self._tail.number:
+                yield from self._tail.payloads()
+            else:
+                segment = self._open_segment(number)
+                try:
+                    yield from segment.payloads()
+                finally:
+                    segment.close()
+
+    def flush(self):
+        """Write every change so far through to the disk.
+        """
+        self._head.map.flush()
+        if self._tail is not self._head:
+            self._tail.map.flush()
+        if self._dirty_directory:
+            # Make the removal of segment files durable too.
+            _sync_directory(self.directory)
+            self._dirty_directory = False
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Flush the queue and unmap its segments.
+        """
+        if self._head.map is None:
+            return
+        self.flush()
+        self._head.close()
+        self._tail.close()
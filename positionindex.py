@@ -0,0 +1,206 @@
+# positionindex.py by nonetypes
+# Last revised on 10/18/2026
+
+import random
+
+
+class Lane:
+    """Entry in one level of a PositionIndex.
+
+    Points at a checkpoint node, the entry one level down for the same node,
+    and the next entry on the same level, width positions further along.
+    """
+    __slots__ = ('node', 'width', 'next', 'down')
+
+    def __init__(self, node=None, width=0, next=None, down=None):
+        self.node = node
+        self.width = width
+        self.next = next
+        self.down = down
+
+
+class PositionIndex:
+    """Indexable skip list over the nodes of a linked list.
+
+    Roughly one node in every spacing is a checkpoint on the bottom level,
+    and each level above holds about a quarter of the checkpoints below it.
+    Each entry records how many positions it spans, so locating a position
+    descends the levels in O(log n) and then walks at most a few nodes.
+
+    The index does not own the nodes. The list it belongs to reports every
+    insertion and removal, and calls rebuild() when its nodes may have been
+    relinked behind its back (see tracked_node_class).
+
+    Each level starts with a sentinel entry at position -1 standing in for
+    the list's head, so that every position has an entry before it. The
+    widths along each level add up to len + 1.
+    """
+    # Chance of a checkpoint also appearing on the level above.
+    promote = 4
+
+    def __init__(self, spacing=16):
+        self.spacing = spacing
+        self.size = 0
+        self.top = Lane(width=1)
+
+    def rebuild(self, head):
+        """Rebuild the index from the chain of nodes starting at head.
+        """
+        # Bottom level checkpoints sit every spacing nodes, and every
+        # promote-th checkpoint of a level is also one on the level above.
+        checkpoints = []
+        link = head
+        size = 0
+        while link is not None:
+            size += 1
+            if size % self.spacing == 0:
+                checkpoints.append((size - 1, link))
+            link = link.next_node
+        self.size = size
+        below = None
+        level = checkpoints
+        while True:
+            sentinel = Lane(width=size + 1, down=below)
+            last, last_pos = sentinel, -1
+            lanes = {}
+            for pos, node in level:
+                lane = Lane(node, size - pos, None,
+                            None if below is None else below_lanes[pos])
+                last.width = pos - last_pos
+                last.next = lane
+                last, last_pos = lane, pos
+                lanes[pos] = lane
+            self.top = sentinel
+            if len(level) < self.promote:
+                break
+            below, below_lanes = sentinel, lanes
+            level = level[self.promote - 1::self.promote]
+
+    def _preceding(self, index):
+        """Return [(entry, position)] for the last entry before index on each
+        level, top level first.
+        """
+        preceding = []
+        entry = self.top
+        pos = -1
+        while entry is not None:
+            while entry.next is not None and pos + entry.width < index:
+                pos += entry.width
+                entry = entry.next
+            preceding.append((entry, pos))
+            entry = entry.down
+        return preceding
+
+    def locate(self, index, head):
+        """Return the node at the given position of the list headed by head.
+
+        The position must be in range.
+        """
+        entry = self.top
+        pos = -1
+        while True:
+            while entry.next is not None and pos + entry.width <= index:
+                pos += entry.width
+                entry = entry.next
+            if entry.down is None:
+                break
+            entry = entry.down
+        if entry.node is None:
+            link = head
+            pos = 0
+        else:
+            link = entry.node
+        for _ in range(index - pos):
+            link = link.next_node
+        return link
+
+    def search(self, before, head):
+        """Return (position, node) for the last node of the list headed by
+        head for which before(node) is True, or (-1, None) if there is none.
+
+        before must be True for some run of nodes from the head and False
+        for the rest, as when finding where an item goes in a sorted list.
+        """
+        entry = self.top
+        pos = -1
+        while True:
+            while entry.next is not None and before(entry.next.node):
+                pos += entry.width
+                entry = entry.next
+            if entry.down is None:
+                break
+            entry = entry.down
+        link = entry.node
+        following = head if link is None else link.next_node
+        while following is not None and before(following):
+            link = following
+            pos += 1
+            following = following.next_node
+        return pos, link
+
+    def inserted(self, index, node):
+        """Record that node has been linked in at the given position.
+        """
+        self.size += 1
+        preceding = self._preceding(index)
+        for entry, pos in preceding:
+            entry.width += 1
+        if random.random() * self.spacing >= 1:
+            return
+        # Give the new checkpoint a random height, growing a new top level if
+        # it rises above the current one.
+        height = 1
+        while height < len(preceding) and random.random() * self.promote < 1:
+            height += 1
+        if height == len(preceding) and random.random() * self.promote < 1:
+            self.top = Lane(width=self.size + 1, down=self.top)
+            preceding.insert(0, (self.top, -1))
+            height += 1
+        below = None
+        for entry, pos in reversed(preceding[-height:]):
+            lane = Lane(node, pos + entry.width - index, entry.next, below)
+            entry.width = index - pos
+            entry.next = lane
+            below = lane
+
+    def removed(self, index, node):
+        """Record that node has been unlinked from the given position.
+        """
+        self.size -= 1
+        for entry, pos in self._preceding(index):
+            following = entry.next
+            if (following is not None and following.node is node
+                    and pos + entry.width == index):
+                entry.width += following.width - 1
+                entry.next = following.next
+            else:
+                entry.width -= 1
+        # Drop top levels which no longer hold any checkpoints.
+        while self.top.next is None and self.top.down is not None:
+            self.top = self.top.down
+
+
+def tracked_node_class(node_class, link_names):
+    """Return a new subclass of node_class which counts writes to the named
+    link attributes in its link_writes class attribute, and writes to item
+    in its item_writes class attribute.
+
+    A list switches its nodes to its own such class while it keeps an index
+    of them, so that nodes changed by hand can be noticed.
+    """
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == 'item':
+            tracked.item_writes += 1
+        elif name in link_names:
+            tracked.link_writes += 1
+
+    tracked = type(node_class.__name__, (node_class,), {
+        '__slots__': (),
+        '__doc__': node_class.__doc__,
+        '__module__': node_class.__module__,
+        '__setattr__': __setattr__,
+        'link_writes': 0,
+        'item_writes': 0,
+    })
+    return tracked
@@ -1,22 +1,60 @@
 # queue.py by nonetypes
-# Last revised on 01/29/2021
+# Last revised on 10/18/2026
+
+import collections.abc
+import io
+
+import serialize
+from sliceview import SliceView
+
+try:
+    import numpy
+except ImportError:
+    # Only needed for typed queues, Queue(dtype=...).
+    numpy = None
+
 
 class Queue:
     """List like object. First in, first out.
     Concatenation support between various built-in objects.
+
+    Items are held in a circular buffer which doubles when full and halves
+    once no more than a quarter full, so appends and pops from either end
+    are amortised O(1) and memory is given back after a burst.
+    enable_member_index() makes contains(), `in` and count() O(1).
+    push_many(), pop_many() and drain() move many items at once, with slice
+    operations on the buffer rather than a call per item.
+
+    Queue(*items, dtype=...) makes a TypedQueue, which keeps numbers unboxed
+    in a NumPy array of that dtype.
+
+    items is a QueueItems, a list-like view of the queue: indexing it, or
+    calling append(), pop(), clear() and the other list methods on it,
+    reads and changes the queue itself. Assigning to items replaces the
+    contents.
     """
+    # Buffer capacities are powers of two so positions wrap with a mask.
+    min_capacity = 8
+
+    def __new__(cls, *items, **kwargs):
+        if cls is Queue and kwargs.get('dtype') is not None:
+            cls = TypedQueue
+        return super().__new__(cls)
+
     def __init__(self, *items):
-        self.items = list(items)
+        # Count of each hashable item; see enable_member_index().
+        self._members = None
+        self._load(items)
 
     def __repr__(self):
         """Return a printable string version of self.items
         """
-        return str(self.items)
+        return str(self._item_list())
 
     def __len__(self):
         """Return the len() of self.items
         """
-        return len(self.items)
+        return self._size
 
     def __getitem__(self, index):
         """
@@ -24,13 +62,58 @@ class Queue:
 
             queue = Queue('a', 'b', 'c')
             queue[1]                # returns 'b'
+            queue[::2]              # returns ['a', 'c']
+
+        A slice gives a python list of just the items in it.
         """
-        return self.items[index]
+        if isinstance(index, slice):
+            return list(self._iter_range(range(*index.indices(self._size))))
+        return self._buffer[self._position(index)]
 
     def __setitem__(self, index, new_item):
         """Item assignment.
         """
-        self.items[index] = new_item
+        if isinstance(index, slice):
+            items = self._item_list()
+            items[index] = new_item
+            self._load(items)
+        else:
+            position = self._position(index)
+            if self._members is not None:
+                self._forget(self._buffer[position])
+                self._remember(new_item)
+            self._buffer[position] = new_item
+
+    def __delitem__(self, index):
+        """Item deletion, by index or slice.
+        """
+        if isinstance(index, slice):
+            items = self._item_list()
+            del items[index]
+            self._load(items)
+        else:
+            position = self._position(index)
+            if self._members is not None:
+                self._forget(self._buffer[position])
+            self._delete((position - self._head) & (len(self._buffer) - 1))
+
+    def view(self, *args):
+        """Return a SliceView of the queue without copying it.
+
+        Takes the same arguments as itertools.islice, view(stop) or
+        view(start, stop[, step]), but indices and the step may be negative.
+        """
+        return SliceView(self, slice(*args))
+
+    def _iter_range(self, window):
+        """Iterate over the items at the indices in the given range, which
+        must be in bounds, reading them straight from the buffer.
+        """
+        buffer = self._buffer
+        mask = len(buffer) - 1
+        head = self._head
+        for index in window:
+            yield buffer[(head + index) & mask]
 
     def __add__(self, other_item):
         """
@@ -44,48 +127,1059 @@ class Queue:
             queue + {'a': 1}        # returns [1, 2, 3, {'a': 1}]
         """
         new_queue = Queue()
+        new_queue.items = self._item_list() + self._concat_items(other_item)
+        return new_queue
+
+    def __iadd__(self, other_item):
+        """In place concatenation, following the same rules as +.
+        """
+        self.extend(self._concat_items(other_item))
+        return self
+
+    @staticmethod
+    def _concat_items(other_item):
+        """Return the items other_item contributes to a concatenation.
+        """
         if isinstance(other_item, Queue):
-            for item in self.items + other_item.items:
-                new_queue.append(item)
+            return other_item._item_list()
         elif isinstance(other_item, list):
-            for item in self.items + other_item:
-                new_queue.append(item)
+            return other_item
+        return [other_item]
+
+    def __iter__(self):
+        """Iterate over the items from first to last.
+        """
+        buffer = self._buffer
+        mask = len(buffer) - 1
+        for i in range(self._head, self._head + self._size):
+            yield buffer[i & mask]
+
+    @property
+    def items(self):
+        """A list-like view of the items from first to last.
+
+        Changes made through the view change the queue; assigning an
+        iterable replaces the queue's contents.
+        """
+        return QueueItems(self)
+
+    @items.setter
+    def items(self, items):
+        self._load(items)
+
+    def _item_list(self):
+        """Return a new python list of the items from first to last.
+        """
+        buffer = self._buffer
+        head = self._head
+        end = head + self._size
+        if end <= len(buffer):
+            return buffer[head:end]
+        return buffer[head:] + buffer[:end - len(buffer)]
+
+    def _load(self, items):
+        """Replace the buffer with one holding the given items.
+        """
+        if not isinstance(items, list):
+            items = list(items)
+        capacity = self.min_capacity
+        while capacity < len(items):
+            capacity *= 2
+        self._buffer = items + [None] * (capacity - len(items))
+        self._head = 0
+        self._size = len(items)
+        if self._members is not None:
+            self._members = {}
+            for item in items:
+                self._remember(item)
+
+    def enable_member_index(self):
+        """Keep a count of each hashable item in the queue.
+
+        contains(), `in` and count() then take O(1) for hashable items;
+        unhashable ones are still looked for by scanning the queue.
+        """
+        self._members = {}
+        for item in self:
+            self._remember(item)
+
+    def disable_member_index(self):
+        """Stop keeping a count of the queue's items.
+        """
+        self._members = None
+
+    def _remember(self, item):
+        """Count one more of item in the member index.
+        """
+        try:
+            self._members[item] = self._members.get(item, 0) + 1
+        except TypeError:
+            # Unhashable items are found by scanning the queue instead.
+            pass
+
+    def _forget(self, item):
+        """Count one less of item in the member index.
+        """
+        try:
+            count = self._members[item]
+        except (KeyError, TypeError):
+            return
+        if count == 1:
+            del self._members[item]
         else:
-            for item in self.items + [other_item]:
-                new_queue.append(item)
-        return new_queue
+            self._members[item] = count - 1
+
+    def _resize(self, capacity):
+        """Move the items to the front of a new buffer of the given capacity.
+        """
+        items = self._item_list()
+        self._buffer = items + [None] * (capacity - len(items))
+        self._head = 0
+
+    def _shrink(self):
+        """Halve the buffer, as often as needed, while it is no more than a
+        quarter full.
+        """
+        capacity = len(self._buffer)
+        while capacity > self.min_capacity and self._size <= capacity // 4:
+            capacity //= 2
+        if capacity != len(self._buffer):
+            self._resize(capacity)
+
+    def _position(self, index):
+        """Return the buffer position of the given index.
+        """
+        if not isinstance(index, int):
+            raise TypeError('queue indices must be integers or slices')
+        # Negative index support.
+        if index < 0:
+            index = self._size + index
+        if index >= self._size or index < 0:
+            raise IndexError('queue index out of range')
+        return (self._head + index) & (len(self._buffer) - 1)
+
+    def _find(self, item):
+        """Return the index of the first occurrence of item, or -1.
+        """
+        buffer = self._buffer
+        head = self._head
+        end = head + self._size
+        # The live region may wrap around the end of the buffer, in which
+        # case it is searched as two runs, without copying either.
+        try:
+            return buffer.index(item, head, min(end, len(buffer))) - head
+        except ValueError:
+            pass
+        if end > len(buffer):
+            try:
+                return buffer.index(item, 0, end - len(buffer)) + len(buffer) - head
+            except ValueError:
+                pass
+        return -1
+
+    def _delete(self, index):
+        """Remove the item at the given (non-negative) index.
+
+        Whichever side of the index is shorter is shifted to close the gap.
+        """
+        buffer = self._buffer
+        mask = len(buffer) - 1
+        head = self._head
+        if index < self._size // 2:
+            for i in range(index, 0, -1):
+                buffer[(head + i) & mask] = buffer[(head + i - 1) & mask]
+            buffer[head] = None
+            self._head = (head + 1) & mask
+        else:
+            for i in range(index, self._size - 1):
+                buffer[(head + i) & mask] = buffer[(head + i + 1) & mask]
+            buffer[(head + self._size - 1) & mask] = None
+        self._size -= 1
+        self._shrink()
 
     def append(self, item):
         """Append an item to the end of the queue.
         """
-        self.items += [item]
+        if self._size == len(self._buffer):
+            self._resize(2 * len(self._buffer))
+        self._buffer[(self._head + self._size) & (len(self._buffer) - 1)] = item
+        self._size += 1
+        if self._members is not None:
+            self._remember(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the queue.
+
+        The buffer is grown at most once and the items are copied in with
+        slice assignment rather than one at a time.
+        """
+        items = items._item_list() if isinstance(items, Queue) else list(items)
+        needed = self._size + len(items)
+        capacity = len(self._buffer)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        buffer = self._buffer
+        start = (self._head + self._size) & (capacity - 1)
+        # The free region may wrap around the end of the buffer.
+        first = min(len(items), capacity - start)
+        buffer[start:start + first] = items[:first]
+        buffer[:len(items) - first] = items[first:]
+        self._size = needed
+        if self._members is not None:
+            for item in items:
+                self._remember(item)
+
+    def push_many(self, items):
+        """Append every item from an iterable to the end of the queue, as
+        extend().
+        """
+        self.extend(items)
 
     def pop(self, index=None):
         """Remove an item at given index from the queue and return it.
 
         Remove the first item if index is omitted.
         """
+        if self._size == 0:
+            raise IndexError('pop from empty queue')
         if index is not None:
-            popped_item = self.items[index]
-            del self.items[index]
+            position = self._position(index)
+            popped_item = self._buffer[position]
+            self._delete((position - self._head) & (len(self._buffer) - 1))
         else:
-            popped_item = self.items[0]
-            del self.items[0]
+            popped_item = self._buffer[self._head]
+            # Drop the buffer's reference so the item can be collected.
+            self._buffer[self._head] = None
+            self._head = (self._head + 1) & (len(self._buffer) - 1)
+            self._size -= 1
+            self._shrink()
+        if self._members is not None:
+            self._forget(popped_item)
         return popped_item
 
+    def pop_many(self, n):
+        """Remove up to n items from the front of the queue and return them
+        as a python list, first to last.
+
+        The items are copied out and cleared with slice operations, in two
+        runs if they wrap around the end of the buffer.
+        """
+        n = max(0, min(n, self._size))
+        buffer = self._buffer
+        capacity = len(buffer)
+        head = self._head
+        end = head + n
+        if end <= capacity:
+            popped_items = buffer[head:end]
+            buffer[head:end] = [None] * n
+        else:
+            popped_items = buffer[head:] + buffer[:end - capacity]
+            buffer[head:] = [None] * (capacity - head)
+            buffer[:end - capacity] = [None] * (end - capacity)
+        self._head = end & (capacity - 1)
+        self._size -= n
+        self._shrink()
+        if self._members is not None:
+            for item in popped_items:
+                self._forget(item)
+        return popped_items
+
+    def drain(self):
+        """Remove every item and return them as pop_many() does.
+        """
+        return self.pop_many(len(self))
+
     def remove(self, item):
         """Remove the given item from the queue.
         """
-        del self.items[self.items.index(item)]
+        if self._members is not None:
+            try:
+                missing = item not in self._members
+            except TypeError:
+                missing = False
+            if missing:
+                raise ValueError(f'{item!r} is not in queue')
+        index = self._find(item)
+        if index == -1:
+            raise ValueError(f'{item!r} is not in queue')
+        if self._members is not None:
+            self._forget(self._buffer[self._position(index)])
+        self._delete(index)
+
+    def contains(self, item):
+        """Return True if the given item is within the queue. False otherwise.
+        """
+        if self._members is not None:
+            try:
+                return item in self._members
+            except TypeError:
+                pass
+        return self._find(item) != -1
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the queue.
+        """
+        if self._members is not None:
+            try:
+                return self._members.get(item, 0)
+            except TypeError:
+                pass
+        return sum(1 for queued in self if queued == item)
+
+    def __reduce__(self):
+        """Pickle as a flat sequence of items, leaving out locks and
+        waiters, which are made afresh.
+        """
+        return _restore, (type(self), self._state(), list(self._chunks()))
+
+    def _kwargs(self):
+        """Return the keyword arguments to make an empty copy of the queue.
+        """
+        return {}
+
+    def _state(self):
+        return {
+            'kwargs': self._kwargs(),
+            'member_index': self._members is not None,
+        }
+
+    def _chunks(self):
+        return serialize.chunks(self)
+
+    def dump(self, fp):
+        """Write the queue to a binary file object, in chunks of items; see
+        serialize.
+        """
+        serialize.dump(fp, (type(self), self._state()), self._chunks())
+
+    @classmethod
+    def load(cls, fp):
+        """Read a queue written by dump() from a binary file object.
+        """
+        (saved_class, state), item_chunks = serialize.load(fp)
+        if not issubclass(saved_class, cls):
+            raise TypeError(f'expected a {cls.__name__}, not a {saved_class.__name__}')
+        return _restore(saved_class, state, item_chunks)
+
+    def to_bytes(self):
+        """Return the queue as bytes in the format written by dump().
+        """
+        buffer = io.BytesIO()
+        self.dump(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the queue held in bytes from to_bytes().
+        """
+        return cls.load(io.BytesIO(data))
+
+
+class QueueItems(collections.abc.MutableSequence):
+    """List-like view of a Queue's items, first to last, as given by
+    Queue.items.
+
+    Nothing is copied: every operation is passed on to the queue, so
+    indexing, len() and append() cost what they cost on the queue, and
+    changes are seen by both. insert() anywhere but the end rebuilds the
+    queue's buffer. Compares equal to a list, or another view, holding the
+    same items.
+    """
+    __slots__ = ('queue',)
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    def __repr__(self):
+        return repr(self.queue._item_list())
+
+    def __eq__(self, other):
+        if isinstance(other, QueueItems):
+            other = other.queue._item_list()
+        if not isinstance(other, list):
+            return NotImplemented
+        return self.queue._item_list() == other
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __iter__(self):
+        return iter(self.queue)
+
+    def __contains__(self, item):
+        return self.queue.contains(item)
+
+    def __getitem__(self, index):
+        return self.queue[index]
+
+    def __setitem__(self, index, new_item):
+        self.queue[index] = new_item
+
+    def __delitem__(self, index):
+        del self.queue[index]
+
+    def __add__(self, other):
+        if isinstance(other, QueueItems):
+            other = other.queue._item_list()
+        return self.queue._item_list() + other
+
+    def insert(self, index, item):
+        if index >= len(self.queue):
+            self.queue.append(item)
+        else:
+            self.queue[index:index] = [item]
+
+    def append(self, item):
+        self.queue.append(item)
+
+    def extend(self, items):
+        self.queue.extend(items)
+
+    def pop(self, index=-1):
+        return self.queue.pop(index)
+
+    def remove(self, item):
+        self.queue.remove(item)
+
+    def clear(self):
+        self.queue.drain()
+
+    def count(self, item):
+        return self.queue.count(item)
+
+    def copy(self):
+        """Return the items as a new python list.
+        """
+        return self.queue._item_list()
+
+    def sort(self, *, key=None, reverse=False):
+        items = self.queue._item_list()
+        items.sort(key=key, reverse=reverse)
+        self.queue.items = items
+
+
+class TypedQueue(Queue):
+    """Queue of numbers held unboxed in a NumPy ring buffer of one dtype.
+
+    Made by Queue(*items, dtype=...), e.g. Queue(dtype='f8'), and needs
+    numpy. The buffer grows and shrinks as Queue's does. Indexing reads and
+    writes the array directly, giving NumPy scalars, and slices give NumPy
+    arrays. push_many() and pop_many() move whole arrays in and out, and
+    contains(), count(), sum(), min() and max() are vectorised over the
+    items in the buffer without copying them.
+
+    items is still a list-like view, giving NumPy scalars. There is no
+    member index, and
+    enable_member_index() does nothing; contains() and count() scan the
+    array in C instead.
+    """
+    def __init__(self, *items, dtype):
+        if numpy is None:
+            raise ImportError('Queue(dtype=...) needs numpy')
+        self.dtype = numpy.dtype(dtype)
+        super().__init__(*items)
+
+    def __getitem__(self, index):
+        """
+        Return an item, or a NumPy array of the items in a slice:
+
+            queue = Queue(1, 2, 3, dtype='i8')
+            queue[1]                # returns 2
+            queue[::2]              # returns array([1, 3])
+        """
+        if isinstance(index, slice):
+            window = numpy.arange(*index.indices(self._size))
+            return self._buffer[(self._head + window) & (len(self._buffer) - 1)]
+        return self._buffer[self._position(index)]
+
+    def __add__(self, other_item):
+        """Concatenation support, giving a new TypedQueue of the same dtype.
+        """
+        new_queue = Queue(dtype=self.dtype)
+        new_queue.push_many(self.to_array())
+        new_queue.extend(self._concat_items(other_item))
+        return new_queue
+
+    def _load(self, items):
+        """Replace the buffer with one holding the given items.
+        """
+        items = numpy.asarray(items, dtype=self.dtype).reshape(-1)
+        capacity = self.min_capacity
+        while capacity < len(items):
+            capacity *= 2
+        self._buffer = numpy.empty(capacity, dtype=self.dtype)
+        self._buffer[:len(items)] = items
+        self._head = 0
+        self._size = len(items)
+
+    def _kwargs(self):
+        return {'dtype': self.dtype.str}
+
+    def _chunks(self):
+        for run in self._runs():
+            for start in range(0, len(run), serialize.CHUNK_SIZE):
+                yield run[start:start + serialize.CHUNK_SIZE]
+
+    def enable_member_index(self):
+        """Do nothing. Typed queues keep no member index; contains(), `in`
+        and count() scan the buffer in C instead.
+        """
+
+    def _runs(self):
+        """Return the live region of the buffer as one or two array views,
+        first to last.
+        """
+        buffer = self._buffer
+        head = self._head
+        end = head + self._size
+        if end <= len(buffer):
+            return (buffer[head:end],)
+        return buffer[head:], buffer[:end - len(buffer)]
+
+    def to_array(self):
+        """Return a NumPy array of the items from first to last.
+
+        This is a copy.
+        """
+        runs = self._runs()
+        if len(runs) == 1:
+            return runs[0].copy()
+        return numpy.concatenate(runs)
+
+    def _item_list(self):
+        return self.to_array().tolist()
+
+    def _resize(self, capacity):
+        """Move the items to the front of a new buffer of the given capacity.
+        """
+        buffer = numpy.empty(capacity, dtype=self.dtype)
+        start = 0
+        for run in self._runs():
+            buffer[start:start + len(run)] = run
+            start += len(run)
+        self._buffer = buffer
+        self._head = 0
+
+    def _find(self, item):
+        """Return the index of the first occurrence of item, or -1.
+        """
+        start = 0
+        for run in self._runs():
+            hits = numpy.flatnonzero(run == item)
+            if len(hits):
+                return start + int(hits[0])
+            start += len(run)
+        return -1
+
+    def _delete(self, index):
+        """Remove the item at the given (non-negative) index.
+        """
+        self._load(numpy.delete(self.to_array(), index))
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the queue.
+        """
+        if isinstance(items, TypedQueue):
+            items = items.to_array()
+        elif isinstance(items, Queue):
+            items = items._item_list()
+        self.push_many(items)
+
+    def push_many(self, items):
+        """Append every number in an array (or anything numpy.asarray()
+        accepts) to the end of the queue, in at most two copies.
+        """
+        items = numpy.asarray(items, dtype=self.dtype).reshape(-1)
+        needed = self._size + len(items)
+        capacity = len(self._buffer)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        buffer = self._buffer
+        start = (self._head + self._size) & (capacity - 1)
+        # The free region may wrap around the end of the buffer.
+        first = min(len(items), capacity - start)
+        buffer[start:start + first] = items[:first]
+        buffer[:len(items) - first] = items[first:]
+        self._size = needed
+
+    def pop(self, index=None):
+        """Remove an item at given index from the queue and return it.
+
+        Remove the first item if index is omitted.
+        """
+        if self._size == 0:
+            raise IndexError('pop from empty queue')
+        if index is not None:
+            position = self._position(index)
+            popped_item = self._buffer[position]
+            self._delete((position - self._head) & (len(self._buffer) - 1))
+            return popped_item
+        popped_item = self._buffer[self._head]
+        self._head = (self._head + 1) & (len(self._buffer) - 1)
+        self._size -= 1
+        self._shrink()
+        return popped_item
+
+    def pop_many(self, n):
+        """Remove up to n items from the front of the queue and return them
+        as a NumPy array, first to last.
+        """
+        n = max(0, min(n, self._size))
+        head = self._head
+        end = head + n
+        buffer = self._buffer
+        if end <= len(buffer):
+            popped_items = buffer[head:end].copy()
+        else:
+            popped_items = numpy.concatenate((buffer[head:], buffer[:end - len(buffer)]))
+        self._head = end & (len(buffer) - 1)
+        self._size -= n
+        self._shrink()
+        return popped_items
 
     def contains(self, item):
         """Return True if the given item is within the queue. False otherwise.
         """
-        if item in self.items:
-            return True
+        return any(bool((run == item).any()) for run in self._runs())
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the queue.
+        """
+        return sum(int(numpy.count_nonzero(run == item)) for run in self._runs())
+
+    def sum(self):
+        """Return the sum of the items.
+        """
+        return sum((run.sum() for run in self._runs()), self.dtype.type(0))
+
+    def min(self):
+        """Return the smallest item, raising ValueError if the queue is empty.
+        """
+        if self._size == 0:
+            raise ValueError('min() of empty queue')
+        return min(run.min() for run in self._runs())
+
+    def max(self):
+        """Return the largest item, raising ValueError if the queue is empty.
+        """
+        if self._size == 0:
+            raise ValueError('max() of empty queue')
+        return max(run.max() for run in self._runs())
+
+
+class AggregateQueue(Queue):
+    """Queue which can give the min and max of its items, and a reduction
+    of them by a given associative function, each in O(1) amortised.
+
+    The aggregates are kept as in a queue made of two stacks. The items
+    at the front have the min, max and reduction of themselves and every
+    item behind them up to the end of the front, held as stacks which pop
+    with the items; the items appended since make up the back, with one
+    running min, max and reduction. When the front runs out, it is made
+    afresh from every item in the queue, which is O(n) but happens at most
+    once per n pops. Changes away from the ends (pop(index), remove(), item
+    assignment and deletion) remake the front too.
+
+    Items must be comparable with each other.
+
+        queue = AggregateQueue(3, 1, 2, reduce=operator.add)
+        queue.pop()             # returns 3
+        queue.min()             # returns 1
+        queue.reduce()          # returns 3
+    """
+    def __init__(self, *items, reduce=None):
+        self.reduce_function = reduce
+        super().__init__(*items)
+
+    def _kwargs(self):
+        return {'reduce': self.reduce_function}
+
+    def _load(self, items):
+        super()._load(items)
+        self._refront()
+
+    def _refront(self):
+        """Make every item part of the front, leaving the back empty.
+        """
+        mins, maxes, reductions = [], [], []
+        function = self.reduce_function
+        # Built from the last item to the first, so that each list ends
+        # with the aggregates for the first item, which pop first.
+        for item in self._iter_range(range(self._size - 1, -1, -1)):
+            if not mins:
+                mins.append(item)
+                maxes.append(item)
+                reductions.append(item)
+                continue
+            mins.append(item if item < mins[-1] else mins[-1])
+            maxes.append(item if item > maxes[-1] else maxes[-1])
+            reductions.append(None if function is None
+                              else function(item, reductions[-1]))
+        self._front_mins, self._front_maxes = mins, maxes
+        self._front_reductions = reductions
+        self._back_min = self._back_max = self._back_reduction = None
+        self._back_size = 0
+
+    def _fold(self, item):
+        """Take a newly appended item into the back's aggregates.
+        """
+        self._back_size += 1
+        if self._back_size == 1:
+            self._back_min = self._back_max = self._back_reduction = item
+            return
+        if item < self._back_min:
+            self._back_min = item
+        if item > self._back_max:
+            self._back_max = item
+        if self.reduce_function is not None:
+            self._back_reduction = self.reduce_function(self._back_reduction, item)
+
+    def __setitem__(self, index, new_item):
+        super().__setitem__(index, new_item)
+        self._refront()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._refront()
+
+    def append(self, item):
+        """Append an item to the end of the queue.
+        """
+        super().append(item)
+        self._fold(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the queue.
+        """
+        list_length = self._size
+        super().extend(items)
+        for item in self._iter_range(range(list_length, self._size)):
+            self._fold(item)
+
+    def pop(self, index=None):
+        """Remove an item at given index from the queue and return it.
+
+        Remove the first item if index is omitted.
+        """
+        first = index is None or index in (0, -self._size)
+        popped_item = super().pop(index)
+        if first and self._front_mins:
+            self._front_mins.pop()
+            self._front_maxes.pop()
+            self._front_reductions.pop()
+        else:
+            self._refront()
+        return popped_item
+
+    def pop_many(self, n):
+        """Remove up to n items from the front of the queue and return them
+        as a python list, first to last.
+        """
+        popped_items = super().pop_many(n)
+        front = len(self._front_mins)
+        if len(popped_items) <= front:
+            keep = front - len(popped_items)
+            del self._front_mins[keep:], self._front_maxes[keep:]
+            del self._front_reductions[keep:]
+        else:
+            self._refront()
+        return popped_items
+
+    def remove(self, item):
+        """Remove the given item from the queue.
+        """
+        super().remove(item)
+        self._refront()
+
+    def _aggregate(self, front, back, combine):
+        """Return the aggregate of the front and back of a queue which is
+        not empty.
+        """
+        if not self._back_size:
+            return front[-1]
+        if not front:
+            return back
+        return combine(front[-1], back)
+
+    def min(self):
+        """Return the smallest item, raising ValueError if the queue is empty.
+        """
+        if self._size == 0:
+            raise ValueError('min() of empty queue')
+        return self._aggregate(self._front_mins, self._back_min, min)
+
+    def max(self):
+        """Return the largest item, raising ValueError if the queue is empty.
+        """
+        if self._size == 0:
+            raise ValueError('max() of empty queue')
+        return self._aggregate(self._front_maxes, self._back_max, max)
+
+    def reduce(self):
+        """Return the items reduced by the reduce function, first to last,
+        as functools.reduce() would. Raises ValueError if the queue is empty.
+        """
+        if self.reduce_function is None:
+            raise TypeError('queue was made without a reduce function')
+        if self._size == 0:
+            raise ValueError('reduce() of empty queue')
+        return self._aggregate(self._front_reductions, self._back_reduction,
+                               self.reduce_function)
+
+
+class PriorityQueue:
+    """Queue which pops its item of lowest priority first.
+
+    Items are held in a d-ary heap (arity children per node, 4 by default)
+    alongside a dict of each item's position in it, so append(), pop(),
+    remove() and update_priority() are O(log n) and contains() is O(1).
+    Items of equal priority pop in the order they were added.
+
+    An item's priority is given to append(), or else is key(item), or else
+    the item itself. Items must be hashable, and each may be queued only
+    once; update_priority() changes the priority of one already queued.
+
+        queue = PriorityQueue()
+        queue.append('write', 2)
+        queue.append('read', 1)
+        queue.update_priority('write', 0)
+        queue.pop()             # returns 'write'
+
+    Not thread-safe.
+    """
+    def __init__(self, *items, key=None, arity=4):
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
+        self.key = key
+        self.arity = arity
+        # (priority, order added, item) tuples; the order added is unique,
+        # so items themselves are never compared.
+        self._heap = []
+        # Heap position of each item.
+        self._positions = {}
+        self._added = 0
+        self.extend(items)
+
+    def __repr__(self):
+        """Return a printable string version of self.items
+        """
+        return str(self.items)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        """Iterate over the items in the order they would be popped.
+        """
+        return iter(self.items)
+
+    @property
+    def items(self):
+        """A python list of the items in the order they would be popped.
+
+        This is a copy, made by sorting the heap.
+        """
+        return [entry[2] for entry in sorted(self._heap)]
+
+    def _priority(self, item):
+        return item if self.key is None else self.key(item)
+
+    def _sift_up(self, index):
+        """Move the entry at index up the heap to where it belongs.
+        """
+        heap = self._heap
+        positions = self._positions
+        arity = self.arity
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            parent_entry = heap[parent]
+            if not entry < parent_entry:
+                break
+            heap[index] = parent_entry
+            positions[parent_entry[2]] = index
+            index = parent
+        heap[index] = entry
+        positions[entry[2]] = index
+
+    def _sift_down(self, index):
+        """Move the entry at index down the heap to where it belongs.
+        """
+        heap = self._heap
+        positions = self._positions
+        arity = self.arity
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            # The least of the children, found by min() over a slice rather
+            # than compared one by one in python.
+            children = heap[first:first + arity]
+            child_entry = min(children)
+            child = first + children.index(child_entry)
+            if not child_entry < entry:
+                break
+            heap[index] = child_entry
+            positions[child_entry[2]] = index
+            index = child
+        heap[index] = entry
+        positions[entry[2]] = index
+
+    def append(self, item, priority=None):
+        """Add an item with the given priority, or by default key(item) or
+        the item itself.
+
+        Raises ValueError if the item is already queued.
+        """
+        if item in self._positions:
+            raise ValueError(f'{item!r} is already in queue; use update_priority()')
+        if priority is None:
+            priority = self._priority(item)
+        self._heap.append((priority, self._added, item))
+        self._added += 1
+        self._sift_up(len(self._heap) - 1)
+
+    def extend(self, items):
+        """Add every item from an iterable, each with the priority append()
+        would give it.
+
+        Raises ValueError, adding nothing, if any item is already queued or
+        given twice. Many items at once are heapified in O(n) rather than
+        added one by one.
+        """
+        items = list(items)
+        if len(set(items)) != len(items) or any(item in self._positions
+                                                for item in items):
+            raise ValueError('an item is already in queue')
+        heap = self._heap
+        start = len(heap)
+        for item in items:
+            heap.append((self._priority(item), self._added, item))
+            self._added += 1
+        if len(items) > start:
+            # Floyd's heap construction over everything.
+            for index, entry in enumerate(heap):
+                self._positions[entry[2]] = index
+            for index in reversed(range((len(heap) - 2) // self.arity + 1)):
+                self._sift_down(index)
+        else:
+            for index in range(start, len(heap)):
+                self._sift_up(index)
+
+    def push_many(self, items):
+        """Add every item from an iterable, as extend().
+        """
+        self.extend(items)
+
+    def peek(self):
+        """Return the item which would be popped next, without removing it.
+        """
+        if not self._heap:
+            raise IndexError('peek at empty queue')
+        return self._heap[0][2]
+
+    def pop(self):
+        """Remove the item of lowest priority from the queue and return it.
+        """
+        heap = self._heap
+        if not heap:
+            raise IndexError('pop from empty queue')
+        top = heap[0]
+        last = heap.pop()
+        del self._positions[top[2]]
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return top[2]
+
+    def pop_many(self, n):
+        """Remove up to n items of lowest priority and return them as a
+        python list, in the order they would be popped.
+        """
+        if n >= len(self._heap):
+            return self.drain()
+        return [self.pop() for _ in range(max(0, n))]
+
+    def drain(self):
+        """Remove every item and return them as pop_many() does.
+        """
+        popped_items = self.items
+        self._heap = []
+        self._positions = {}
+        return popped_items
+
+    def priority(self, item):
+        """Return the priority the given item is queued with.
+        """
+        try:
+            return self._heap[self._positions[item]][0]
+        except KeyError:
+            raise ValueError(f'{item!r} is not in queue') from None
+
+    def update_priority(self, item, priority):
+        """Change the priority of a queued item, keeping its place among
+        items of equal priority.
+        """
+        try:
+            index = self._positions[item]
+        except KeyError:
+            raise ValueError(f'{item!r} is not in queue') from None
+        old_entry = self._heap[index]
+        new_entry = (priority, old_entry[1], item)
+        self._heap[index] = new_entry
+        if new_entry < old_entry:
+            self._sift_up(index)
         else:
+            self._sift_down(index)
+
+    def remove(self, item):
+        """Remove the given item from the queue.
+        """
+        try:
+            index = self._positions.pop(item)
+        except KeyError:
+            raise ValueError(f'{item!r} is not in queue') from None
+        heap = self._heap
+        removed = heap[index]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            if last < removed:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+
+    def contains(self, item):
+        """Return True if the given item is within the queue. False otherwise.
+        """
+        try:
+            return item in self._positions
+        except TypeError:
             return False
 
+    def __contains__(self, item):
+        return self.contains(item)
+
+
+def _restore(cls, state, item_chunks):
+    """Rebuild a Queue, or subclass, from its state and its items.
+    """
+    queue = cls(**state['kwargs'])
+    for chunk in item_chunks:
+        queue.extend(chunk)
+    if state['member_index']:
+        queue.enable_member_index()
+    return queue
+
 
 if __name__ == "__main__":
     queue = Queue(1, 2, 3)
@@ -0,0 +1,61 @@
+# serialize.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Chunked binary format shared by the containers' dump() and load().
+
+A dump is a series of pickles on one file object: a header describing the
+container, then its items in chunks of up to CHUNK_SIZE, then an empty
+chunk marking the end. Items are never all held in one pickle, so neither
+writing nor reading needs the whole sequence in memory at once, and
+several dumps can follow each other in one file.
+
+As with pickle, only load data from a source you trust.
+"""
+import itertools
+import pickle
+
+# Items per chunk written by dump().
+CHUNK_SIZE = 1 << 16
+
+
+def chunks(items, size=CHUNK_SIZE):
+    """Iterate over lists of up to size items taken in turn from items.
+    """
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def dump(fp, header, item_chunks):
+    """Write header and then each chunk of items to a binary file object.
+    """
+    pickler = pickle.Pickler(fp, pickle.HIGHEST_PROTOCOL)
+    pickler.dump(header)
+    for chunk in item_chunks:
+        if len(chunk):
+            pickler.dump(chunk)
+            # Otherwise the pickler keeps every item written alive.
+            pickler.clear_memo()
+    pickler.dump([])
+
+
+def load(fp):
+    """Read a dump from a binary file object.
+
+    Returns the header and an iterator over the chunks of items, which
+    reads them from fp as it goes and must be used up before fp is read
+    again.
+    """
+    unpickler = pickle.Unpickler(fp)
+    header = unpickler.load()
+
+    def item_chunks():
+        while True:
+            chunk = unpickler.load()
+            if not len(chunk):
+                return
+            yield chunk
+    return header, item_chunks()
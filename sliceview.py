@@ -0,0 +1,47 @@
+# sliceview.py by nonetypes
+# Last revised on 10/18/2026
+
+
+class SliceView:
+    """Lazy window onto a slice of a container, in the manner of
+    itertools.islice but allowing negative indices and steps.
+
+    Nothing is copied: iterating the view walks the container's own storage
+    once, and indexing the view indexes the container. Iteration yields
+    what iterating the container yields.
+
+    The window is worked out against the container's length each time the
+    view is used, so a view of linked[-10:] always shows the last ten
+    items. Slicing a view gives a view of fixed indices. Changing the
+    container while iterating a view of it is not supported.
+
+    Containers provide view() to make one and _iter_range(window), which
+    iterates over the given in-bounds range of indices.
+    """
+    __slots__ = ('container', 'window')
+
+    def __init__(self, container, window):
+        self.container = container
+        # A slice, or a range of indices fixed when the view was made.
+        self.window = window
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)})'
+
+    def range(self):
+        """Return the range of the container's indices in the window.
+        """
+        if isinstance(self.window, range):
+            return self.window
+        return range(*self.window.indices(len(self.container)))
+
+    def __len__(self):
+        return len(self.range())
+
+    def __iter__(self):
+        return self.container._iter_range(self.range())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SliceView(self.container, self.range()[index])
+        return self.container[self.range()[index]]
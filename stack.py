@@ -1,12 +1,41 @@
 # stack.py by nonetypes
-# Last revised on 01/29/2021
+# Last revised on 10/18/2026
+
+import io
+
+import serialize
+from sliceview import SliceView
+
+try:
+    import numpy
+except ImportError:
+    # Only needed for typed stacks, Stack(dtype=...).
+    numpy = None
+
 
 class Stack:
     """List like object. Last in, first out.
     Concatenation support between various built-in objects.
+
+    enable_member_index() makes contains(), `in` and count() O(1). Changes
+    made to self.items directly are not seen by the index; call
+    enable_member_index() again afterwards to rebuild it.
+
+    push_many(), pop_many() and drain() move many items at once, with one
+    slice operation on the list rather than a call per item.
+
+    Stack(*items, dtype=...) makes a TypedStack, which keeps numbers unboxed
+    in a NumPy array of that dtype.
     """
+    def __new__(cls, *items, **kwargs):
+        if cls is Stack and kwargs.get('dtype') is not None:
+            cls = TypedStack
+        return super().__new__(cls)
+
     def __init__(self, *items):
         self.items = list(items)
+        # Count of each hashable item; see enable_member_index().
+        self._members = None
 
     def __repr__(self):
         """Return a printable string version of self.items
@@ -24,13 +53,47 @@ class Stack:
 
             stack = Stack('a', 'b', 'c')
             stack[1]                # returns 'b'
+            stack[::2]              # returns ['a', 'c']
         """
         return self.items[index]
 
     def __setitem__(self, index, new_item):
         """Item assignment.
         """
-        self.items[index] = new_item
+        if self._members is None:
+            self.items[index] = new_item
+        elif isinstance(index, slice):
+            self.items[index] = new_item
+            self.enable_member_index()
+        else:
+            self._forget(self.items[index])
+            self.items[index] = new_item
+            self._remember(new_item)
+
+    def __delitem__(self, index):
+        """Item deletion, by index or slice.
+        """
+        if self._members is not None:
+            if isinstance(index, slice):
+                for item in self.items[index]:
+                    self._forget(item)
+            else:
+                self._forget(self.items[index])
+        del self.items[index]
+
+    def view(self, *args):
+        """Return a SliceView of the stack without copying it.
+
+        Takes the same arguments as itertools.islice, view(stop) or
+        view(start, stop[, step]), but indices and the step may be negative.
+        """
+        return SliceView(self, slice(*args))
+
+    def _iter_range(self, window):
+        """Iterate over the items at the indices in the given range, which
+        must be in bounds.
+        """
+        return map(self.items.__getitem__, window)
 
     def __add__(self, other_item):
         """
@@ -44,21 +107,83 @@ class Stack:
             stack + {'a': 1}        # returns [1, 2, 3, {'a': 1}]
         """
         new_stack = Stack()
+        new_stack.items = self.items + self._concat_items(other_item)
+        return new_stack
+
+    def __iadd__(self, other_item):
+        """In place concatenation, following the same rules as +.
+        """
+        self.extend(self._concat_items(other_item))
+        return self
+
+    @staticmethod
+    def _concat_items(other_item):
+        """Return the items other_item contributes to a concatenation.
+        """
         if isinstance(other_item, Stack):
-            for item in self.items + other_item.items:
-                new_stack.append(item)
+            return other_item.items
         elif isinstance(other_item, list):
-            for item in self.items + other_item:
-                new_stack.append(item)
+            return other_item
+        return [other_item]
+
+    def enable_member_index(self):
+        """Keep a count of each hashable item in the stack.
+
+        contains(), `in` and count() then take O(1) for hashable items;
+        unhashable ones are still looked for by scanning the stack.
+        """
+        self._members = {}
+        for item in self.items:
+            self._remember(item)
+
+    def disable_member_index(self):
+        """Stop keeping a count of the stack's items.
+        """
+        self._members = None
+
+    def _remember(self, item):
+        """Count one more of item in the member index.
+        """
+        try:
+            self._members[item] = self._members.get(item, 0) + 1
+        except TypeError:
+            # Unhashable items are found by scanning the stack instead.
+            pass
+
+    def _forget(self, item):
+        """Count one less of item in the member index.
+        """
+        try:
+            count = self._members[item]
+        except (KeyError, TypeError):
+            return
+        if count == 1:
+            del self._members[item]
         else:
-            for item in self.items + [other_item]:
-                new_stack.append(item)
-        return new_stack
+            self._members[item] = count - 1
 
     def append(self, item):
         """Append an item to the end of the stack.
         """
-        self.items += [item]
+        self.items.append(item)
+        if self._members is not None:
+            self._remember(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the stack.
+        """
+        if isinstance(items, Stack):
+            items = items.items
+        if self._members is not None:
+            items = list(items)
+            for item in items:
+                self._remember(item)
+        self.items.extend(items)
+
+    def push_many(self, items):
+        """Push every item from an iterable onto the stack, as extend().
+        """
+        self.extend(items)
 
     def pop(self, index=None):
         """Remove an item at given index from the stack and return it.
@@ -71,21 +196,509 @@ class Stack:
         else:
             popped_item = self.items[-1]
             del self.items[-1]
+        if self._members is not None:
+            self._forget(popped_item)
         return popped_item
 
+    def pop_many(self, n):
+        """Remove up to n items from the top of the stack and return them as
+        a python list, last pushed first.
+
+        The items are taken off with one slice deletion.
+        """
+        start = max(0, len(self.items) - max(0, n))
+        popped_items = self.items[start:]
+        del self.items[start:]
+        popped_items.reverse()
+        if self._members is not None:
+            for item in popped_items:
+                self._forget(item)
+        return popped_items
+
+    def drain(self):
+        """Remove every item and return them as pop_many() does.
+        """
+        return self.pop_many(len(self))
+
     def remove(self, item):
         """Remove the given item from the stack.
         """
-        del self.items[self.items.index(item)]
+        if self._members is not None:
+            try:
+                missing = item not in self._members
+            except TypeError:
+                missing = False
+            if missing:
+                raise ValueError(f'{item!r} is not in stack')
+        index = self.items.index(item)
+        if self._members is not None:
+            self._forget(self.items[index])
+        del self.items[index]
 
     def contains(self, item):
         """Return True if the given item is within the stack. False otherwise.
         """
+        if self._members is not None:
+            try:
+                return item in self._members
+            except TypeError:
+                pass
         if item in self.items:
             return True
         else:
             return False
 
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the stack.
+        """
+        if self._members is not None:
+            try:
+                return self._members.get(item, 0)
+            except TypeError:
+                pass
+        return self.items.count(item)
+
+    def __reduce__(self):
+        """Pickle as a flat sequence of items, leaving out locks and
+        waiters, which are made afresh.
+        """
+        return _restore, (type(self), self._state(), list(self._chunks()))
+
+    def _kwargs(self):
+        """Return the keyword arguments to make an empty copy of the stack.
+        """
+        return {}
+
+    def _state(self):
+        return {
+            'kwargs': self._kwargs(),
+            'member_index': self._members is not None,
+        }
+
+    def _chunks(self):
+        return serialize.chunks(self.items)
+
+    def dump(self, fp):
+        """Write the stack to a binary file object, in chunks of items; see
+        serialize.
+        """
+        serialize.dump(fp, (type(self), self._state()), self._chunks())
+
+    @classmethod
+    def load(cls, fp):
+        """Read a stack written by dump() from a binary file object.
+        """
+        (saved_class, state), item_chunks = serialize.load(fp)
+        if not issubclass(saved_class, cls):
+            raise TypeError(f'expected a {cls.__name__}, not a {saved_class.__name__}')
+        return _restore(saved_class, state, item_chunks)
+
+    def to_bytes(self):
+        """Return the stack as bytes in the format written by dump().
+        """
+        buffer = io.BytesIO()
+        self.dump(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the stack held in bytes from to_bytes().
+        """
+        return cls.load(io.BytesIO(data))
+
+
+class TypedStack(Stack):
+    """Stack of numbers held unboxed in a growable NumPy array of one dtype.
+
+    Made by Stack(*items, dtype=...), e.g. Stack(dtype='i8'), and needs
+    numpy. The array doubles when full and halves once no more than a
+    quarter full. Indexing reads and writes the array directly, giving
+    NumPy scalars, and slices give NumPy arrays. push_many() and pop_many()
+    move whole arrays in and out, and contains(), count(), sum(), min() and
+    max() are vectorised over the items without copying them.
+
+    items is a python list copy rather than the storage itself, and there
+    is no member index: enable_member_index() does nothing, as contains()
+    and count() scan the array in C instead.
+    """
+    min_capacity = 8
+
+    def __init__(self, *items, dtype):
+        if numpy is None:
+            raise ImportError('Stack(dtype=...) needs numpy')
+        self.dtype = numpy.dtype(dtype)
+        super().__init__(*items)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Iterate over the items from first pushed to last.
+        """
+        return iter(self._array[:self._size])
+
+    def __getitem__(self, index):
+        """
+        Return an item, or a NumPy array of the items in a slice:
+
+            stack = Stack(1, 2, 3, dtype='i8')
+            stack[1]                # returns 2
+            stack[::2]              # returns array([1, 3])
+        """
+        if isinstance(index, slice):
+            return self._array[:self._size][index].copy()
+        return self._array[self._position(index)]
+
+    def __setitem__(self, index, new_item):
+        """Item assignment.
+        """
+        if isinstance(index, slice):
+            items = self.items
+            items[index] = new_item
+            self._load(items)
+        else:
+            self._array[self._position(index)] = new_item
+
+    def __delitem__(self, index):
+        """Item deletion, by index or slice.
+        """
+        if not isinstance(index, slice):
+            index = self._position(index)
+        self._load(numpy.delete(self._array[:self._size], index))
+
+    def __add__(self, other_item):
+        """Concatenation support, giving a new TypedStack of the same dtype.
+        """
+        new_stack = Stack(dtype=self.dtype)
+        new_stack.push_many(self._array[:self._size])
+        new_stack.extend(self._concat_items(other_item))
+        return new_stack
+
+    @property
+    def items(self):
+        """A python list of the items from first pushed to last.
+
+        This is a copy; assigning a new list replaces the stack's contents.
+        """
+        return self._array[:self._size].tolist()
+
+    @items.setter
+    def items(self, items):
+        self._load(items)
+
+    def _load(self, items):
+        """Replace the array with one holding the given items.
+        """
+        items = numpy.asarray(items, dtype=self.dtype).reshape(-1)
+        capacity = self.min_capacity
+        while capacity < len(items):
+            capacity *= 2
+        self._array = numpy.empty(capacity, dtype=self.dtype)
+        self._array[:len(items)] = items
+        self._size = len(items)
+
+    def _resize(self, capacity):
+        """Move the items into a new array of the given capacity.
+        """
+        array = numpy.empty(capacity, dtype=self.dtype)
+        array[:self._size] = self._array[:self._size]
+        self._array = array
+
+    def _shrink(self):
+        """Halve the array, as often as needed, while it is no more than a
+        quarter full.
+        """
+        capacity = len(self._array)
+        while capacity > self.min_capacity and self._size <= capacity // 4:
+            capacity //= 2
+        if capacity != len(self._array):
+            self._resize(capacity)
+
+    def _position(self, index):
+        """Return the array position of the given index.
+        """
+        if not isinstance(index, int):
+            raise TypeError('stack indices must be integers or slices')
+        # Negative index support.
+        if index < 0:
+            index = self._size + index
+        if index >= self._size or index < 0:
+            raise IndexError('stack index out of range')
+        return index
+
+    def _iter_range(self, window):
+        """Iterate over the items at the indices in the given range, which
+        must be in bounds.
+        """
+        if not window:
+            return iter(())
+        # A range stepping down to index 0 stops at -1, which as a slice
+        # bound would mean the last item.
+        stop = window.stop if window.stop >= 0 else None
+        return iter(self._array[window.start:stop:window.step])
+
+    def _kwargs(self):
+        return {'dtype': self.dtype.str}
+
+    def _chunks(self):
+        for start in range(0, self._size, serialize.CHUNK_SIZE):
+            yield self._array[start:min(start + serialize.CHUNK_SIZE, self._size)]
+
+    def enable_member_index(self):
+        """Do nothing. Typed stacks keep no member index; contains(), `in`
+        and count() scan the array in C instead.
+        """
+
+    def to_array(self):
+        """Return a NumPy array of the items from first pushed to last.
+
+        This is a copy.
+        """
+        return self._array[:self._size].copy()
+
+    def append(self, item):
+        """Append an item to the end of the stack.
+        """
+        if self._size == len(self._array):
+            self._resize(2 * len(self._array))
+        self._array[self._size] = item
+        self._size += 1
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the stack.
+        """
+        if isinstance(items, TypedStack):
+            items = items._array[:items._size]
+        elif isinstance(items, Stack):
+            items = items.items
+        self.push_many(items)
+
+    def push_many(self, items):
+        """Push every number in an array (or anything numpy.asarray()
+        accepts) onto the stack in one copy.
+        """
+        items = numpy.asarray(items, dtype=self.dtype).reshape(-1)
+        needed = self._size + len(items)
+        capacity = len(self._array)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        self._array[self._size:needed] = items
+        self._size = needed
+
+    def pop(self, index=None):
+        """Remove an item at given index from the stack and return it.
+
+        Remove the last item if index is omitted.
+        """
+        if self._size == 0:
+            raise IndexError('pop from empty stack')
+        if index is not None:
+            position = self._position(index)
+            popped_item = self._array[position]
+            del self[position]
+            return popped_item
+        self._size -= 1
+        popped_item = self._array[self._size]
+        self._shrink()
+        return popped_item
+
+    def pop_many(self, n):
+        """Remove up to n items from the top of the stack and return them as
+        a NumPy array, last pushed first.
+        """
+        n = max(0, min(n, self._size))
+        popped_items = self._array[self._size - n:self._size][::-1].copy()
+        self._size -= n
+        self._shrink()
+        return popped_items
+
+    def remove(self, item):
+        """Remove the given item from the stack.
+        """
+        hits = numpy.flatnonzero(self._array[:self._size] == item)
+        if not len(hits):
+            raise ValueError(f'{item!r} is not in stack')
+        del self[int(hits[0])]
+
+    def contains(self, item):
+        """Return True if the given item is within the stack. False otherwise.
+        """
+        return bool((self._array[:self._size] == item).any())
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the stack.
+        """
+        return int(numpy.count_nonzero(self._array[:self._size] == item))
+
+    def sum(self):
+        """Return the sum of the items.
+        """
+        return self._array[:self._size].sum()
+
+    def min(self):
+        """Return the smallest item, raising ValueError if the stack is empty.
+        """
+        if self._size == 0:
+            raise ValueError('min() of empty stack')
+        return self._array[:self._size].min()
+
+    def max(self):
+        """Return the largest item, raising ValueError if the stack is empty.
+        """
+        if self._size == 0:
+            raise ValueError('max() of empty stack')
+        return self._array[:self._size].max()
+
+
+class AggregateStack(Stack):
+    """Stack which can give the min and max of its items, and a reduction
+    of them by a given associative function, each in O(1).
+
+    Alongside the items it keeps the min, max and reduction of the items up
+    to each position, so appending or popping at the top updates them in
+    O(1). Changes below the top (pop(index), remove(), item assignment and
+    deletion) redo them from the lowest position changed. As with the member
+    index, changes made to self.items directly are not seen.
+
+    Items must be comparable with each other.
+
+        stack = AggregateStack(3, 1, 2, reduce=operator.add)
+        stack.min()             # returns 1
+        stack.reduce()          # returns 6
+    """
+    def __init__(self, *items, reduce=None):
+        self.reduce_function = reduce
+        super().__init__(*items)
+        self._mins, self._maxes, self._reductions = [], [], []
+        self._refold(0)
+
+    def _kwargs(self):
+        return {'reduce': self.reduce_function}
+
+    def _fold(self, item):
+        """Push the aggregates of the items up to a newly pushed item.
+        """
+        mins, maxes = self._mins, self._maxes
+        if not mins:
+            mins.append(item)
+            maxes.append(item)
+            if self.reduce_function is not None:
+                self._reductions.append(item)
+            return
+        mins.append(item if item < mins[-1] else mins[-1])
+        maxes.append(item if item > maxes[-1] else maxes[-1])
+        if self.reduce_function is not None:
+            self._reductions.append(self.reduce_function(self._reductions[-1], item))
+
+    def _refold(self, start):
+        """Redo the aggregates from the given position up.
+        """
+        del self._mins[start:], self._maxes[start:], self._reductions[start:]
+        for item in self.items[start:]:
+            self._fold(item)
+
+    def _lowest_changed(self, index, list_length):
+        """Return the lowest position an index or slice given to item
+        assignment or deletion touches.
+        """
+        if isinstance(index, slice):
+            window = range(*index.indices(list_length))
+            return min(window) if window else min(window.start, list_length)
+        return index + list_length if index < 0 else index
+
+    def __setitem__(self, index, new_item):
+        list_length = len(self.items)
+        super().__setitem__(index, new_item)
+        self._refold(self._lowest_changed(index, list_length))
+
+    def __delitem__(self, index):
+        list_length = len(self.items)
+        super().__delitem__(index)
+        self._refold(self._lowest_changed(index, list_length))
+
+    def append(self, item):
+        """Append an item to the end of the stack.
+        """
+        super().append(item)
+        self._fold(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the stack.
+        """
+        list_length = len(self.items)
+        super().extend(items)
+        for item in self.items[list_length:]:
+            self._fold(item)
+
+    def pop(self, index=None):
+        """Remove an item at given index from the stack and return it.
+
+        Remove the last item if index is omitted.
+        """
+        list_length = len(self.items)
+        popped_item = super().pop(index)
+        self._refold(list_length - 1 if index is None
+                     else self._lowest_changed(index, list_length))
+        return popped_item
+
+    def pop_many(self, n):
+        """Remove up to n items from the top of the stack and return them as
+        a python list, last pushed first.
+        """
+        popped_items = super().pop_many(n)
+        self._refold(len(self.items))
+        return popped_items
+
+    def remove(self, item):
+        """Remove the given item from the stack.
+        """
+        try:
+            index = self.items.index(item)
+        except ValueError:
+            raise ValueError(f'{item!r} is not in stack') from None
+        self.pop(index)
+
+    def min(self):
+        """Return the smallest item, raising ValueError if the stack is empty.
+        """
+        if not self._mins:
+            raise ValueError('min() of empty stack')
+        return self._mins[-1]
+
+    def max(self):
+        """Return the largest item, raising ValueError if the stack is empty.
+        """
+        if not self._maxes:
+            raise ValueError('max() of empty stack')
+        return self._maxes[-1]
+
+    def reduce(self):
+        """Return the items reduced by the reduce function, first pushed to
+        last, as functools.reduce() would. Raises ValueError if the stack is
+        empty.
+        """
+        if self.reduce_function is None:
+            raise TypeError('stack was made without a reduce function')
+        if not self._reductions:
+            raise ValueError('reduce() of empty stack')
+        return self._reductions[-1]
+
+
+def _restore(cls, state, item_chunks):
+    """Rebuild a Stack, or subclass, from its state and its items.
+    """
+    stack = cls(**state['kwargs'])
+    for chunk in item_chunks:
+        stack.extend(chunk)
+    if state['member_index']:
+        stack.enable_member_index()
+    return stack
+
 
 if __name__ == "__main__":
     stack = Stack(1, 2, 3)
@@ -0,0 +1,183 @@
+# test_concurrentdeque.py by nonetypes
+# Last revised on 10/18/2026
+
+"""Stress ConcurrentDeque from many threads and check the results.
+
+Bulk: producers append_right() tagged items while consumers pop_left()
+them. Every item must come out exactly once, each consumer must see each
+producer's items in the order they were appended, and the deque must end
+empty with its links intact.
+
+Histories: rounds of a few threads each making a few random calls at both
+ends, with the time each call started and returned. Each history is
+searched (Wing and Gong) for an order of the calls which respects their
+timing and which a plain deque would answer the same way.
+
+Run it on a free-threaded build (python3.13t) to give the locks real
+contention; with the GIL, switches are only forced every so often, so the
+interval is lowered while it runs.
+"""
+import collections
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from doublylinkedlist import ConcurrentDeque
+
+OPERATIONS = ('append_left', 'append_right', 'pop_left', 'pop_right')
+ITEMS = 20_000
+ROUNDS = 300
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def check_links(deque):
+    """Check that the links agree both ways and with len().
+    """
+    count = 0
+    link = deque._sentinel
+    while link.next_node is not None:
+        assert link.next_node.prev_node is link, 'prev_node does not match next_node'
+        link = link.next_node
+        count += 1
+    assert link is deque._tail, 'tail is not the last node'
+    assert count == len(deque)
+
+
+@pytest.mark.parametrize('producers, consumers', [(1, 1), (4, 4), (8, 2), (2, 8)])
+def test_bulk(producers, consumers):
+    items_per_producer = ITEMS // producers
+    deque = ConcurrentDeque()
+    total = producers * items_per_producer
+    taken = [[] for _ in range(consumers)]
+    remaining = [total]
+    remaining_lock = threading.Lock()
+    start = threading.Barrier(producers + consumers)
+
+    def produce(producer):
+        start.wait()
+        for sequence in range(items_per_producer):
+            deque.append_right((producer, sequence))
+
+    def consume(seen):
+        start.wait()
+        while True:
+            with remaining_lock:
+                if remaining[0] == 0:
+                    return
+            try:
+                item = deque.pop_left()
+            except IndexError:
+                time.sleep(0)
+                continue
+            seen.append(item)
+            with remaining_lock:
+                remaining[0] -= 1
+
+    threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    threads += [threading.Thread(target=consume, args=(seen,)) for seen in taken]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counts = collections.Counter(item for seen in taken for item in seen)
+    assert len(counts) == total, 'items lost'
+    assert all(count == 1 for count in counts.values()), 'items popped twice'
+    for seen in taken:
+        last = {}
+        for producer, sequence in seen:
+            assert sequence > last.get(producer, -1), \
+                f"producer {producer}'s items popped out of order"
+            last[producer] = sequence
+    check_links(deque)
+    assert len(deque) == 0
+
+
+def record(threads, calls):
+    """Run calls random operations on each of threads threads, returning
+    the history [(start, end, operation, argument, result)].
+    """
+    deque = ConcurrentDeque()
+    history = []
+    start = threading.Barrier(threads)
+
+    def run(thread):
+        start.wait()
+        for call in range(calls):
+            operation = random.choice(OPERATIONS)
+            argument = (thread, call) if operation.startswith('append') else None
+            began = time.perf_counter_ns()
+            try:
+                result = getattr(deque, operation)(*([argument] if argument else []))
+            except IndexError:
+                result = IndexError
+            ended = time.perf_counter_ns()
+            history.append((began, ended, operation, argument, result))
+
+    workers = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    check_links(deque)
+    return history, deque.py_list()
+
+
+def apply(state, operation, argument):
+    """Apply an operation to a tuple standing for a deque; return the new
+    state and the result a sequential deque would give.
+    """
+    if operation == 'append_left':
+        return (argument,) + state, None
+    if operation == 'append_right':
+        return state + (argument,), None
+    if not state:
+        return state, IndexError
+    if operation == 'pop_left':
+        return state[1:], state[0]
+    return state[:-1], state[-1]
+
+
+def linearizable(history, final):
+    """Return True if the history has a valid sequential order ending with
+    the deque holding final.
+    """
+    calls = sorted(history)
+    seen = set()
+
+    def search(done, state):
+        if len(done) == len(calls):
+            return list(state) == final
+        if (done, state) in seen:
+            return False
+        seen.add((done, state))
+        pending = [i for i in range(len(calls)) if i not in done]
+        # Only a call which started before every pending call returned can
+        # come next.
+        first_end = min(calls[i][1] for i in pending)
+        for i in pending:
+            began, _, operation, argument, result = calls[i]
+            if began > first_end:
+                break
+            new_state, expected = apply(state, operation, argument)
+            if expected == result and search(done | {i}, new_state):
+                return True
+        return False
+    return search(frozenset(), ())
+
+
+def test_histories_are_linearizable():
+    for round_ in range(ROUNDS):
+        history, final = record(random.choice((2, 3, 4)), random.choice((3, 4, 5)))
+        assert linearizable(history, final), \
+            f'history {round_} is not linearizable: {sorted(history)}'
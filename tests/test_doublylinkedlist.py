@@ -0,0 +1,48 @@
+# test_doublylinkedlist.py by nonetypes
+# Last revised on 10/18/2026
+
+import pytest
+
+from doublylinkedlist import CompactDoublyLinkedList, DoublyLinkedList
+
+
+@pytest.mark.parametrize('cls', [DoublyLinkedList, CompactDoublyLinkedList])
+def test_membership_compares_items(cls):
+    linked = cls(1, 2, 3, 2)
+    assert 3 in linked
+    assert 4 not in linked
+    assert linked.contains(2)
+    assert linked.count(2) == 2
+    assert linked.count(4) == 0
+
+
+@pytest.mark.parametrize('cls', [DoublyLinkedList, CompactDoublyLinkedList])
+def test_remove_takes_first_in_order(cls):
+    linked = cls('a', 'b', 'c')
+    linked.append_left('b')
+    linked.remove('b')
+    assert linked.py_list() == ['a', 'b', 'c']
+    with pytest.raises(ValueError):
+        linked.remove('z')
+
+
+def test_remove_with_member_index_matches_list():
+    linked = DoublyLinkedList('a', 'b', 'c')
+    linked.enable_member_index()
+    linked.append_left('b')
+    linked.remove('b')
+    assert linked.py_list() == ['a', 'b', 'c']
+    assert linked.discard_any('b')
+    assert not linked.discard_any('b')
+    assert linked.py_list() == ['a', 'c']
+
+
+@pytest.mark.parametrize('cls', [DoublyLinkedList, CompactDoublyLinkedList])
+def test_batched_pops(cls):
+    linked = cls()
+    linked.push_many(range(6))
+    assert linked.pop_left_many(2) == [0, 1]
+    assert linked.pop_right_many(2) == [5, 4]
+    assert linked.pop_many(10) == [3, 2]
+    assert linked.drain() == []
+    assert len(linked) == 0
@@ -0,0 +1,32 @@
+# test_linkedlist.py by nonetypes
+# Last revised on 10/18/2026
+
+import pytest
+
+from linkedlist import LinkedList, SortedLinkedList
+
+
+def test_pop_left_many_relinks_head_and_tail():
+    linked = LinkedList(*range(5))
+    assert linked.pop_left_many(2) == [0, 1]
+    assert linked.head.item == 2
+    assert linked.pop_left_many(10) == [2, 3, 4]
+    assert linked.head is None and linked.tail is None
+    linked.append(7)
+    assert linked.py_list() == [7]
+
+
+def test_pop_left_many_with_indexes():
+    linked = LinkedList(*range(40))
+    linked.enable_index()
+    linked.enable_member_index()
+    assert linked.pop_left_many(30) == list(range(30))
+    assert linked[5].item == 35
+    assert 10 not in linked and 39 in linked
+
+
+def test_sorted_linked_list_refuses_positional_changes():
+    linked = SortedLinkedList(3, 1, 2)
+    with pytest.raises(TypeError):
+        linked.insert(0, 5)
+    assert linked.py_list() == [1, 2, 3]
@@ -0,0 +1,63 @@
+# test_persistentqueue.py by nonetypes
+# Last revised on 10/18/2026
+
+import os
+
+import pytest
+
+from persistentqueue import PersistentQueue
+
+SEGMENT_SIZE = 4096
+COUNT = 200
+
+
+def filled(directory):
+    """Return the items put in a queue in directory spanning a few segments.
+    """
+    items = [f'item {i}' for i in range(COUNT)]
+    with PersistentQueue(directory, segment_size=SEGMENT_SIZE) as queue:
+        queue.extend(items)
+    assert len(os.listdir(directory)) > 1
+    return items
+
+
+def next_segment_path(directory, suffix='.seg'):
+    number = int(max(os.listdir(directory))[:-4]) + 1
+    return os.path.join(directory, f'{number:020d}{suffix}')
+
+
+def check_reopens(directory, items):
+    with PersistentQueue(directory, segment_size=SEGMENT_SIZE) as queue:
+        assert list(queue) == items
+        queue.append('after')
+        assert [queue.pop() for _ in range(len(queue))] == items + ['after']
+
+
+def test_reopens_after_appends_and_pops(tmp_path):
+    items = filled(tmp_path)
+    with PersistentQueue(tmp_path, segment_size=SEGMENT_SIZE) as queue:
+        assert [queue.pop() for _ in range(50)] == items[:50]
+    check_reopens(tmp_path, items[50:])
+
+
+@pytest.mark.parametrize('size', [0, SEGMENT_SIZE])
+def test_reopens_with_blank_newest_segment(tmp_path, size):
+    # A crash during rollover, before the new tail's header reached the
+    # disk, leaves it empty or all zeros.
+    items = filled(tmp_path)
+    with open(next_segment_path(tmp_path), 'wb') as file:
+        file.truncate(size)
+    check_reopens(tmp_path, items)
+
+
+def test_reopens_with_half_made_temporary_segment(tmp_path):
+    items = filled(tmp_path)
+    with open(next_segment_path(tmp_path, '.seg.tmp'), 'wb') as file:
+        file.write(b'PQS1')
+    check_reopens(tmp_path, items)
+    assert not any(name.endswith('.tmp') for name in os.listdir(tmp_path))
+
+
+def test_reopens_with_empty_only_segment(tmp_path):
+    open(os.path.join(tmp_path, f'{1:020d}.seg'), 'wb').close()
+    check_reopens(tmp_path, [])
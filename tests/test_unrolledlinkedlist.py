@@ -0,0 +1,26 @@
+# test_unrolledlinkedlist.py by nonetypes
+# Last revised on 10/18/2026
+
+import pytest
+
+from unrolledlinkedlist import UnrolledDeque, UnrolledLinkedList
+
+SLICES = [slice(None), slice(3, 17), slice(None, None, -1), slice(-5, 2, -3),
+          slice(2, 40, 4), slice(30, 5), slice(-100, 100)]
+
+
+@pytest.mark.parametrize('cls', [UnrolledLinkedList, UnrolledDeque])
+@pytest.mark.parametrize('window', SLICES)
+def test_slice_matches_list(cls, window):
+    items = list(range(37))
+    unrolled = cls(*items, capacity=4)
+    sliced = unrolled[window]
+    assert type(sliced) is cls
+    assert sliced.capacity == 4
+    assert sliced.py_list() == items[window]
+
+
+def test_slice_does_not_copy_the_whole_list(monkeypatch):
+    unrolled = UnrolledLinkedList(*range(1000), capacity=8)
+    monkeypatch.setattr(UnrolledLinkedList, 'py_list', None)
+    assert list(unrolled[:3].values()) == [0, 1, 2]
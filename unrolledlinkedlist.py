@@ -0,0 +1,527 @@
+# unrolledlinkedlist.py by nonetypes
+# Last revised on 10/18/2026
+
+import io
+
+import serialize
+from sliceview import SliceView
+
+
+class Chunk:
+    """Node of an UnrolledLinkedList: a python list of up to the list's
+    capacity items, and the next chunk in the chain.
+    """
+    __slots__ = ('items', 'next_node')
+
+    def __init__(self, items=None):
+        self.items = [] if items is None else items
+        self.next_node = None
+
+    def __repr__(self):
+        return str(self.items)
+
+
+class DequeChunk(Chunk):
+    """Node of an UnrolledDeque, which also links to the previous chunk.
+    """
+    __slots__ = ('prev_node',)
+
+    def __init__(self, items=None):
+        super().__init__(items)
+        self.prev_node = None
+
+
+class UnrolledLinkedList:
+    """LinkedList whose nodes each hold a run of up to capacity items.
+
+    head(items, next_node) -> next_node(items, next_node) -> tail(items, None)
+
+    Walking the list, contains() and count() take one hop per chunk rather
+    than per item, and scan each chunk's items in C. Index lookups skip
+    whole chunks by their length.
+
+    Every chunk but the first and last is kept at least half full: insert()
+    splits a full chunk in two, and pop(index) and remove() merge a chunk
+    which falls below half with the one after it, or even the two out.
+    Appending to a full end chunk starts a new one, so a list built by
+    appending has full chunks throughout.
+
+    Chunks are singly linked, so pop_right() walks the chain to find the
+    chunk before the tail when the tail empties; UnrolledDeque links both
+    ways. Iteration yields items.
+    """
+    _chunk_class = Chunk
+
+    def __init__(self, *items, capacity=64):
+        if capacity < 2:
+            raise ValueError('capacity must be at least 2')
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self._size = 0
+        # Bumped by every change to the list's structure.
+        self._version = 0
+        self.extend(items)
+
+    # Most items shown by repr(); longer lists end with '...'.
+    repr_limit = 100
+
+    def __repr__(self):
+        """Return a printable string of at most repr_limit of the list's
+        items, without copying the list.
+        """
+        parts = []
+        for item in self.values():
+            if len(parts) == self.repr_limit:
+                parts.append('...')
+                break
+            parts.append(repr(item))
+        return '[' + ', '.join(parts) + ']'
+
+    def __len__(self):
+        """Return the number of items in the list.
+        """
+        return self._size
+
+    def _chunks_forward(self):
+        chunk = self.head
+        while chunk is not None:
+            yield chunk
+            chunk = chunk.next_node
+
+    def _chunks_backward(self):
+        """Iterate over the chunks from tail to head, collecting them first
+        as they only link forward.
+        """
+        return reversed(list(self._chunks_forward()))
+
+    def _previous(self, chunk):
+        """Return the chunk before the given one, or None for the head.
+        """
+        before = None
+        link = self.head
+        while link is not chunk:
+            before, link = link, link.next_node
+        return before
+
+    def _link_chunk(self, before, chunk):
+        """Link a new chunk in after before, or at the head if before is None.
+        """
+        if before is None:
+            chunk.next_node = self.head
+            self.head = chunk
+        else:
+            chunk.next_node = before.next_node
+            before.next_node = chunk
+        if chunk.next_node is None:
+            self.tail = chunk
+
+    def _unlink_chunk(self, before, chunk):
+        """Unlink a chunk, whose previous chunk is before (None for the head).
+        """
+        if before is None:
+            self.head = chunk.next_node
+        else:
+            before.next_node = chunk.next_node
+        if chunk.next_node is None:
+            self.tail = before
+
+    def _locate(self, index):
+        """Return (chunk before, chunk, offset) of the item at the given
+        (non-negative, in range) index.
+        """
+        before = None
+        chunk = self.head
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            before, chunk = chunk, chunk.next_node
+        return before, chunk, index
+
+    def _index(self, index):
+        """Return the given index made non-negative, raising IndexError if
+        it is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers or slices')
+        # Negative index support.
+        if index < 0:
+            index = self._size + index
+        if index >= self._size or index < 0:
+            raise IndexError('list index out of range')
+        return index
+
+    def __getitem__(self, index):
+        """
+        Return an item from an index:
+
+            unrolled = UnrolledLinkedList('a', 'b', 'c')
+            unrolled[1]                # returns 'b'
+            unrolled[::-1]             # returns ['c', 'b', 'a']
+
+        A slice gives a new list of the same class and capacity.
+        """
+        if isinstance(index, slice):
+            # Only the chunks the slice covers are visited.
+            new_linked = type(self)(capacity=self.capacity)
+            new_linked.extend(self._iter_range(range(*index.indices(self._size))))
+            return new_linked
+        _, chunk, offset = self._locate(self._index(index))
+        return chunk.items[offset]
+
+    def __setitem__(self, index, new_item):
+        """Item assignment, by index or slice.
+        """
+        if isinstance(index, slice):
+            items = self.py_list()
+            items[index] = new_item
+            self._load(items)
+            return
+        _, chunk, offset = self._locate(self._index(index))
+        chunk.items[offset] = new_item
+
+    def __delitem__(self, index):
+        """Item deletion, by index or slice.
+        """
+        if isinstance(index, slice):
+            items = self.py_list()
+            del items[index]
+            self._load(items)
+            return
+        self.pop(self._index(index))
+
+    def view(self, *args):
+        """Return a SliceView of the list without copying it.
+
+        Takes the same arguments as itertools.islice, view(stop) or
+        view(start, stop[, step]), but indices and the step may be negative.
+        """
+        return SliceView(self, slice(*args))
+
+    def _iter_range(self, window):
+        """Iterate over the items at the indices in the given range, which
+        must be in bounds, in one walk.
+        """
+        if not window:
+            return
+        if window.step < 0:
+            yield from reversed(list(self._iter_range(window[::-1])))
+            return
+        _, chunk, offset = self._locate(window.start)
+        remaining = len(window)
+        while True:
+            items = chunk.items[offset::window.step]
+            yield from items[:remaining]
+            remaining -= len(items)
+            if remaining <= 0:
+                return
+            # Step on from the last item taken into the following chunks.
+            offset += len(items) * window.step - len(chunk.items)
+            chunk = chunk.next_node
+            while offset >= len(chunk.items):
+                offset -= len(chunk.items)
+                chunk = chunk.next_node
+
+    def _load(self, items):
+        """Replace the contents with the given python list of items.
+        """
+        self.head = self.tail = None
+        self._size = 0
+        self.extend(items)
+
+    def __iter__(self):
+        return self.values()
+
+    def __reversed__(self):
+        return self.values(reverse=True)
+
+    def values(self, reverse=False):
+        """Iterate over the items from head to tail, or from tail to head if
+        reverse is True, without copying the list.
+
+        Raises RuntimeError if the list is changed through its methods
+        during iteration.
+        """
+        version = self._version
+        chunks = self._chunks_backward() if reverse else self._chunks_forward()
+        for chunk in chunks:
+            for item in (reversed(chunk.items) if reverse else chunk.items):
+                yield item
+                if self._version != version:
+                    raise RuntimeError('list changed during iteration')
+
+    def append_left(self, item):
+        """Append an item to the beginning of the list.
+        """
+        head = self.head
+        if head is None or len(head.items) >= self.capacity:
+            self._link_chunk(None, self._chunk_class([item]))
+        else:
+            head.items.insert(0, item)
+        self._size += 1
+        self._version += 1
+
+    def append_right(self, item):
+        """Append an item to the end of the list.
+        """
+        tail = self.tail
+        if tail is None or len(tail.items) >= self.capacity:
+            self._link_chunk(tail, self._chunk_class([item]))
+        else:
+            tail.items.append(item)
+        self._size += 1
+        self._version += 1
+
+    def append(self, item):
+        """Append an item to the end of the list.
+        """
+        self.append_right(item)
+
+    def extend(self, items):
+        """Append every item from an iterable to the end of the list.
+
+        The tail chunk is topped up and the rest cut into full chunks.
+        """
+        items = list(items)
+        if not items:
+            return
+        start = 0
+        if self.tail is not None:
+            start = self.capacity - len(self.tail.items)
+            self.tail.items.extend(items[:start])
+        for start in range(start, len(items), self.capacity):
+            self._link_chunk(self.tail,
+                             self._chunk_class(items[start:start + self.capacity]))
+        self._size += len(items)
+        self._version += 1
+
+    def insert(self, index, item):
+        """Insert the given item at the given index.
+        """
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers')
+        # Negative index support.
+        if index < 0:
+            index = self._size + index
+        if index > self._size or index < 0:
+            raise IndexError('list index out of range')
+        if index == self._size:
+            self.append_right(item)
+            return
+        _, chunk, offset = self._locate(index)
+        if len(chunk.items) >= self.capacity:
+            # Split the full chunk in two, each half full.
+            half = len(chunk.items) // 2
+            right = self._chunk_class(chunk.items[half:])
+            del chunk.items[half:]
+            self._link_chunk(chunk, right)
+            if offset > half:
+                chunk, offset = right, offset - half
+        chunk.items.insert(offset, item)
+        self._size += 1
+        self._version += 1
+
+    def pop_left(self):
+        """Remove the left most item in the list and return it.
+        """
+        if self.head is None:
+            raise IndexError('pop from empty list')
+        head = self.head
+        item = head.items.pop(0)
+        if not head.items:
+            self._unlink_chunk(None, head)
+        self._size -= 1
+        self._version += 1
+        return item
+
+    def pop_right(self):
+        """Remove the right most item in the list and return it.
+        """
+        if self.head is None:
+            raise IndexError('pop from empty list')
+        tail = self.tail
+        item = tail.items.pop()
+        if not tail.items:
+            self._unlink_chunk(self._previous(tail), tail)
+        self._size -= 1
+        self._version += 1
+        return item
+
+    def pop(self, index=None):
+        """Remove an item at the given index from the list and return it.
+
+        Remove the last item if index is omitted.
+        """
+        if index is None:
+            return self.pop_right()
+        if not isinstance(index, int):
+            raise TypeError('list indices must be integers')
+        elif self.head is None:
+            raise IndexError('pop from empty list')
+        before, chunk, offset = self._locate(self._index(index))
+        item = chunk.items.pop(offset)
+        self._removed(before, chunk)
+        return item
+
+    def _removed(self, before, chunk):
+        """Account for an item taken out of the middle of a chunk, keeping
+        the chunk at least half full.
+        """
+        self._size -= 1
+        self._version += 1
+        if not chunk.items:
+            self._unlink_chunk(before, chunk)
+            return
+        next_chunk = chunk.next_node
+        if next_chunk is None or len(chunk.items) >= self.capacity // 2:
+            return
+        if len(chunk.items) + len(next_chunk.items) <= self.capacity:
+            chunk.items.extend(next_chunk.items)
+            self._unlink_chunk(chunk, next_chunk)
+        else:
+            moved = (len(next_chunk.items) - len(chunk.items)) // 2
+            chunk.items.extend(next_chunk.items[:moved])
+            del next_chunk.items[:moved]
+
+    def remove(self, item):
+        """Remove the first occurrence of the given item from the list.
+        """
+        before = None
+        for chunk in self._chunks_forward():
+            if item in chunk.items:
+                chunk.items.remove(item)
+                self._removed(before, chunk)
+                return
+            before = chunk
+        raise ValueError(f'{item!r} is not in list')
+
+    def contains(self, item):
+        """Return True if the given item is within the list and False otherwise.
+        """
+        for chunk in self._chunks_forward():
+            if item in chunk.items:
+                return True
+        return False
+
+    def __contains__(self, item):
+        return self.contains(item)
+
+    def count(self, item):
+        """Return the number of times the given item occurs in the list.
+        """
+        return sum(chunk.items.count(item) for chunk in self._chunks_forward())
+
+    def py_list(self):
+        """Return a python list of all items from head to tail.
+        """
+        py_list = []
+        for chunk in self._chunks_forward():
+            py_list.extend(chunk.items)
+        return py_list
+
+    def __reduce__(self):
+        """Pickle as a flat sequence of items rather than a chain of chunks.
+        """
+        return _restore, (type(self), self._state(), list(self._chunks()))
+
+    def _state(self):
+        return {'capacity': self.capacity}
+
+    def _chunks(self):
+        return serialize.chunks(self.values())
+
+    def dump(self, fp):
+        """Write the list to a binary file object, in chunks of items; see
+        serialize.
+        """
+        serialize.dump(fp, (type(self), self._state()), self._chunks())
+
+    @classmethod
+    def load(cls, fp):
+        """Read a list written by dump() from a binary file object.
+        """
+        (saved_class, state), item_chunks = serialize.load(fp)
+        if not issubclass(saved_class, cls):
+            raise TypeError(f'expected a {cls.__name__}, not a {saved_class.__name__}')
+        return _restore(saved_class, state, item_chunks)
+
+    def to_bytes(self):
+        """Return the list as bytes in the format written by dump().
+        """
+        buffer = io.BytesIO()
+        self.dump(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the list held in bytes from to_bytes().
+        """
+        return cls.load(io.BytesIO(data))
+
+    def print_nodes(self):
+        """Print each chunk's items.
+        """
+        for chunk in self._chunks_forward():
+            print(chunk)
+
+
+class UnrolledDeque(UnrolledLinkedList):
+    """UnrolledLinkedList whose chunks link both ways.
+
+    head(items, None, next_node) -> next_node(items, head, tail) -> tail(items, prev_node, None)
+
+    Appends and pops at either end are O(1), reverse iteration needs no
+    copy, and index lookups walk from whichever end is closer.
+    """
+    _chunk_class = DequeChunk
+
+    def _chunks_backward(self):
+        chunk = self.tail
+        while chunk is not None:
+            yield chunk
+            chunk = chunk.prev_node
+
+    def _previous(self, chunk):
+        return chunk.prev_node
+
+    def _link_chunk(self, before, chunk):
+        super()._link_chunk(before, chunk)
+        chunk.prev_node = before
+        if chunk.next_node is not None:
+            chunk.next_node.prev_node = chunk
+
+    def _unlink_chunk(self, before, chunk):
+        super()._unlink_chunk(before, chunk)
+        if chunk.next_node is not None:
+            chunk.next_node.prev_node = before
+
+    def _locate(self, index):
+        if index < self._size // 2:
+            return super()._locate(index)
+        # Walk back from the tail, counting positions from the end.
+        chunk = self.tail
+        index = self._size - 1 - index
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            chunk = chunk.prev_node
+        return chunk.prev_node, chunk, len(chunk.items) - 1 - index
+
+
+def _restore(cls, state, item_chunks):
+    """Rebuild an UnrolledLinkedList or UnrolledDeque from its state and its
+    items.
+    """
+    unrolled = cls(capacity=state['capacity'])
+    for chunk in item_chunks:
+        unrolled.extend(chunk)
+    return unrolled
+
+
+if __name__ == "__main__":
+    unrolled = UnrolledDeque(capacity=4)
+    unrolled.extend(range(10))
+    unrolled.append_left(-1)
+    unrolled.insert(5, 'x')
+    print(unrolled)
+    print(unrolled.pop(2), unrolled.pop_right(), unrolled.pop_left())
+    print(unrolled.contains('x'), unrolled[4])
+    unrolled.print_nodes()